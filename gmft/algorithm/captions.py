@@ -6,7 +6,7 @@ from typing import TYPE_CHECKING, Tuple
 
 import numpy as np
 
-from gmft.base import Rect
+from gmft.base import BoxArray, Rect
 
 if TYPE_CHECKING:
     from gmft.detectors.base import CroppedTable
@@ -112,18 +112,18 @@ def _find_captions(
         (left_edge, midpoint, right_edge, ct.rect.ymax + margin[3])
     )
 
-    words = list(ct.page.get_positions_and_text())
+    words = list(ct.page.get_word_array().iter_positions_and_text())
+    word_index = ct.page.get_word_index()
     # this time, aim for simplicity.
     # look for the text that is closest to the table bbox
 
     table_minimum_idx = len(words)
     table_maximum_idx = 0
-    for i, w in enumerate(words):
-        w_bbox = Rect(w[:4])
-        if w_bbox.is_intersecting(ct.bbox):
-            # this is considered to be in the table
-            table_minimum_idx = min(table_minimum_idx, i)
-            table_maximum_idx = max(table_maximum_idx, i)
+    # these are considered to be in the table
+    in_table = word_index.query(ct.bbox)
+    if len(in_table):
+        table_minimum_idx = int(in_table[0])
+        table_maximum_idx = int(in_table[-1])
 
     # candidates:
     # first, prefer our neighbors in reading order
@@ -133,10 +133,12 @@ def _find_captions(
     below_heights = []
     _candidate_y = None
 
+    word_boxes = BoxArray(ct.page.get_word_array().bboxes)
+
     # place the immediate predecessor
     cand = table_minimum_idx - 1
     if 0 <= cand < len(words):
-        wbox = Rect(words[cand][:4])
+        wbox = word_boxes[cand]
         y = (wbox.ymin + wbox.ymax) / 2
         if wbox.is_intersecting(search_rect_above):
             candidate_above = cand
@@ -150,7 +152,7 @@ def _find_captions(
     # place the immediate successor
     cand = table_maximum_idx + 1
     if 0 <= cand < len(words):
-        wbox = Rect(words[cand][:4])
+        wbox = word_boxes[cand]
         y = (wbox.ymin + wbox.ymax) / 2
         if wbox.is_intersecting(search_rect_above):
             if candidate_above is None or abs(_candidate_y - ct.rect.ymin) > abs(
@@ -180,19 +182,17 @@ def _find_captions(
             )
         )
         best_proximal = None
-        best_proximal_y = None
-        for i, w in enumerate(words):
-            wbox = Rect(w[:4])
-            y = (wbox.ymin + wbox.ymax) / 2
-            if wbox.is_intersecting(
-                search_rect_above_strict
-            ) and not wbox.is_intersecting(ct.bbox):
-                above_heights.append(wbox.ymax - wbox.ymin)
-                if best_proximal is None or abs(best_proximal_y - ct.rect.ymin) > abs(
-                    y - ct.rect.ymin
-                ):
-                    best_proximal = i
-                    best_proximal_y = y
+        nearby = np.setdiff1d(
+            word_index.query(search_rect_above_strict.bbox),
+            in_table,
+            assume_unique=True,
+        )
+        if len(nearby):
+            # the closest to the table; on ties, the first in reading order
+            nearby_boxes = word_boxes[nearby]
+            y = (nearby_boxes.ymin + nearby_boxes.ymax) / 2
+            above_heights.extend(nearby_boxes.height.tolist())
+            best_proximal = int(nearby[np.argmin(np.abs(y - ct.rect.ymin))])
 
         # now, advance best_proximal until we find a gap
         # we need to do this because of the x: it might be right of the table
@@ -212,19 +212,18 @@ def _find_captions(
             )
         )
         best_proximal = None
-        best_proximal_y = None
-        for i, w in enumerate(words):
-            wbox = Rect(w[:4])
-            y = (wbox.ymin + wbox.ymax) / 2
-            if wbox.is_intersecting(
-                search_rect_below_strict
-            ) and not wbox.is_intersecting(ct.bbox):
-                below_heights.append(wbox.ymax - wbox.ymin)
-                if best_proximal is None or abs(best_proximal_y - ct.rect.ymax) > abs(
-                    y - ct.rect.ymax
-                ):
-                    best_proximal = i
-                    best_proximal_y = y
+        nearby = np.setdiff1d(
+            word_index.query(search_rect_below_strict.bbox),
+            in_table,
+            assume_unique=True,
+        )
+        if len(nearby):
+            # the closest to the table; on ties, the first in reading order
+            nearby_boxes = word_boxes[nearby]
+            y = (nearby_boxes.ymin + nearby_boxes.ymax) / 2
+            below_heights.extend(nearby_boxes.height.tolist())
+            best_proximal = int(nearby[np.argmin(np.abs(y - ct.rect.ymax))])
+
         # now, retreat first_proximal until we find a gap
         # we need to do this because of the x: it might be left of the table
         if best_proximal is not None:
@@ -1,5 +1,8 @@
 from collections import defaultdict
 from bisect import bisect_right
+from typing import Sequence
+
+import numpy as np
 
 
 class IntervalHistogram:
@@ -25,22 +28,60 @@ class IntervalHistogram:
         if max_x is not None:
             self.sorted_points.append((max_x, 0))
 
+    @classmethod
+    def from_intervals(
+        cls,
+        starts: Sequence[float],
+        ends: Sequence[float],
+        min_x=None,
+        max_x=None,
+    ) -> "IntervalHistogram":
+        """
+        Build the histogram of the intervals [starts[i], ends[i]) at once.
+
+        Gives the same key points as appending each interval to ``IntervalHistogram(min_x, max_x)``,
+        in O(n log n): the key points are the sorted, distinct endpoints, and their frequencies
+        are the cumulative sum of +1 at each start and -1 at each end.
+        """
+        starts = np.asarray(starts)
+        ends = np.asarray(ends)
+        if starts.shape != ends.shape:
+            raise ValueError("starts and ends must have the same length")
+        if np.any(ends < starts):
+            raise ValueError("invalid interval")
+        # [p, p) is empty
+        nonempty = starts < ends
+        starts, ends = starts[nonempty], ends[nonempty]
+
+        boundaries = [x for x in (min_x, max_x) if x is not None]
+        dtype = np.result_type(starts, ends, *boundaries)
+        points = np.unique(
+            np.concatenate([starts, ends, np.asarray(boundaries, dtype=dtype)])
+        )
+        n = len(points)
+        delta = np.bincount(np.searchsorted(points, starts), minlength=n) - np.bincount(
+            np.searchsorted(points, ends), minlength=n
+        )
+        frequencies = np.cumsum(delta)
+
+        histogram = cls()
+        histogram.sorted_points = list(zip(points.tolist(), frequencies.tolist()))
+        histogram.height = int(frequencies.max(initial=0))
+        return histogram
+
     def get_index_before_or_equal(self, point):
         """
         Return the index of the last change point that is <= the query point.
         If no such point exists, return -1.
         """
-        points = [x[0] for x in self.sorted_points]
-        idx = bisect_right(points, point) - 1
-        return idx
+        return bisect_right(self.sorted_points, point, key=lambda x: x[0]) - 1
 
     def get_index_after(self, point):
         """
         Return the index of the first change point that is strictly > the query point.
         If no such point exists, return len(self.sorted_points).
         """
-        points = [x[0] for x in self.sorted_points]
-        return bisect_right(points, point)
+        return bisect_right(self.sorted_points, point, key=lambda x: x[0])
 
     def frequency(self, point):
         """
@@ -101,6 +142,8 @@ class IntervalHistogram:
                 self.sorted_points[i][0],
                 self.sorted_points[i][1] + 1,
             )
+            if self.sorted_points[i][1] > self.height:
+                self.height = self.sorted_points[i][1]
 
     def __str__(self):
         """Return a string representation of the histogram."""
@@ -0,0 +1,119 @@
+"""
+Non-maxima suppression (NMS) on arrays of boxes.
+
+Two methods are supported:
+
+- 'adjacent', from the TATR authors' inference.py: the boxes are sorted (for instance, rows by position),
+  and each box is only compared with the surviving box before it.
+- 'pairwise': every box is compared with every higher-confidence box that survives, as in the usual greedy NMS.
+
+In both, a box which overlaps more than overlap_threshold of its area (iob) with a higher-confidence box is removed.
+"""
+
+from typing import Literal
+
+import numpy as np
+
+from gmft.base import BoxArray, _area, _divide_by_area, _intersection_area
+
+NMSMethod = Literal["adjacent", "pairwise"]
+
+
+def _as_boxes(boxes) -> np.ndarray:
+    return np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+
+
+def iob(boxes: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """
+    Intersection area over the area of boxes, elementwise (with broadcasting), like :meth:`.BoxArray.iob`.
+    Both are arrays of (xmin, ymin, xmax, ymax) along the last axis. Boxes without area have an iob of 0.
+    """
+    return _divide_by_area(_intersection_area(boxes, others), _area(boxes))
+
+
+def iob_matrix(boxes, others) -> np.ndarray:
+    """
+    :func:`iob` of each pair (boxes[i], others[j]): an array of shape (N, M).
+    """
+    return BoxArray(boxes).iob(BoxArray(others))
+
+
+def _adjacent_nms(
+    boxes: np.ndarray, scores: np.ndarray, overlap_threshold: float
+) -> np.ndarray:
+    """
+    A single pass over the boxes in order, keeping the current survivor.
+    The survivor is compared with the next box, and the one with the lower confidence
+    is dropped (the survivor, on ties); otherwise the survivor is kept, and the next box becomes the survivor.
+    """
+    n = len(boxes)
+    if n < 2:
+        return np.arange(n)
+    # without any overlapping neighbors, nothing is suppressed
+    neighbors = iob(boxes[:-1], boxes[1:])
+    if not np.any(neighbors > overlap_threshold):
+        return np.arange(n)
+
+    x0, y0, x1, y1 = boxes.T.tolist()
+    scores = scores.tolist()
+    keep = []
+    survivor = 0
+    for i in range(1, n):
+        # iob of the survivor, relative to its own area
+        width = min(x1[survivor], x1[i]) - max(x0[survivor], x0[i])
+        height = min(y1[survivor], y1[i]) - max(y0[survivor], y0[i])
+        area = (x1[survivor] - x0[survivor]) * (y1[survivor] - y0[survivor])
+        overlap = width * height / area if width > 0 and height > 0 and area > 0 else 0
+        if overlap > overlap_threshold:
+            if scores[survivor] <= scores[i]:
+                survivor = i
+        else:
+            keep.append(survivor)
+            survivor = i
+    keep.append(survivor)
+    return np.array(keep, dtype=np.int64)
+
+
+def _pairwise_nms(
+    boxes: np.ndarray, scores: np.ndarray, overlap_threshold: float
+) -> np.ndarray:
+    n = len(boxes)
+    # overlaps[i, j]: how much of box j is covered by box i
+    overlaps = iob_matrix(boxes, boxes).T
+    # by decreasing confidence; on ties, the first box wins
+    order = np.argsort(-scores, kind="stable")
+    rank = np.empty(n, dtype=np.int64)
+    rank[order] = np.arange(n)
+    suppressed = np.zeros(n, dtype=bool)
+    for i in order:
+        if not suppressed[i]:
+            suppressed |= (rank > rank[i]) & (overlaps[i] > overlap_threshold)
+    return np.flatnonzero(~suppressed)
+
+
+def non_maxima_suppression(
+    boxes,
+    scores,
+    overlap_threshold: float = 0.1,
+    method: NMSMethod = "adjacent",
+) -> np.ndarray:
+    """
+    Non-maxima suppression of boxes.
+
+    :param boxes: (N, 4) array of (xmin, ymin, xmax, ymax). For 'adjacent', in the order to compare them.
+    :param scores: (N,) confidences
+    :param overlap_threshold: a box is removed if more than this fraction of its area overlaps a higher-confidence box
+    :param method: 'adjacent' or 'pairwise' (see :mod:`gmft.algorithm.nms`)
+    :return: indices of the boxes to keep, in increasing order
+    """
+    boxes = _as_boxes(boxes)
+    scores = np.asarray(scores, dtype=np.float64).reshape(-1)
+    if len(scores) != len(boxes):
+        raise ValueError("boxes and scores must have the same length")
+    if method == "adjacent":
+        return _adjacent_nms(boxes, scores, overlap_threshold)
+    if method == "pairwise":
+        return _pairwise_nms(boxes, scores, overlap_threshold)
+    raise ValueError(
+        f"Unknown NMS method {method!r}: expected 'adjacent' or 'pairwise'"
+    )
@@ -1,10 +1,12 @@
 from __future__ import annotations  # 3.7
 
 import logging
-from typing import Generator
+from typing import Iterable, Union
 import numpy as np
 import pandas as pd
-from gmft.base import Rect
+from gmft.base import BoxArray, Rect
+from gmft.algorithm.nms import NMSMethod, iob, non_maxima_suppression
+from gmft.pdf_bindings.words import WordArray
 from typing import TYPE_CHECKING
 
 logger = logging.getLogger("gmft")
@@ -200,25 +202,25 @@ def _fill_in_gaps(sorted_rows, gap_height, leave_gap=0.4, top_of_table=None):
         i += 1
 
 
-def _non_maxima_suppression(sorted_rows: list[dict], overlap_threshold=0.1):
+def _non_maxima_suppression(
+    sorted_rows: list[dict], overlap_threshold=0.1, method: NMSMethod = "adjacent"
+):
     """
     From the TATR authors' inference.py:
     If a lower-confidence object overlaps more than 5% of its area
     with a higher-confidence object, remove the lower-confidence object.
+
+    Removes the objects from sorted_rows in place, and returns the number removed.
+    See :func:`.non_maxima_suppression` for the methods.
     """
-    num_removed = 0
-    i = 1
-    while i < len(sorted_rows):
-        prev = sorted_rows[i - 1]
-        cur = sorted_rows[i]
-        if _iob(prev["bbox"], cur["bbox"]) > overlap_threshold:
-            if prev["confidence"] > cur["confidence"]:
-                sorted_rows.pop(i)
-            else:
-                sorted_rows.pop(i - 1)
-            num_removed += 1
-        else:
-            i += 1
+    keep = non_maxima_suppression(
+        [row["bbox"] for row in sorted_rows],
+        [row["confidence"] for row in sorted_rows],
+        overlap_threshold=overlap_threshold,
+        method=method,
+    )
+    num_removed = len(sorted_rows) - len(keep)
+    sorted_rows[:] = [sorted_rows[i] for i in keep.tolist()]
     return num_removed
 
 
@@ -668,8 +670,61 @@ def _semantic_spanning_fill(
     return _hier_left_indices
 
 
+def _find_best_partitions(
+    word_boxes: np.ndarray, sorted_boxes: np.ndarray, axis: int, chunk_size: int = 256
+) -> np.ndarray:
+    """
+    :func:`_find_best_row_for_text` (axis=1) or :func:`_find_best_column_for_text` (axis=0)
+    for all words at once: the index of the partition with the highest iob for each word, or -1.
+
+    sorted_boxes must be sorted by their max along axis. Like the python search, partitions past
+    the first one which starts after the word are not considered, and ties go to the first partition.
+
+    Words are swept in order of position, chunk_size at a time, and each chunk is only compared
+    with the band of partitions that it reaches.
+    """
+    n = len(sorted_boxes)
+    best = np.full(len(word_boxes), -1, dtype=np.int64)
+    if n == 0:
+        return best
+    maxes = sorted_boxes[:, axis + 2]
+    # first partition which may intersect each word
+    start = np.searchsorted(maxes, word_boxes[:, axis], side="left")
+    order = np.argsort(start, kind="stable")
+    for lo in range(0, len(order), chunk_size):
+        indices = order[lo : lo + chunk_size]
+        words = word_boxes[indices]
+        first = start[indices]
+        begin = int(first.min())
+        if begin >= n:
+            continue
+        end = int(np.searchsorted(maxes, words[:, axis + 2].max(), side="right")) + 1
+        end = min(n, max(end, begin + 1))
+        while True:
+            band = sorted_boxes[begin:end]
+            positions = np.arange(begin, end)
+            # the python search stops at the first partition which starts after the word
+            after = (positions >= first[:, None]) & (
+                band[None, :, axis] > words[:, None, axis + 2]
+            )
+            has_stop = after.any(axis=1)
+            if end == n or has_stop.all():
+                break
+            end = min(n, begin + 2 * (end - begin))
+        stop = np.where(has_stop, begin + after.argmax(axis=1), n)
+
+        overlaps = iob(words[:, None, :], band[None, :, :])
+        overlaps[
+            (positions[None, :] < first[:, None]) | (positions[None, :] > stop[:, None])
+        ] = 0
+        chunk_best = overlaps.argmax(axis=1)
+        found = overlaps[np.arange(len(words)), chunk_best] > 0
+        best[indices] = np.where(found, begin + chunk_best, -1)
+    return best
+
+
 def _fill_using_partitions(
-    text_positions: Generator[tuple[float, float, float, float, str], None, None],
+    text_positions: Union[Iterable[tuple[float, float, float, float, str]], WordArray],
     config: TATRFormatConfig,
     sorted_rows: list[dict],
     sorted_columns: list[dict],
@@ -680,7 +735,39 @@ def _fill_using_partitions(
     """
     Given estimated positions of rows, columns, headers and text positions,
     fills the table array.
+
+    :param text_positions: (x0, y0, x1, y1, "string") tuples, or a WordArray
     """
+    if isinstance(text_positions, WordArray):
+        word_boxes = text_positions.bboxes
+        texts = text_positions.words()
+        text_positions = zip(*word_boxes.T.tolist(), texts)
+    else:
+        text_positions = list(text_positions)
+        word_boxes = np.array(
+            [word[:4] for word in text_positions], dtype=np.float64
+        ).reshape(-1, 4)
+        texts = [word[4] for word in text_positions]
+    if config.cell_assignment == "numpy":
+        row_boxes = np.array(
+            [row["bbox"] for row in sorted_rows], dtype=np.float64
+        ).reshape(-1, 4)
+        column_boxes = np.array(
+            [column["bbox"] for column in sorted_columns], dtype=np.float64
+        ).reshape(-1, 4)
+        # the numpy engine relies on the same sorting as the python search
+        if np.all(np.diff(row_boxes[:, 3]) >= 0) and np.all(
+            np.diff(column_boxes[:, 2]) >= 0
+        ):
+            return _fill_using_partitions_numpy(
+                word_boxes,
+                texts,
+                config,
+                row_boxes,
+                column_boxes,
+                outliers,
+                row_means,
+            )
 
     num_rows = len(sorted_rows)
     num_columns = len(sorted_columns)
@@ -757,6 +844,73 @@ def _fill_using_partitions(
     return table_array
 
 
+def _fill_using_partitions_numpy(
+    word_boxes: np.ndarray,
+    texts: list[str],
+    config: TATRFormatConfig,
+    row_boxes: np.ndarray,
+    column_boxes: np.ndarray,
+    outliers: dict[str, bool],
+    row_means: list[list[float]],
+):
+    """
+    :func:`_fill_using_partitions`, with the iob of words against rows and columns computed in bulk.
+    """
+    num_rows = len(row_boxes)
+    num_columns = len(column_boxes)
+    table_array = np.empty([num_rows, num_columns], dtype="object")
+    if not texts:
+        return table_array
+    if num_rows == 0 or num_columns == 0:
+        # no cell to put anything in, like the python search
+        outliers["skipped text"] = outliers.get("skipped text", "") + "".join(
+            " " + text for text in texts
+        )
+        return table_array
+
+    word_boxes = np.asarray(word_boxes, dtype=np.float64)
+
+    row_num = _find_best_partitions(word_boxes, row_boxes, axis=1)
+    column_num = _find_best_partitions(word_boxes, column_boxes, axis=0)
+
+    # iob of each word with the intersection of its row and column
+    cells = BoxArray(row_boxes[row_num]).intersect(BoxArray(column_boxes[column_num]))
+    score = iob(word_boxes, cells.boxes)
+
+    found = (row_num >= 0) & (column_num >= 0)
+    kept = found & (score >= config.iob_reject_threshold)
+    if not kept.all():
+        outliers["skipped text"] = outliers.get("skipped text", "") + "".join(
+            " " + texts[i] for i in np.flatnonzero(~kept)
+        )
+    warned = kept & (score < config.iob_warn_threshold)
+    if warned.any():
+        outliers["lowest iob"] = min(
+            outliers.get("lowest iob", 1), float(score[warned].min())
+        )
+
+    kept_indices = np.flatnonzero(kept)
+    if row_means is not None:
+        medians = (word_boxes[kept_indices, 3] + word_boxes[kept_indices, 1]) / 2
+        for row, median in zip(row_num[kept_indices].tolist(), medians.tolist()):
+            row_means[row].append(median)
+
+    if len(kept_indices) == 0:
+        return table_array
+    # join the text of each cell, in the order of the words
+    cell_of_word = row_num[kept_indices] * num_columns + column_num[kept_indices]
+    order = np.argsort(cell_of_word, kind="stable")
+    cell_of_word, kept_indices = cell_of_word[order], kept_indices[order]
+    boundaries = np.flatnonzero(np.diff(cell_of_word)) + 1
+    flat = table_array.reshape(-1)
+    for start, end in zip(
+        np.concatenate([[0], boundaries]).tolist(),
+        np.concatenate([boundaries, [len(cell_of_word)]]).tolist(),
+    ):
+        flat[cell_of_word[start]] = " ".join(texts[i] for i in kept_indices[start:end])
+    return table_array
+
+
 def extract_to_df(table: TATRFormattedTable, config: TATRFormatConfig = None):
     """
     Return the table as a pandas dataframe.
@@ -802,11 +956,15 @@ def extract_to_df(table: TATRFormattedTable, config: TATRFormatConfig = None):
     )
 
     _non_maxima_suppression(
-        sorted_projecting, overlap_threshold=config._nms_overlap_threshold
+        sorted_projecting,
+        overlap_threshold=config._nms_overlap_threshold,
+        method=config._nms_method,
     )
     # non-maxima suppression
     num_removed = _non_maxima_suppression(
-        sorted_rows, overlap_threshold=config._nms_overlap_threshold
+        sorted_rows,
+        overlap_threshold=config._nms_overlap_threshold,
+        method=config._nms_method,
     )
     if num_removed > 0:
         logger.info(f"Removed {num_removed} overlapping rows")
@@ -874,17 +1032,19 @@ def extract_to_df(table: TATRFormattedTable, config: TATRFormatConfig = None):
         # 4. get a good estimate of the true row height by getting the (median) difference of means between rows
         # 5. (use a centering method (ie. mean, median, etc.) to get the row height, with robustness to split rows)
         # 6. re-estimate the rows
-        bins = [[] for _ in range(len(sorted_rows))]
         top = left_corner[1]
         bottom = right_corner[3]
-        for xmin, ymin, xmax, ymax, text in table.text_positions(
-            remove_table_offset=True
-        ):
-            yavg = (ymin + ymax) / 2
-            i = int((yavg - top) / (bottom - top) * len(sorted_rows))
-            if 0 <= i < len(bins):
-                bins[i].append(yavg)
-        known_means = [float(np.mean(x)) for x in bins if len(x)]
+        words, _ = table._get_table_words()
+        yavgs = (words.y0 + words.y1) / 2
+        bin_nums = np.trunc((yavgs - top) / (bottom - top) * len(sorted_rows))
+        in_bins = (0 <= bin_nums) & (bin_nums < len(sorted_rows))
+        yavgs, bin_nums = yavgs[in_bins], bin_nums[in_bins].astype(np.int64)
+        # the mean of each nonempty bin, in the order of the words
+        order = np.argsort(bin_nums, kind="stable")
+        boundaries = np.flatnonzero(np.diff(bin_nums[order])) + 1
+        known_means = [
+            float(np.mean(x)) for x in np.split(yavgs[order], boundaries) if len(x)
+        ]
 
         if not known_means:
             # no text was detected
@@ -966,7 +1126,7 @@ def extract_to_df(table: TATRFormattedTable, config: TATRFormatConfig = None):
         row_means = [[] for _ in range(len(sorted_rows))]
 
     table_array = _fill_using_partitions(
-        table.text_positions(remove_table_offset=True),
+        table._get_table_words()[0],
         config=config,
         sorted_rows=sorted_rows,
         sorted_columns=sorted_columns,
@@ -1012,14 +1172,19 @@ def extract_to_df(table: TATRFormattedTable, config: TATRFormatConfig = None):
             header_indices,
         )
         _non_maxima_suppression(
-            sorted_hier_top_headers, overlap_threshold=config._nms_overlap_threshold
+            sorted_hier_top_headers,
+            overlap_threshold=config._nms_overlap_threshold,
+            method=config._nms_method,
         )
         _non_maxima_suppression(
             sorted_monosemantic_top_headers,
             overlap_threshold=config._nms_overlap_threshold,
+            method=config._nms_method,
         )
         _non_maxima_suppression(
-            sorted_hier_left_headers, overlap_threshold=config._nms_overlap_threshold
+            sorted_hier_left_headers,
+            overlap_threshold=config._nms_overlap_threshold,
+            method=config._nms_method,
         )
         hier_left_idxs = _semantic_spanning_fill(
             table_array,
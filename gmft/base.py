@@ -1,17 +1,29 @@
 from typing import TypeVar, Union
+
+import numpy as np
+
 from gmft.core.exception import DocumentClosedException
 
 
 class Rect:
     """
     A floating-point rectangle.
+
+    Rects are immutable: operations like :meth:`intersect` return a new Rect.
+    For many boxes at once, see :class:`BoxArray`.
     """
 
+    __slots__ = ("bbox",)
+
     def __init__(self, bbox: tuple[float, float, float, float]):
         # (xmin, ymin, xmax, ymax)
         self.bbox = bbox
 
-    def intersect(self, other: tuple[float, float, float, float]):
+    def intersect(self, other: tuple[float, float, float, float]) -> "Rect":
+        """
+        The intersection of this rect and other, as a new Rect.
+        If they do not intersect, Rect.EMPTY is returned.
+        """
         if hasattr(other, "bbox"):  # should be Rect
             other = other.bbox
         xmin = max(self.bbox[0], other[0])
@@ -20,8 +32,7 @@ class Rect:
         ymax = min(self.bbox[3], other[3])
         if xmin >= xmax or ymin >= ymax:
             return Rect.EMPTY
-        self.bbox = (xmin, ymin, xmax, ymax)
-        return self
+        return Rect((xmin, ymin, xmax, ymax))
 
     def is_intersecting(self, other: tuple[float, float, float, float]):
         if hasattr(other, "bbox"):  # should be Rect
@@ -65,3 +76,159 @@ class Rect:
 
 
 Rect.EMPTY = Rect((0, 0, 0, 0))
+
+
+def _as_box_array(boxes) -> np.ndarray:
+    """
+    An array of shape (..., 4) from a Rect, a BoxArray, a bbox tuple or an array of bboxes.
+    """
+    if isinstance(boxes, BoxArray):
+        return boxes.boxes
+    if hasattr(boxes, "bbox"):  # should be Rect
+        boxes = boxes.bbox
+    return np.asarray(boxes, dtype=np.float64)
+
+
+def _intersection_area(boxes: np.ndarray, others: np.ndarray) -> np.ndarray:
+    """
+    Area of the intersection of boxes and others, elementwise (with broadcasting).
+    Both are arrays of (xmin, ymin, xmax, ymax) along the last axis.
+    """
+    width = np.minimum(boxes[..., 2], others[..., 2]) - np.maximum(
+        boxes[..., 0], others[..., 0]
+    )
+    height = np.minimum(boxes[..., 3], others[..., 3]) - np.maximum(
+        boxes[..., 1], others[..., 1]
+    )
+    return np.where((width > 0) & (height > 0), width * height, 0.0)
+
+
+def _area(boxes: np.ndarray) -> np.ndarray:
+    return (boxes[..., 2] - boxes[..., 0]) * (boxes[..., 3] - boxes[..., 1])
+
+
+def _divide_by_area(intersection: np.ndarray, area: np.ndarray) -> np.ndarray:
+    # boxes without area have a ratio of 0, like Rect
+    area = np.broadcast_to(area, intersection.shape)
+    return np.divide(
+        intersection, area, out=np.zeros(intersection.shape), where=area > 0
+    )
+
+
+class BoxArray:
+    """
+    Many rectangles at once, as an (N, 4) float array of (xmin, ymin, xmax, ymax).
+
+    The vectorized counterpart of :class:`Rect`, with the same semantics.
+    Binary operations accept either a single box (a Rect or a bbox tuple), giving an array of shape (N,),
+    or another BoxArray of M boxes, giving an array of shape (N, M) over all pairs.
+
+    Like Rect, a BoxArray is not modified by its operations.
+    """
+
+    __slots__ = ("boxes",)
+
+    def __init__(self, boxes):
+        """
+        :param boxes: array-like of shape (N, 4), or a list of Rects
+        """
+        if isinstance(boxes, BoxArray):
+            boxes = boxes.boxes
+        elif isinstance(boxes, (list, tuple)) and boxes and hasattr(boxes[0], "bbox"):
+            boxes = [rect.bbox for rect in boxes]
+        self.boxes = np.asarray(boxes, dtype=np.float64).reshape(-1, 4)
+
+    def __len__(self) -> int:
+        return len(self.boxes)
+
+    def __getitem__(self, key) -> Union[Rect, "BoxArray"]:
+        """
+        An integer gives a Rect; a slice, mask or index array gives a BoxArray.
+        """
+        if isinstance(key, (int, np.integer)):
+            return Rect(tuple(self.boxes[key].tolist()))
+        return BoxArray(self.boxes[key])
+
+    def __iter__(self):
+        for bbox in self.boxes.tolist():
+            yield Rect(tuple(bbox))
+
+    @property
+    def xmin(self) -> np.ndarray:
+        return self.boxes[:, 0]
+
+    @property
+    def ymin(self) -> np.ndarray:
+        return self.boxes[:, 1]
+
+    @property
+    def xmax(self) -> np.ndarray:
+        return self.boxes[:, 2]
+
+    @property
+    def ymax(self) -> np.ndarray:
+        return self.boxes[:, 3]
+
+    @property
+    def width(self) -> np.ndarray:
+        return self.boxes[:, 2] - self.boxes[:, 0]
+
+    @property
+    def height(self) -> np.ndarray:
+        return self.boxes[:, 3] - self.boxes[:, 1]
+
+    @property
+    def area(self) -> np.ndarray:
+        return _area(self.boxes)
+
+    def _pair(self, other) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Broadcastable (boxes, others): against all pairs if other is a BoxArray.
+        """
+        if isinstance(other, BoxArray):
+            return self.boxes[:, None, :], other.boxes[None, :, :]
+        return self.boxes, _as_box_array(other)
+
+    def intersect(self, other) -> "BoxArray":
+        """
+        The intersection of each box with other, a single box (Rect or bbox tuple)
+        or a BoxArray of the same length (elementwise).
+        Boxes which do not intersect become (0, 0, 0, 0), like Rect.EMPTY.
+        """
+        others = _as_box_array(other)
+        lo = np.maximum(self.boxes[:, :2], others[..., :2])
+        hi = np.minimum(self.boxes[:, 2:], others[..., 2:])
+        result = np.concatenate([lo, hi], axis=-1)
+        empty = (lo >= hi).any(axis=-1)
+        result[empty] = 0
+        return BoxArray(result)
+
+    def is_intersecting(self, other) -> np.ndarray:
+        """
+        Whether each box intersects other, like :meth:`.Rect.is_intersecting`.
+        """
+        boxes, others = self._pair(other)
+        return (
+            np.maximum(boxes[..., 0], others[..., 0])
+            < np.minimum(boxes[..., 2], others[..., 2])
+        ) & (
+            np.maximum(boxes[..., 1], others[..., 1])
+            < np.minimum(boxes[..., 3], others[..., 3])
+        )
+
+    def iob(self, other) -> np.ndarray:
+        """
+        Intersection with other, over the area of each box.
+        """
+        boxes, others = self._pair(other)
+        return _divide_by_area(_intersection_area(boxes, others), _area(boxes))
+
+    def ioa(self, other) -> np.ndarray:
+        """
+        Intersection with other, over the area of other.
+        """
+        boxes, others = self._pair(other)
+        return _divide_by_area(_intersection_area(boxes, others), _area(others))
+
+    def __repr__(self):
+        return f"BoxArray({len(self)} boxes)"
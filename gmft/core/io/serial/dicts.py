@@ -1,5 +1,9 @@
+import base64
 import copy
 from typing import Optional
+
+import numpy as np
+
 from gmft.core.ml.prediction import (
     IndicesPredictions,
     RawBboxPredictions,
@@ -66,3 +70,22 @@ def _extract_effective(d: dict) -> IndicesPredictions:
         return d["predictions.effective"]
 
     return _empty_effective_predictions()
+
+
+def _encode_raw_predictions(raw: np.ndarray) -> dict:
+    """
+    Encode predictions.raw compactly: the float16 array as base64.
+    """
+    raw = np.ascontiguousarray(raw, dtype="<f2")
+    return {
+        "shape": list(raw.shape),
+        "data": base64.b64encode(raw.tobytes()).decode("ascii"),
+    }
+
+
+def _extract_raw_predictions(d: dict) -> Optional[np.ndarray]:
+    if "predictions.raw" not in d:
+        return None
+    encoded = d["predictions.raw"]
+    data = base64.b64decode(encoded["data"])
+    return np.frombuffer(data, dtype="<f2").reshape(encoded["shape"]).copy()
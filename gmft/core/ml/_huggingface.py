@@ -70,3 +70,36 @@ def _load_tatr_from_pretrained(model_path: str, revision: str = None):
         return TableTransformerForObjectDetection.from_pretrained(
             model_path, config=config, revision=revision
         )
+
+
+def _load_tatr_model(
+    model_path: str,
+    revision: str = None,
+    device: str = "cpu",
+    backend: str = "torch",
+    onnx_path: str = None,
+    quantization: str = "none",
+):
+    """
+    Load a Table Transformer for the given inference backend.
+
+    'torch' loads the ``TableTransformerForObjectDetection`` onto device, quantized if requested
+    (see :func:`._quantize_model`).
+    'onnxruntime' loads the ONNX export of the model (see :func:`.export_tatr_to_onnx`)
+    from onnx_path, or from the default export location of model_path.
+    Both are called the same way, and their outputs are post-processed the same way.
+    """
+    if backend == "torch":
+        from gmft.core.ml._quantization import _quantize_model
+
+        model = _load_tatr_from_pretrained(model_path, revision=revision)
+        return _quantize_model(model, quantization, device).to(device)
+    if quantization != "none":
+        raise ValueError("quantization is only supported with the 'torch' backend")
+    if backend == "onnxruntime":
+        from gmft.core.ml._onnx import OnnxTableTransformer, _default_onnx_path
+
+        if onnx_path is None:
+            onnx_path = _default_onnx_path(model_path, revision)
+        return OnnxTableTransformer(onnx_path, device=device)
+    raise ValueError(f"Unknown backend {backend!r}: expected 'torch' or 'onnxruntime'")
@@ -0,0 +1,148 @@
+"""
+ONNX Runtime backend for the Table Transformer models.
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def _default_onnx_path(model_path: str, revision: str = None) -> str:
+    """
+    Where :func:`export_tatr_to_onnx` puts the export of a huggingface model by default.
+    The directory is ``$GMFT_ONNX_CACHE``, or ``~/.cache/gmft/onnx``.
+    """
+    cache_dir = os.environ.get("GMFT_ONNX_CACHE") or os.path.join(
+        os.path.expanduser("~"), ".cache", "gmft", "onnx"
+    )
+    name = model_path.replace("/", "--")
+    if revision:
+        name += "@" + revision
+    return os.path.join(cache_dir, name + ".onnx")
+
+
+def export_tatr_to_onnx(
+    model_path: str,
+    output_path: str = None,
+    revision: str = None,
+    opset: int = 17,
+    model=None,
+) -> str:
+    """
+    Export a ``TableTransformerForObjectDetection`` checkpoint to ONNX,
+    with dynamic batch size and image size.
+
+    :param model_path: huggingface path of the model. Checkpoints already in the local huggingface cache are used.
+    :param output_path: Defaults to the location where the 'onnxruntime' backend looks for the model.
+    :param revision: huggingface revision, for instance 'no_timm'
+    :param opset: ONNX opset version
+    :param model: an already loaded model to export, instead of loading model_path
+    :return: output_path
+    """
+    import torch
+
+    from gmft.core.ml._huggingface import _load_tatr_from_pretrained
+
+    if output_path is None:
+        output_path = _default_onnx_path(model_path, revision)
+    if model is None:
+        model = _load_tatr_from_pretrained(model_path, revision=revision)
+
+    class _Outputs(torch.nn.Module):
+        def __init__(self, model):
+            super().__init__()
+            self.model = model
+
+        def forward(self, pixel_values, pixel_mask):
+            outputs = self.model(pixel_values=pixel_values, pixel_mask=pixel_mask)
+            return outputs.logits, outputs.pred_boxes
+
+    # the exporter restores the training flag of the module it is given
+    wrapper = _Outputs(model).eval()
+    pixel_values = torch.rand(1, 3, 800, 800)
+    pixel_mask = torch.ones(1, 800, 800, dtype=torch.long)
+    os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+    torch.onnx.export(
+        wrapper,
+        (pixel_values, pixel_mask),
+        output_path,
+        input_names=["pixel_values", "pixel_mask"],
+        output_names=["logits", "pred_boxes"],
+        dynamic_axes={
+            "pixel_values": {0: "batch", 2: "height", 3: "width"},
+            "pixel_mask": {0: "batch", 1: "height", 2: "width"},
+            "logits": {0: "batch"},
+            "pred_boxes": {0: "batch"},
+        },
+        opset_version=opset,
+        dynamo=False,
+    )
+    logger.info("Exported %s to %s", model_path, output_path)
+    return output_path
+
+
+@dataclass
+class _OnnxDetectionOutput:
+    """The fields of ``TableTransformerObjectDetectionOutput`` needed for post-processing."""
+
+    logits: Any
+    pred_boxes: Any
+
+
+class OnnxTableTransformer:
+    """
+    Runs a Table Transformer exported by :func:`export_tatr_to_onnx` with ONNX Runtime.
+    Called like ``TableTransformerForObjectDetection``, with the output of the image processor.
+    """
+
+    def __init__(self, onnx_path: str, device: str = "cpu"):
+        """
+        :param onnx_path: exported model
+        :param device: 'cuda' uses the CUDA execution provider when onnxruntime has it
+        """
+        try:
+            import onnxruntime
+        except ImportError:
+            raise ImportError(
+                "You need to install onnxruntime to use the 'onnxruntime' backend"
+            )
+        if not os.path.exists(onnx_path):
+            raise FileNotFoundError(
+                f"No exported model at {onnx_path}. "
+                "Export it with `python -m gmft.core.ml.onnx_export <model path>`."
+            )
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = (
+            onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        )
+        providers = ["CPUExecutionProvider"]
+        if device.startswith("cuda"):
+            providers.insert(0, "CUDAExecutionProvider")
+        available = onnxruntime.get_available_providers()
+        self.session = onnxruntime.InferenceSession(
+            onnx_path,
+            options,
+            providers=[p for p in providers if p in available],
+        )
+        self.onnx_path = onnx_path
+
+    def __call__(self, pixel_values, pixel_mask=None, **kwargs) -> _OnnxDetectionOutput:
+        import numpy as np
+        import torch
+
+        pixel_values = pixel_values.detach().cpu().numpy().astype(np.float32)
+        if pixel_mask is None:
+            n, _, h, w = pixel_values.shape
+            pixel_mask = np.ones((n, h, w), dtype=np.int64)
+        else:
+            pixel_mask = pixel_mask.detach().cpu().numpy().astype(np.int64)
+        logits, pred_boxes = self.session.run(
+            None, {"pixel_values": pixel_values, "pixel_mask": pixel_mask}
+        )
+        return _OnnxDetectionOutput(
+            logits=torch.from_numpy(logits), pred_boxes=torch.from_numpy(pred_boxes)
+        )
@@ -0,0 +1,59 @@
+"""
+Quantization of the Table Transformer models, for faster CPU inference.
+"""
+
+from typing import Literal
+
+import torch
+
+QuantizationMode = Literal["none", "dynamic-int8", "bf16"]
+
+
+class _Bfloat16Model(torch.nn.Module):
+    """
+    Runs a model converted to bfloat16 on float32 inputs.
+    Logits and boxes are returned as float32, for post-processing.
+    """
+
+    def __init__(self, model: torch.nn.Module):
+        super().__init__()
+        self.model = model.to(torch.bfloat16)
+
+    def forward(self, pixel_values, pixel_mask=None, **kwargs):
+        outputs = self.model(
+            pixel_values=pixel_values.to(torch.bfloat16),
+            pixel_mask=pixel_mask,
+            **kwargs,
+        )
+        outputs.logits = outputs.logits.float()
+        outputs.pred_boxes = outputs.pred_boxes.float()
+        return outputs
+
+
+def _quantize_model(
+    model: torch.nn.Module, quantization: QuantizationMode, device: str = "cpu"
+) -> torch.nn.Module:
+    """
+    Quantize a loaded ``TableTransformerForObjectDetection``.
+
+    'dynamic-int8' stores the weights of the linear layers (the transformer) as int8,
+    and quantizes their activations on the fly. The convolutional backbone stays in float32.
+    This is only supported on cpu.
+
+    'bf16' converts the whole model to bfloat16.
+
+    :return: a model which is called like the original one
+    """
+    if quantization == "none":
+        return model
+    if quantization == "dynamic-int8":
+        if device != "cpu":
+            raise ValueError("dynamic-int8 quantization is only supported on cpu")
+        from torch.ao.quantization import quantize_dynamic
+
+        return quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+    if quantization == "bf16":
+        return _Bfloat16Model(model)
+    raise ValueError(
+        f"Unknown quantization {quantization!r}: expected 'none', 'dynamic-int8' or 'bf16'"
+    )
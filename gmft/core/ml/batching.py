@@ -0,0 +1,34 @@
+import math
+from typing import Sequence
+
+
+def _aspect_ratio_batches(
+    sizes: Sequence[tuple[float, float]], batch_size: int
+) -> list[list[int]]:
+    """
+    Group images into batches of at most batch_size, so that the images of a batch have similar aspect ratios.
+
+    Batched images are padded to a common size, so mixing wide and tall images wastes most of the batch on padding.
+    Images are put into buckets of aspect ratios within a factor of about sqrt(2),
+    and each bucket is split into batches, in order of aspect ratio.
+
+    :param sizes: (width, height) of each image
+    :param batch_size: maximum number of images per batch
+    :return: batches, as lists of indices into sizes
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1")
+    log_ratios = [
+        math.log2(max(width, 1e-6) / max(height, 1e-6)) for width, height in sizes
+    ]
+    order = sorted(range(len(sizes)), key=lambda i: log_ratios[i])
+
+    buckets: dict[int, list[int]] = {}
+    for i in order:
+        buckets.setdefault(round(log_ratios[i] * 2), []).append(i)
+
+    batches = []
+    for bucket in buckets.values():
+        for start in range(0, len(bucket), batch_size):
+            batches.append(bucket[start : start + batch_size])
+    return batches
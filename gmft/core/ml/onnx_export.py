@@ -0,0 +1,63 @@
+"""
+Export the Table Transformer checkpoints to ONNX, for the 'onnxruntime' backend.
+
+Usage::
+
+    python -m gmft.core.ml.onnx_export
+    python -m gmft.core.ml.onnx_export microsoft/table-transformer-structure-recognition --revision no_timm
+
+Without arguments, the default detector and formatter models are exported
+to the locations where the 'onnxruntime' backend looks for them.
+"""
+
+import argparse
+import logging
+
+from gmft.core.ml._onnx import export_tatr_to_onnx
+
+
+def _default_models() -> list[tuple[str, str]]:
+    from gmft.impl.ditr.config import DITRFormatConfig
+    from gmft.impl.tatr.config import TATRDetectorConfig, TATRFormatConfig
+
+    detector = TATRDetectorConfig()
+    formatter = TATRFormatConfig()
+    return [
+        (detector.detector_path, "no_timm" if detector.no_timm else None),
+        (formatter.formatter_path, "no_timm" if formatter.no_timm else None),
+        # DITRFormatter loads the default revision
+        (DITRFormatConfig().formatter_path, None),
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Export Table Transformer checkpoints to ONNX."
+    )
+    parser.add_argument(
+        "model_path",
+        nargs="?",
+        help="huggingface path of the model. Defaults to all of gmft's default models.",
+    )
+    parser.add_argument("--revision", default=None, help="huggingface revision")
+    parser.add_argument(
+        "--output", default=None, help="output file (only with model_path)"
+    )
+    parser.add_argument("--opset", type=int, default=17, help="ONNX opset version")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    if args.model_path is None:
+        if args.output is not None:
+            parser.error("--output requires model_path")
+        models = _default_models()
+    else:
+        models = [(args.model_path, args.revision)]
+    for model_path, revision in models:
+        export_tatr_to_onnx(
+            model_path, args.output, revision=revision, opset=args.opset
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,8 @@ from dataclasses import dataclass
 from typing import Literal, Optional, Tuple, TypedDict, List, Union
 from typing_extensions import NotRequired
 
+import numpy as np
+
 
 # Type definitions for predictions structure
 class RawBboxPredictions(TypedDict):
@@ -59,6 +61,46 @@ class TablePredictions:
 
     status: Literal["unready", "ready"] = "unready"
 
+    raw: Optional[np.ndarray] = None
+    """
+    All query predictions of the model, before thresholding, if kept (see ``keep_raw_predictions``).
+    float16 array of shape (num_queries, num_labels + 5): the probability of each label
+    (the last column being "no object"), then the box (xmin, ymin, xmax, ymax), in the coordinates of ``tatr``.
+    """
+
+    threshold: Optional[float] = None
+    """The score threshold which ``tatr`` was derived from ``raw`` with."""
+
+    def rethreshold(self, threshold: float):
+        """
+        Derive ``tatr`` from ``raw`` again, keeping the predictions with a score above threshold.
+        Scores and boxes are rounded to float16.
+        """
+        if self.raw is None:
+            raise ValueError(
+                "Raw predictions were not kept: extract the table with keep_raw_predictions=True"
+            )
+        if threshold == self.threshold:
+            return
+        self.tatr = _threshold_raw_predictions(self.raw, threshold)
+        self.threshold = threshold
+
+
+def _threshold_raw_predictions(raw: np.ndarray, threshold: float) -> RawBboxPredictions:
+    """
+    The predictions with a score above threshold, like the post-processing of the model's outputs.
+    See :attr:`TablePredictions.raw`.
+    """
+    probs = raw[:, :-4].astype(np.float32)
+    scores = probs[:, :-1].max(axis=1)
+    labels = probs[:, :-1].argmax(axis=1)
+    keep = scores > threshold
+    return {
+        "scores": scores[keep].tolist(),
+        "labels": labels[keep].tolist(),
+        "boxes": raw[keep, -4:].astype(np.float32).tolist(),
+    }
+
 
 def _empty_effective_predictions():
     return {
@@ -0,0 +1,215 @@
+"""
+Native pre- and post-processing for the DETR-style (Table Transformer) models.
+
+This reproduces what ``DetrImageProcessor`` does for inference with the settings of the
+microsoft/table-transformer-* checkpoints, without its per-call generality:
+the resize runs directly on the uint8 image, normalization uses fixed constants,
+and post-processing converts the whole batch to python lists at once.
+"""
+
+from typing import Literal, Sequence, Union
+
+import numpy as np
+import torch
+from PIL.Image import Image as PILImage
+
+Preprocessing = Literal["huggingface", "native"]
+
+DETR_MEAN = (0.485, 0.456, 0.406)
+DETR_STD = (0.229, 0.224, 0.225)
+DETR_SHORTEST_EDGE = 800
+DETR_LONGEST_EDGE = 1333
+
+
+def _resized_size(
+    height: int,
+    width: int,
+    shortest_edge: int = DETR_SHORTEST_EDGE,
+    longest_edge: int = DETR_LONGEST_EDGE,
+) -> tuple[int, int]:
+    """
+    Size (height, width) of the image after resizing its shorter side to shortest_edge,
+    unless this makes the longer side exceed longest_edge.
+    Rounds exactly like transformers' ``get_size_with_aspect_ratio``.
+    """
+    size = shortest_edge
+    raw_size = None
+    short, long = float(min(height, width)), float(max(height, width))
+    if long / short * size > longest_edge:
+        raw_size = longest_edge * short / long
+        size = int(round(raw_size))
+
+    if (height <= width and height == size) or (width <= height and width == size):
+        return height, width
+    if width < height:
+        scale = raw_size if raw_size is not None else size
+        return int(scale * height / width), size
+    scale = raw_size if raw_size is not None else size
+    return size, int(scale * width / height)
+
+
+def _as_uint8_chw(image: Union[PILImage, np.ndarray]) -> torch.Tensor:
+    if isinstance(image, PILImage):
+        if image.mode != "RGB":
+            image = image.convert("RGB")
+        image = np.array(image)
+    if image.ndim == 2:
+        image = np.repeat(image[:, :, None], 3, axis=2)
+    if not image.flags.writeable:
+        image = image.copy()
+    return torch.from_numpy(np.ascontiguousarray(image)).permute(2, 0, 1)
+
+
+def preprocess_images(
+    images: Sequence[Union[PILImage, np.ndarray]],
+    shortest_edge: int = DETR_SHORTEST_EDGE,
+    longest_edge: int = DETR_LONGEST_EDGE,
+    device: str = "cpu",
+) -> dict[str, torch.Tensor]:
+    """
+    Resize, normalize and pad a batch of RGB images for the model.
+
+    :param images: PIL images, or uint8 arrays of shape (height, width, 3) or (height, width)
+    :return: ``{"pixel_values", "pixel_mask"}``, like ``DetrImageProcessor(images, return_tensors="pt")``.
+        Images are padded at the bottom and right to the largest image of the batch.
+    """
+    resized = []
+    for image in images:
+        image = _as_uint8_chw(image)
+        size = _resized_size(*image.shape[1:], shortest_edge, longest_edge)
+        if tuple(image.shape[1:]) != size:
+            # bilinear interpolation with antialiasing is implemented for uint8 on cpu
+            image = torch.nn.functional.interpolate(
+                image[None], size=size, mode="bilinear", antialias=True
+            )[0]
+        resized.append(image)
+
+    height = max(image.shape[1] for image in resized)
+    width = max(image.shape[2] for image in resized)
+    pixel_values = torch.zeros((len(resized), 3, height, width), dtype=torch.float32)
+    pixel_mask = torch.zeros((len(resized), height, width), dtype=torch.int64)
+    mean = torch.tensor(DETR_MEAN).mul_(255).view(3, 1, 1)
+    std = torch.tensor(DETR_STD).mul_(255).view(3, 1, 1)
+    for i, image in enumerate(resized):
+        h, w = image.shape[1:]
+        # normalize in place, in the padded batch
+        pixel_values[i, :, :h, :w].copy_(image).sub_(mean).div_(std)
+        pixel_mask[i, :h, :w] = 1
+    return {
+        "pixel_values": pixel_values.to(device),
+        "pixel_mask": pixel_mask.to(device),
+    }
+
+
+def _probabilities_and_boxes(
+    outputs, target_sizes: Sequence[tuple[int, int]]
+) -> tuple[torch.Tensor, torch.Tensor]:
+    """
+    :return: probabilities of each label (batch, queries, labels + 1), the last being "no object",
+        and boxes (batch, queries, 4) as (xmin, ymin, xmax, ymax) in the pixels of each original image
+    """
+    logits = outputs.logits.detach().float().cpu()
+    boxes = outputs.pred_boxes.detach().float().cpu()
+    if len(logits) != len(target_sizes):
+        raise ValueError(
+            "Make sure that you pass in as many target sizes as the batch dimension of the logits"
+        )
+
+    cx, cy, w, h = boxes.unbind(-1)
+    boxes = torch.stack([cx - 0.5 * w, cy - 0.5 * h, cx + 0.5 * w, cy + 0.5 * h], -1)
+    sizes = torch.tensor([list(size) for size in target_sizes], dtype=torch.float32)
+    boxes = boxes * sizes[:, [1, 0, 1, 0]][:, None, :]
+    return logits.softmax(-1), boxes
+
+
+def post_process_object_detection(
+    outputs, threshold: float, target_sizes: Sequence[tuple[int, int]]
+) -> list[dict[str, list]]:
+    """
+    Convert the model's outputs to boxes (xmin, ymin, xmax, ymax) in the pixels of each original image.
+
+    Matches ``DetrImageProcessor.post_process_object_detection``, except that the results are python lists.
+
+    :param target_sizes: (height, width) of each original image
+    :return: for each image, a dict of "scores", "labels" and "boxes", for the predictions with score > threshold
+    """
+    probs, boxes = _probabilities_and_boxes(outputs, target_sizes)
+    scores, labels = probs[..., :-1].max(-1)
+
+    keep = scores > threshold
+    return [
+        {
+            "scores": scores[i][keep[i]].tolist(),
+            "labels": labels[i][keep[i]].tolist(),
+            "boxes": boxes[i][keep[i]].tolist(),
+        }
+        for i in range(len(probs))
+    ]
+
+
+def raw_predictions(outputs, target_sizes: Sequence[tuple[int, int]]) -> np.ndarray:
+    """
+    All query predictions, before thresholding: a float32 array of shape (batch, queries, labels + 5),
+    with the probability of each label (the last being "no object"),
+    then the box (xmin, ymin, xmax, ymax) in the pixels of each original image.
+    """
+    probs, boxes = _probabilities_and_boxes(outputs, target_sizes)
+    return torch.cat([probs, boxes], -1).numpy()
+
+
+def _image_size(image: Union[PILImage, np.ndarray]) -> tuple[int, int]:
+    if isinstance(image, PILImage):
+        return image.height, image.width
+    return image.shape[:2]
+
+
+def _predict(
+    model,
+    images: Sequence[Union[PILImage, np.ndarray]],
+    threshold: float,
+    preprocessing: Preprocessing = "huggingface",
+    image_processor=None,
+    device: str = "cpu",
+    size: dict = None,
+    keep_raw: bool = False,
+) -> list[dict[str, list]]:
+    """
+    Run a Table Transformer on a batch of images, in one forward pass.
+
+    :param preprocessing: 'huggingface' uses image_processor (a ``DetrImageProcessor``),
+        'native' uses :func:`preprocess_images` and :func:`post_process_object_detection`.
+    :param size: resize settings ``{"shortest_edge", "longest_edge"}``, if not the processor's defaults
+    :param keep_raw: also return every query's predictions, under "raw" (see :func:`raw_predictions`)
+    :return: for each image, a dict of "scores", "labels" and "boxes" (in pixels of the image) as python lists
+    """
+    target_sizes = [_image_size(image) for image in images]
+    size = size or {}
+    if preprocessing == "native":
+        encoding = preprocess_images(
+            images,
+            shortest_edge=size.get("shortest_edge", DETR_SHORTEST_EDGE),
+            longest_edge=size.get("longest_edge", DETR_LONGEST_EDGE),
+            device=device,
+        )
+    elif preprocessing == "huggingface":
+        kwargs = {"size": size} if size else {}
+        encoding = image_processor(images, return_tensors="pt", **kwargs).to(device)
+    else:
+        raise ValueError(
+            f"Unknown preprocessing {preprocessing!r}: expected 'huggingface' or 'native'"
+        )
+
+    with torch.no_grad():
+        outputs = model(**encoding)
+
+    if preprocessing == "native":
+        results = post_process_object_detection(outputs, threshold, target_sizes)
+    else:
+        results = image_processor.post_process_object_detection(
+            outputs, threshold=threshold, target_sizes=target_sizes
+        )
+        results = [{k: v.tolist() for k, v in result.items()} for result in results]
+    if keep_raw:
+        for result, raw in zip(results, raw_predictions(outputs, target_sizes)):
+            result["raw"] = raw
+    return results
@@ -0,0 +1,167 @@
+"""
+Process-wide registry of loaded models, shared by detectors and formatters.
+"""
+
+import threading
+from typing import Any, Callable, Optional
+
+
+class ModelRegistry:
+    """
+    Thread-safe cache of loaded models and image processors.
+
+    Models are keyed by (path, revision, device, quantization, backend, onnx_path),
+    so that every :class:`.TATRDetector`, :class:`.TATRFormatter` and :class:`.DITRFormatter`
+    with the same model settings shares one instance of the weights.
+    Each model is loaded once, even when several threads ask for it at the same time;
+    different models may load concurrently.
+
+    Shared models are only used for inference. Modifying a model (for instance, fine-tuning it)
+    affects every detector and formatter that uses it.
+
+    Use :meth:`preload` to load models ahead of time, :meth:`register` to add models loaded elsewhere,
+    and :meth:`evict` or :meth:`clear`
+    to drop the registry's references. Evicted models stay alive as long as detectors or formatters use them.
+    """
+
+    def __init__(self):
+        self._entries: dict[tuple, Any] = {}
+        self._key_locks: dict[tuple, threading.Lock] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.loads = 0
+
+    def _get(self, key: tuple, load: Callable[[], Any]) -> Any:
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                return self._entries[key]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        with key_lock:
+            with self._lock:
+                if key in self._entries:
+                    # loaded by another thread in the meantime
+                    self.hits += 1
+                    return self._entries[key]
+            value = load()
+            with self._lock:
+                self._entries[key] = value
+                self._key_locks.pop(key, None)
+                self.loads += 1
+            return value
+
+    def get_model(
+        self,
+        model_path: str,
+        revision: str = None,
+        device: str = "cpu",
+        backend: str = "torch",
+        quantization: str = "none",
+        onnx_path: str = None,
+    ):
+        """
+        Get the shared Table Transformer for these settings, loading it if needed.
+        See :func:`._load_tatr_model` for the parameters.
+        """
+        from gmft.core.ml import _huggingface
+
+        key = ("model", model_path, revision, device, quantization, backend, onnx_path)
+        return self._get(
+            key,
+            lambda: _huggingface._load_tatr_model(
+                model_path,
+                revision=revision,
+                device=device,
+                backend=backend,
+                onnx_path=onnx_path,
+                quantization=quantization,
+            ),
+        )
+
+    def get_image_processor(self, path: str):
+        """
+        Get the shared ``AutoImageProcessor`` for path, loading it if needed.
+        """
+
+        def load():
+            from transformers import AutoImageProcessor
+
+            return AutoImageProcessor.from_pretrained(path)
+
+        return self._get(("image_processor", path), load)
+
+    def register(
+        self,
+        model_path: str,
+        model,
+        image_processor=None,
+        revision: str = None,
+        device: str = "cpu",
+        backend: str = "torch",
+        quantization: str = "none",
+        onnx_path: str = None,
+    ):
+        """
+        Add a model which was loaded elsewhere (for instance, fine-tuned in memory) under model_path.
+        Detectors and formatters whose config names model_path, with the same settings, then use it
+        instead of loading from the hub. If given, image_processor becomes the image processor of model_path.
+
+        Replaces any model already registered with these settings.
+        """
+        key = ("model", model_path, revision, device, quantization, backend, onnx_path)
+        with self._lock:
+            self._entries[key] = model
+            if image_processor is not None:
+                self._entries[("image_processor", model_path)] = image_processor
+
+    def preload(
+        self,
+        model_path: str,
+        revision: str = None,
+        device: str = "cpu",
+        backend: str = "torch",
+        quantization: str = "none",
+        onnx_path: str = None,
+    ):
+        """
+        Load a model ahead of time, so that constructing the detectors and formatters which use it is fast.
+        """
+        self.get_model(model_path, revision, device, backend, quantization, onnx_path)
+
+    def evict(self, model_path: Optional[str] = None) -> int:
+        """
+        Drop the models (with any settings) and image processors loaded from model_path,
+        or everything if model_path is None.
+
+        :return: number of entries dropped
+        """
+        with self._lock:
+            keys = [
+                key
+                for key in self._entries
+                if model_path is None or key[1] == model_path
+            ]
+            for key in keys:
+                del self._entries[key]
+        return len(keys)
+
+    def clear(self):
+        """Drop all models and image processors. Counters are kept."""
+        self.evict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict:
+        """Counters and current contents."""
+        return {"hits": self.hits, "loads": self.loads, "entries": len(self._entries)}
+
+
+_registry = ModelRegistry()
+
+
+def get_model_registry() -> ModelRegistry:
+    """The registry shared by all detectors and formatters of this process."""
+    return _registry
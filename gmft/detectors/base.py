@@ -9,6 +9,7 @@ Example:
 from abc import ABC, abstractmethod
 
 from typing import Generator, Generic, Literal, TypeVar, Union
+import weakref
 import PIL.Image
 from PIL.Image import Image as PILImage
 from PIL import ImageOps  # necessary to call PIL.ImageOps later
@@ -16,6 +17,8 @@ from PIL import ImageOps  # necessary to call PIL.ImageOps later
 import numpy as np
 from gmft.base import Rect
 from gmft.pdf_bindings.base import BasePage, ImageOnlyPage
+from gmft.pdf_bindings.words import WordArray
+from gmft.pdf_bindings.render_cache import _crop_rendered_array, _crop_rendered_page
 from gmft.algorithm.captions import _find_captions
 from gmft.table_visualization import plot_results_unwr
 
@@ -60,6 +63,7 @@ class CroppedTable:
     _img_margin: tuple[int, int, int, int]
     _word_height: float
     _captions: list[str]
+    _word_cache: tuple
 
     def __init__(
         self,
@@ -94,6 +98,7 @@ class CroppedTable:
         self.label = label
         self._word_height = None
         self._captions = None
+        self._word_cache = None
 
         self.angle = angle
         if angle not in [0, 90, 180, 270]:
@@ -104,6 +109,9 @@ class CroppedTable:
         dpi: int = None,
         padding: Union[tuple[int, int, int, int], Literal["auto", None]] = None,
         margin: Union[tuple[int, int, int, int], Literal["auto", None]] = None,
+        *,
+        page_image: np.ndarray = None,
+        page_image_bbox: tuple[float, float, float, float] = None,
     ) -> PILImage:
         """
         Return the image of the cropped table.
@@ -118,30 +126,25 @@ class CroppedTable:
             If padding = 'auto', the padding is automatically set to 10% of the larger of {width, height}.
             Default is no padding.
         :param margin: add content (in **pdf units**) from the original pdf beyond the detected table bbox boundary.
+        :param page_image: an image (H, W, C) of the page, already rendered at ``dpi``.
+            If given, the table is cropped from it instead of rendering the page again.
+        :param page_image_bbox: the region of the page shown by page_image. Defaults to the whole page.
 
         :return: image of the cropped table
         """
-        dpi = 72 if dpi is None else dpi
-        if padding == "auto":
-            width = self.rect.width * dpi / 72
-            height = self.rect.height * dpi / 72
-            pad = int(max(width, height) * 0.1)
-            padding = (pad, pad, pad, pad)
-        elif padding == None:
-            padding = (0, 0, 0, 0)
-        rect = self.rect
-        if margin == "auto":
-            margin = (30, 30, 30, 30)  # from the paper
-        if margin is not None:
-            rect = Rect(
-                (
-                    rect.xmin - margin[0],
-                    rect.ymin - margin[1],
-                    rect.xmax + margin[2],
-                    rect.ymax + margin[3],
-                )
+        dpi, padding, margin = self._image_params(dpi, padding, margin)
+        rect = self._margin_rect(margin)
+        if page_image is None:
+            img = self.page.get_image(dpi=dpi, rect=rect)
+        else:
+            img = _crop_rendered_page(
+                page_image,
+                self.page.width,
+                self.page.height,
+                dpi,
+                rect.bbox,
+                page_image_bbox,
             )
-        img = self.page.get_image(dpi=dpi, rect=rect)
         if padding is not None:
             img = PIL.ImageOps.expand(img, padding, fill="white")
 
@@ -155,6 +158,88 @@ class CroppedTable:
 
         return self._img
 
+    def image_array(
+        self,
+        dpi: int = None,
+        padding: Union[tuple[int, int, int, int], Literal["auto", None]] = None,
+        margin: Union[tuple[int, int, int, int], Literal["auto", None]] = None,
+        mode: Literal["RGB", "L"] = "RGB",
+        *,
+        page_image: np.ndarray = None,
+        page_image_bbox: tuple[float, float, float, float] = None,
+    ) -> np.ndarray:
+        """
+        Like :meth:`image`, but as a uint8 array of shape (H, W, 3), or (H, W) for mode 'L' (grayscale).
+        See :meth:`.BasePage.get_array`.
+
+        Padding and rotation are done with numpy, and the pixels are the same as :meth:`image`'s.
+        Unless the table is rotated, the result may be a view of the rendered buffer, or of page_image.
+
+        :param page_image: an array of the page, already rendered at ``dpi`` in the given mode.
+        """
+        dpi, padding, margin = self._image_params(dpi, padding, margin)
+        rect = self._margin_rect(margin)
+        if page_image is None:
+            arr = self.page.get_array(dpi=dpi, rect=rect, mode=mode)
+        else:
+            arr = _crop_rendered_array(
+                page_image,
+                self.page.width,
+                self.page.height,
+                dpi,
+                rect.bbox,
+                page_image_bbox,
+            )
+        if any(padding):
+            left, top, right, bottom = padding
+            pad_width = ((top, bottom), (left, right)) + ((0, 0),) * (arr.ndim - 2)
+            arr = np.pad(arr, pad_width, constant_values=255)
+
+        if self.angle != 0:
+            # rotate clockwise by angle, like image().
+            # copy, since torch does not accept the negative strides of a rotated view
+            arr = np.ascontiguousarray(np.rot90(arr, k=-self.angle // 90))
+        self._img = None
+        self._img_dpi = dpi
+        self._img_padding = padding
+        self._img_margin = margin
+        return arr
+
+    def _image_params(self, dpi, padding, margin) -> tuple:
+        """
+        Resolve the defaults and 'auto' values of :meth:`image`'s parameters.
+        """
+        dpi = 72 if dpi is None else dpi
+        if padding == "auto":
+            width = self.rect.width * dpi / 72
+            height = self.rect.height * dpi / 72
+            pad = int(max(width, height) * 0.1)
+            padding = (pad, pad, pad, pad)
+        elif padding == None:
+            padding = (0, 0, 0, 0)
+        if margin == "auto":
+            margin = (30, 30, 30, 30)  # from the paper
+        return dpi, padding, margin
+
+    def _margin_rect(
+        self, margin: Union[tuple[int, int, int, int], Literal["auto", None]] = None
+    ) -> Rect:
+        """
+        The table rect, expanded by margin (in pdf units). See :meth:`image`.
+        """
+        if margin == "auto":
+            margin = (30, 30, 30, 30)
+        if margin is None:
+            return self.rect
+        return Rect(
+            (
+                self.rect.xmin - margin[0],
+                self.rect.ymin - margin[1],
+                self.rect.xmax + margin[2],
+                self.rect.ymax + margin[3],
+            )
+        )
+
     def text_positions(
         self, remove_table_offset: bool = False, outside: bool = False
     ) -> Generator[tuple[int, int, int, int, str], None, None]:
@@ -171,44 +256,72 @@ class CroppedTable:
             ``(x0, y0, x1, y1, "string")``
         """
 
-        def _old_generator(remove_table_offset, outside):
-            for w in self.page.get_positions_and_text():
-                if Rect(w[:4]).is_intersecting(self.rect) != outside:
-                    if remove_table_offset:
-                        yield (
-                            w[0] - self.rect.xmin,
-                            w[1] - self.rect.ymin,
-                            w[2] - self.rect.xmin,
-                            w[3] - self.rect.ymin,
-                            w[4],
-                        )
-                    else:
-                        yield w
-
-        if self.angle == 0 or remove_table_offset == False:
-            yield from _old_generator(
-                remove_table_offset=remove_table_offset, outside=outside
+        if remove_table_offset and not outside:
+            yield from self._get_table_words()[1]
+            return
+        # only visit candidate words, through the page's spatial index
+        words = self.page.get_word_array()
+        indices = self.page.get_word_index().query(self.rect.bbox, outside=outside)
+        if not remove_table_offset:
+            yield from words.iter_positions_and_text(indices)
+            return
+        boxes = self._to_table_coordinates(words.bboxes[indices])
+        yield from zip(*boxes.T.tolist(), words.take(indices).words())
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # the word cache is rebuilt from the page when needed
+        state["_word_cache"] = None
+        return state
+
+    def _get_table_words(self) -> tuple[WordArray, list[tuple]]:
+        """
+        The words of the table in table coordinates, like ``text_positions(remove_table_offset=True)``,
+        both as a :class:`.WordArray` and as a list of ``(x0, y0, x1, y1, "string")`` tuples.
+
+        Built once and shared by every stage of structure recognition.
+        It is rebuilt if the rect or angle of the table, or the words of the page, change.
+        Neither result should be modified.
+        """
+        page_words = self.page.get_word_array()
+        key = (tuple(self.rect.bbox), self.angle)
+        cache = getattr(self, "_word_cache", None)
+        if cache is None or cache[0] != key or cache[1]() is not page_words:
+            indices = self.page.get_word_index().query(self.rect.bbox)
+            taken = page_words.take(indices)
+            words = WordArray(
+                self._to_table_coordinates(taken.bboxes),
+                taken.text,
+                taken.offsets,
+                taken.blocknos,
+                taken.linenos,
+                taken.wordnos,
+            )
+            # only a weak reference to the page's words, which the page may drop
+            cache = (
+                key,
+                weakref.ref(page_words),
+                words,
+                list(words.iter_positions_and_text()),
             )
-        elif self.angle == 90:
-            for w in _old_generator(remove_table_offset=True, outside=outside):
-                x0, y0, x1, y1, text = w
-                x0, y0, x1, y1 = self.rect.height - y1, x0, self.rect.height - y0, x1
-                yield (x0, y0, x1, y1, text)
+            self._word_cache = cache
+        return cache[2], cache[3]
+
+    def _to_table_coordinates(self, boxes: np.ndarray) -> np.ndarray:
+        """
+        Transform (N, 4) page boxes (rotated and translated), so that the top-left corner of the table is (0, 0).
+        See :meth:`text_positions`.
+        """
+        xmin, ymin, xmax, ymax = self.rect.bbox
+        width, height = xmax - xmin, ymax - ymin
+        x0, y0, x1, y1 = (boxes - np.array([xmin, ymin, xmin, ymin])).T
+        if self.angle == 90:
+            x0, y0, x1, y1 = height - y1, x0, height - y0, x1
         elif self.angle == 180:
-            for w in _old_generator(remove_table_offset=True, outside=outside):
-                x0, y0, x1, y1, text = w
-                x0, y0, x1, y1 = (
-                    self.rect.width - x1,
-                    self.rect.height - y1,
-                    self.rect.width - x0,
-                    self.rect.height - y0,
-                )
-                yield (x0, y0, x1, y1, text)
+            x0, y0, x1, y1 = width - x1, height - y1, width - x0, height - y0
         elif self.angle == 270:
-            for w in _old_generator(remove_table_offset=True, outside=outside):
-                x0, y0, x1, y1, text = w
-                x0, y0, x1, y1 = y0, self.rect.width - x1, y1, self.rect.width - x0
-                yield (x0, y0, x1, y1, text)
+            x0, y0, x1, y1 = y0, width - x1, y1, width - x0
+        return np.stack([x0, y0, x1, y1], axis=1)
 
     def text(self):
         """
@@ -229,13 +342,9 @@ class CroppedTable:
             assert self._word_height != 0  # prevent infinite loop / disaster
             return self._word_height
         # get the distribution of word heights, rounded to the nearest tenth
-        word_heights = []
-        for xmin, ymin, xmax, ymax, text in self.text_positions(
-            remove_table_offset=True
-        ):
-            height = ymax - ymin
-            if height > smallest_supported_text_height:  # .1
-                word_heights.append(ymax - ymin)
+        words, _ = self._get_table_words()
+        word_heights = words.y1 - words.y0
+        word_heights = word_heights[word_heights > smallest_supported_text_height]
 
         # get the mode
         # from collections import Counter
@@ -247,7 +356,7 @@ class CroppedTable:
         # row_height = 0.95 * max(word_heights, key=word_heights.get)
 
         # actually no - use the median
-        if word_heights:
+        if len(word_heights):
             self._word_height = 0.95 * float(
                 np.median(word_heights)
             )  # convert np.float64 to float for consistency
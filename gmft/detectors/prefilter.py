@@ -0,0 +1,284 @@
+"""
+Cheap checks of whether a page could contain a table, run before the page is rendered for the detector.
+
+The built-in prefilters look for evidence of a table in what the pdf already provides:
+aligned columns of words in the text layer (:class:`WordAlignmentPrefilter`),
+ruling lines among the path objects (:class:`RulingLinePrefilter`),
+or keywords (:class:`KeywordPrefilter`). A page without any evidence is skipped.
+
+Prefilters are meant to be conservative: when in doubt (for instance, a scanned page without a text layer),
+they keep the page.
+"""
+
+import logging
+import re
+import threading
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Iterable, Union
+
+import numpy as np
+
+from gmft.pdf_bindings.base import BasePage
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PrefilterDecision:
+    """Whether to keep a page, and why."""
+
+    keep: bool
+    reason: str
+
+    def __bool__(self):
+        return self.keep
+
+
+class PagePrefilter(ABC):
+    """
+    Decides, before rasterization, whether a page could contain a table.
+
+    Subclasses implement :meth:`check`. Calling the prefilter checks the page, logs the decision
+    with its reason (at INFO level, to the ``gmft.detectors.prefilter`` logger) and counts it.
+    """
+
+    def __init__(self):
+        self.kept = 0
+        self.skipped = 0
+        # pages may be checked on prefetch threads
+        self._lock = threading.Lock()
+
+    @abstractmethod
+    def check(self, page: BasePage) -> PrefilterDecision:
+        raise NotImplementedError
+
+    def __call__(self, page: BasePage) -> PrefilterDecision:
+        decision = self.check(page)
+        with self._lock:
+            if decision.keep:
+                self.kept += 1
+            else:
+                self.skipped += 1
+        logger.info(
+            "%s page %d: %s",
+            "Kept" if decision.keep else "Skipped",
+            page.page_number,
+            decision.reason,
+        )
+        return decision
+
+    @property
+    def stats(self) -> dict:
+        return {"kept": self.kept, "skipped": self.skipped}
+
+
+class AnyPrefilter(PagePrefilter):
+    """
+    Keeps a page if any of the prefilters keeps it.
+    """
+
+    def __init__(self, prefilters: Iterable[PagePrefilter]):
+        super().__init__()
+        self.prefilters = list(prefilters)
+
+    def check(self, page: BasePage) -> PrefilterDecision:
+        reasons = []
+        for prefilter in self.prefilters:
+            decision = prefilter.check(page)
+            if decision.keep:
+                return decision
+            reasons.append(decision.reason)
+        return PrefilterDecision(False, "; ".join(reasons) or "no prefilters")
+
+
+class WordAlignmentPrefilter(PagePrefilter):
+    """
+    Looks for columns in the text layer.
+
+    First, the page layout is split into text columns at the vertical strips of whitespace
+    which (almost) no line crosses. Then words are grouped into lines within each text column,
+    and a line is split into cells wherever the gap between two words exceeds ``gap`` times
+    the typical word height. A column is a position where cells start (or end) on at least ``min_rows`` lines.
+
+    The page is kept if it has at least ``min_columns`` columns. It is also kept if its layout
+    has more than ``max_layout_columns`` text columns (likely a table filling the page),
+    or fewer than ``min_words`` words (for instance, a scanned page, whose tables only the detector can see).
+    """
+
+    def __init__(
+        self,
+        min_columns: int = 2,
+        min_rows: int = 3,
+        gap: float = 1.0,
+        tolerance: float = 2.0,
+        layout_fraction: float = 0.1,
+        max_layout_columns: int = 3,
+        min_words: int = 20,
+    ):
+        """
+        :param min_columns: number of aligned columns for the page to be kept
+        :param min_rows: number of lines whose cells must align to make a column
+        :param gap: gap between cells, relative to the median word height
+        :param tolerance: positions within this many points are aligned
+        :param layout_fraction: whitespace crossed by at most this fraction of the lines
+            (relative to the most crossed position) separates text columns
+        :param max_layout_columns: pages with more text columns are always kept
+        :param min_words: pages with fewer words are always kept
+        """
+        super().__init__()
+        self.min_columns = min_columns
+        self.min_rows = min_rows
+        self.gap = gap
+        self.tolerance = tolerance
+        self.layout_fraction = layout_fraction
+        self.max_layout_columns = max_layout_columns
+        self.min_words = min_words
+
+    def check(self, page: BasePage) -> PrefilterDecision:
+        bboxes = page.get_word_array().bboxes.astype(np.float64)
+        if len(bboxes) < self.min_words:
+            return PrefilterDecision(
+                True, f"only {len(bboxes)} words, the text layer may be missing"
+            )
+        x0, y0, x1, y1 = bboxes.T
+        height = float(np.median(y1 - y0))
+        if height <= 0:
+            return PrefilterDecision(True, "degenerate word heights")
+
+        gutters = self._find_gutters(x0, x1, page.width, min_width=self.gap * height)
+        if len(gutters) + 1 > self.max_layout_columns:
+            return PrefilterDecision(
+                True, f"{len(gutters) + 1} text columns, may be a table"
+            )
+
+        # group words into lines, by text column and vertical center
+        layout_column = np.searchsorted(gutters, (x0 + x1) / 2)
+        yc = (y0 + y1) / 2
+        by_y = np.lexsort((yc, layout_column))
+        new_line = (np.diff(layout_column[by_y]) != 0) | (
+            np.diff(yc[by_y]) > height / 2
+        )
+        line = np.empty(len(yc), dtype=np.int64)
+        line[by_y] = np.concatenate([[0], np.cumsum(new_line)])
+
+        # within each line, left to right
+        order = np.lexsort((x0, line))
+        line, x0, x1 = line[order], x0[order], x1[order]
+        same_line = line[1:] == line[:-1]
+        split = same_line & (x0[1:] - x1[:-1] > self.gap * height)
+
+        # cells start after a gap, and end before a gap or at the end of a line with gaps
+        split_lines = np.unique(line[1:][split])
+        ends_line = np.append(~same_line, True) & np.isin(line, split_lines)
+        columns = self._count_columns(x0[1:][split], line[1:][split])
+        columns += self._count_columns(
+            np.concatenate([x1[:-1][split], x1[ends_line]]),
+            np.concatenate([line[:-1][split], line[ends_line]]),
+        )
+        if columns >= self.min_columns:
+            return PrefilterDecision(
+                True, f"{columns} aligned columns over {len(split_lines)} lines"
+            )
+        return PrefilterDecision(False, f"{columns} aligned columns")
+
+    def _find_gutters(
+        self, x0: np.ndarray, x1: np.ndarray, page_width: float, min_width: float
+    ) -> np.ndarray:
+        """
+        Centers of the vertical strips of whitespace, at least min_width wide, between text columns.
+        """
+        # words off the page (for instance, hidden text) would make the coverage array arbitrarily long
+        x0 = np.clip(x0, 0, page_width)
+        x1 = np.clip(x1, 0, page_width)
+        # number of words over each point, in steps of 1pt
+        start = int(np.floor(x0.min()))
+        n = int(np.ceil(x1.max())) - start + 1
+        delta = np.zeros(n + 1, dtype=np.int64)
+        np.add.at(delta, np.floor(x0).astype(np.int64) - start, 1)
+        np.add.at(delta, np.ceil(x1).astype(np.int64) - start, -1)
+        coverage = np.cumsum(delta[:n])
+
+        sparse = coverage <= self.layout_fraction * coverage.max()
+        edges = np.flatnonzero(np.diff(np.concatenate([[0], sparse, [0]])))
+        runs = edges.reshape(-1, 2)
+        runs = runs[(runs[:, 1] - runs[:, 0] >= min_width) & (runs[:, 0] > 0)]
+        return start + runs.mean(axis=1)
+
+    def _count_columns(self, positions: np.ndarray, lines: np.ndarray) -> int:
+        """Number of clusters of positions, each on at least min_rows lines."""
+        if len(positions) == 0:
+            return 0
+        order = np.argsort(positions, kind="stable")
+        positions, lines = positions[order], lines[order]
+        cluster = np.concatenate([[0], np.cumsum(np.diff(positions) > self.tolerance)])
+        # number of distinct lines in each cluster
+        cluster_of_pair = np.unique(np.stack([cluster, lines]), axis=1)[0]
+        rows = np.bincount(cluster_of_pair)
+        return int(np.count_nonzero(rows >= self.min_rows))
+
+
+class RulingLinePrefilter(PagePrefilter):
+    """
+    Counts ruling lines: path objects which are thin horizontal or vertical lines,
+    like the rules of a booktabs table or the borders of a grid table.
+
+    The page is kept if it has at least ``min_lines`` of them.
+    Path objects are read from pages of a :class:`.PyPDFium2Document` or a :class:`.PDFTextDocument`.
+    Other pages (for instance, an :class:`.ImageOnlyPage`) cannot be checked, so they are kept.
+    """
+
+    def __init__(
+        self, min_lines: int = 3, max_thickness: float = 2.0, min_length: float = 20.0
+    ):
+        """
+        :param min_lines: number of ruling lines for the page to be kept
+        :param max_thickness: maximum thickness of a ruling line, in points
+        :param min_length: minimum length of a ruling line, in points
+        """
+        super().__init__()
+        self.min_lines = min_lines
+        self.max_thickness = max_thickness
+        self.min_length = min_length
+
+    def check(self, page: BasePage) -> PrefilterDecision:
+        get_path_sizes = getattr(page, "get_path_sizes", None)
+        if get_path_sizes is None:
+            return PrefilterDecision(True, "no path objects to check")
+        lines = sum(
+            1
+            for width, height in get_path_sizes()
+            if min(width, height) <= self.max_thickness
+            and max(width, height) >= self.min_length
+        )
+        return PrefilterDecision(lines >= self.min_lines, f"{lines} ruling lines")
+
+
+class KeywordPrefilter(PagePrefilter):
+    """
+    Keeps pages whose text matches any of the regular expressions, for instance ``r"\\bTable \\d+"``.
+    """
+
+    def __init__(
+        self, patterns: Iterable[Union[str, re.Pattern]], flags: int = re.IGNORECASE
+    ):
+        super().__init__()
+        self.patterns = [
+            pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, flags)
+            for pattern in patterns
+        ]
+
+    def check(self, page: BasePage) -> PrefilterDecision:
+        text = " ".join(page.get_word_array().words())
+        for pattern in self.patterns:
+            match = pattern.search(text)
+            if match:
+                return PrefilterDecision(True, f"matched {match.group(0)!r}")
+        return PrefilterDecision(False, "no keyword matched")
+
+
+def builtin_prefilter() -> PagePrefilter:
+    """
+    The built-in heuristics combined: keep pages with aligned columns of words, or with ruling lines.
+    """
+    return AnyPrefilter([WordAlignmentPrefilter(), RulingLinePrefilter()])
@@ -1,8 +1,11 @@
 import copy
 from dataclasses import dataclass
-import torch
+from typing import Iterable
+
+from PIL.Image import Image as PILImage
 from gmft.core._dataclasses import with_config
 from gmft.core.ml import _resolve_device
+from gmft.core.ml.processing import _predict
 from gmft.detectors.base import BaseDetector, CroppedTable, RotatedCroppedTable
 from gmft.base import Rect
 
@@ -28,8 +31,7 @@ class TATRDetector(BaseDetector[TATRDetectorConfig]):
         """
 
         import transformers
-        from transformers import AutoImageProcessor
-        from gmft.core.ml._huggingface import _load_tatr_from_pretrained
+        from gmft.core.ml.registry import get_model_registry
 
         # future-proofing: allow subclasses for TableDetector to have different architectures
         if not default_implementation:
@@ -42,14 +44,18 @@ class TATRDetector(BaseDetector[TATRDetectorConfig]):
         if not config.warn_uninitialized_weights:
             previous_verbosity = transformers.logging.get_verbosity()
             transformers.logging.set_verbosity(transformers.logging.ERROR)
-        self.image_processor = AutoImageProcessor.from_pretrained(
-            config.image_processor_path
-        )
+        registry = get_model_registry()
+        self.image_processor = registry.get_image_processor(config.image_processor_path)
 
         revision = "no_timm" if config.no_timm else None
-        self.detector = _load_tatr_from_pretrained(
-            config.detector_path, revision=revision
-        ).to(_resolve_device(config.torch_device))
+        self.detector = registry.get_model(
+            config.detector_path,
+            revision=revision,
+            device=_resolve_device(config.torch_device),
+            backend=config.backend,
+            onnx_path=config.onnx_path,
+            quantization=config.quantization,
+        )
 
         if not config.warn_uninitialized_weights:
             transformers.logging.set_verbosity(previous_verbosity)
@@ -71,25 +77,79 @@ class TATRDetector(BaseDetector[TATRDetectorConfig]):
         """
         config = with_config(self.config, config_overrides)
 
-        img = page.get_image(
-            72, rect=rect
-        )  # use standard dpi = 72, which means we don't need any scaling
-        encoding = self.image_processor(img, return_tensors="pt").to(
-            _resolve_device(self.config.torch_device)
-        )
-        with torch.no_grad():
-            outputs = self.detector(**encoding)
+        img = page.get_image(config.dpi, rect=rect)
+        return self._detect_images([page], [img], config)[0]
+
+    def extract_batch(
+        self,
+        pages: Iterable[BasePage],
+        batch_size: int = 8,
+        config_overrides: TATRDetectorConfig = None,
+    ) -> list[list[CroppedTable]]:
+        """
+        Detect tables in several pages, running the model on batch_size pages at a time.
+
+        The page images are resized and padded to a common size, with a pixel mask,
+        as in the model's training. Results can therefore differ slightly from :meth:`extract`,
+        which runs one page at a time.
+
+        :param pages: pages to detect tables in
+        :param batch_size: number of pages per forward pass
+        :param config_overrides: Optional config overrides for this extraction
+        :return: list of CroppedTable objects for each page, in order
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        config = with_config(self.config, config_overrides)
+
+        results = []
+        batch = []
+        for page in pages:
+            batch.append(page)
+            if len(batch) == batch_size:
+                results += self._detect_images(
+                    batch, [p.get_image(config.dpi) for p in batch], config
+                )
+                batch = []
+        if batch:
+            results += self._detect_images(
+                batch, [p.get_image(config.dpi) for p in batch], config
+            )
+        return results
+
+    def _detect_images(
+        self,
+        pages: list[BasePage],
+        images: list[PILImage],
+        config: TATRDetectorConfig,
+    ) -> list[list[CroppedTable]]:
+        """
+        Run the model on a batch of page images (rendered at config.dpi), in one forward pass.
+        """
         # keep only predictions of queries with 0.9+ confidence (excluding no-object class)
-        target_sizes = torch.tensor([img.size[::-1]])
-        threshold = config.detector_base_threshold
-        results = self.image_processor.post_process_object_detection(
-            outputs, threshold=threshold, target_sizes=target_sizes
-        )[0]
+        results = _predict(
+            self.detector,
+            images,
+            threshold=config.detector_base_threshold,
+            preprocessing=config.preprocessing,
+            image_processor=self.image_processor,
+            device=_resolve_device(self.config.torch_device),
+            size=config.model_input_size,
+        )
+        if config.dpi != 72:
+            # at dpi = 72, pixels are pdf units
+            scale = 72 / config.dpi
+            for result in results:
+                result["boxes"] = [[x * scale for x in box] for box in result["boxes"]]
+        return [self._to_tables(page, result) for page, result in zip(pages, results)]
+
+    @staticmethod
+    def _to_tables(page: BasePage, results: dict) -> list[CroppedTable]:
         tables = []
         for i in range(len(results["boxes"])):
-            bbox = results["boxes"][i].tolist()
-            confidence_score = results["scores"][i].item()
-            label = results["labels"][i].item()
+            bbox = results["boxes"][i]
+            confidence_score = results["scores"][i]
+            label = results["labels"][i]
             if label == 1:
                 tables.append(
                     RotatedCroppedTable(page, bbox, confidence_score, 90, label)
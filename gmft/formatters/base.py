@@ -1,11 +1,16 @@
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
+import numpy as np
 import pandas as pd
 
 from gmft.core.ml.prediction import TablePredictions
 from gmft.pdf_bindings.base import BasePage
 from gmft.detectors.base import CroppedTable, RotatedCroppedTable
 
+if TYPE_CHECKING:
+    from gmft.impl.tatr.config import TATRFormatConfig
+
 
 class FormattedTable(RotatedCroppedTable):
     """
@@ -30,6 +35,7 @@ class FormattedTable(RotatedCroppedTable):
             self._img_margin = None
             self._word_height = None
             self._captions = None
+            self._word_cache = None
             return
 
         # create shallow copy
@@ -53,6 +59,8 @@ class FormattedTable(RotatedCroppedTable):
         self._img_margin = cropped_table._img_margin
         self._word_height = cropped_table._word_height
         self._captions = cropped_table._captions
+        # same rect and angle, so the words can be shared
+        self._word_cache = getattr(cropped_table, "_word_cache", None)
 
     def df(self, recalculate=False, config_overrides=None) -> pd.DataFrame:
         """
@@ -150,3 +158,101 @@ def _normalize_bbox(
         bbox[3] - used_margin[1],
     ]
     return bbox
+
+
+def _normalize_boxes(
+    boxes: np.ndarray,
+    used_scale_factor: float,
+    used_padding: tuple[float, float],
+    used_margin: tuple[float, float] = None,
+) -> np.ndarray:
+    """
+    Vectorized :func:`_normalize_bbox`, for an array of boxes of shape (N, 4).
+    """
+    if used_margin is None:
+        used_margin = (0, 0)
+    padding = np.tile(np.asarray(used_padding[:2], dtype=boxes.dtype), 2)
+    margin = np.tile(np.asarray(used_margin[:2], dtype=boxes.dtype), 2)
+    return (boxes - padding) / used_scale_factor - margin
+
+
+def _auto_dpi(
+    table: CroppedTable,
+    padding="auto",
+    margin=None,
+    size: dict = None,
+    max_pixels: int = None,
+) -> float:
+    """
+    The dpi at which the image of the table (with margin and padding) comes out at the size
+    the model resizes it to, or with at most max_pixels pixels.
+
+    :param size: the model's input size ``{"shortest_edge", "longest_edge"}``. Defaults to the Table Transformer's.
+    """
+    from gmft.core.ml.processing import DETR_LONGEST_EDGE, DETR_SHORTEST_EDGE
+
+    size = size or {}
+    shortest_edge = size.get("shortest_edge", DETR_SHORTEST_EDGE)
+    longest_edge = size.get("longest_edge", DETR_LONGEST_EDGE)
+
+    rect = table._margin_rect(margin)
+    # padding is added after rotation
+    if table.angle in (90, 270):
+        width, height = rect.height, rect.width
+    else:
+        width, height = rect.width, rect.height
+    width, height = max(width, 1.0), max(height, 1.0)
+    fixed = (0, 0)  # padding in pixels
+    if padding == "auto":
+        # 10% of the larger side, on each side
+        pad = 0.2 * max(width, height)
+        width, height = width + pad, height + pad
+    elif padding is not None:
+        fixed = (padding[0] + padding[2], padding[1] + padding[3])
+
+    if width <= height:
+        scale = min(
+            (shortest_edge - fixed[0]) / width, (longest_edge - fixed[1]) / height
+        )
+    else:
+        scale = min(
+            (shortest_edge - fixed[1]) / height, (longest_edge - fixed[0]) / width
+        )
+    if max_pixels is not None:
+        scale = min(scale, (max_pixels / (width * height)) ** 0.5)
+    return 72 * max(scale, 0.1)
+
+
+def _resolve_dpi(
+    table: CroppedTable, dpi, padding, margin, config: "TATRFormatConfig"
+) -> float:
+    """
+    The dpi to render table at: dpi, or with dpi='auto', :func:`_auto_dpi` for the config's model input size.
+    """
+    if dpi != "auto":
+        return dpi
+    return _auto_dpi(
+        table,
+        padding=padding,
+        margin=margin,
+        size=config.model_input_size,
+        max_pixels=config.max_pixels,
+    )
+
+
+def _store_raw_predictions(
+    table: "FormattedTable", raw: np.ndarray, scale_factor: float, threshold: float
+):
+    """
+    Attach the model's raw predictions for table (in pixels of its image) as predictions.raw,
+    in the coordinates of predictions.tatr.
+    """
+    raw = raw.copy()
+    raw[:, -4:] = _normalize_boxes(
+        raw[:, -4:],
+        used_scale_factor=scale_factor,
+        used_padding=table._img_padding,
+        used_margin=table._img_margin,
+    )
+    table.predictions.raw = raw.astype(np.float16)
+    table.predictions.threshold = threshold
@@ -13,12 +13,16 @@ from gmft.algorithm.dividers import (
     get_good_between_dividers,
 )
 from gmft.core.io.serial.dicts import (
+    _encode_raw_predictions,
     _extract_effective,
     _extract_fctn_results,
     _extract_indices,
+    _extract_raw_predictions,
 )
 from gmft.core.legacy.fctn_results import LegacyFctnResults
 from gmft.core.ml import _resolve_device
+from gmft.core.ml.batching import _aspect_ratio_batches
+from gmft.core.ml.processing import _predict
 from gmft.core.ml.prediction import (
     TablePredictions,
     _empty_effective_predictions,
@@ -26,20 +30,25 @@ from gmft.core.ml.prediction import (
 )
 from gmft.detectors.base import CroppedTable, RotatedCroppedTable
 from gmft.impl.ditr.config import DITRFormatConfig
-from gmft.formatters.base import FormattedTable, TableFormatter, _normalize_bbox
+from gmft.formatters.base import (
+    FormattedTable,
+    TableFormatter,
+    _normalize_bbox,
+    _resolve_dpi,
+    _store_raw_predictions,
+)
 from gmft.formatters.histogram import HistogramFormattedTable
 from gmft.pdf_bindings.base import BasePage
 
 
+from gmft.algorithm.nms import NMSMethod, non_maxima_suppression
 from gmft.algorithm.structure import (
-    _iob,
     _non_maxima_suppression,
     _semantic_spanning_fill,
     _split_spanning_cells,
 )
 from gmft.table_visualization import plot_results_unwr, plot_shaded_boxes
 
-import torch
 from transformers import DetrForObjectDetection
 
 
@@ -106,6 +115,8 @@ class DITRFormattedTable(HistogramFormattedTable, LegacyFctnResults):
         Recompute the internal dataframe.
         """
         config = with_config(self.config, config)
+        if self.predictions.raw is not None:
+            self.predictions.rethreshold(config.formatter_base_threshold)
         self._df = ditr_extract_to_df(self, config=config)
         return self._df
 
@@ -148,6 +159,9 @@ class DITRFormattedTable(HistogramFormattedTable, LegacyFctnResults):
         if self.predictions.status == "ready":
             optional["predictions.effective"] = self.predictions.effective
             optional["predictions.indices"] = self.predictions.indices
+        if self.predictions.raw is not None:
+            optional["predictions.raw"] = _encode_raw_predictions(self.predictions.raw)
+            optional["predictions.threshold"] = self.predictions.threshold
         return {
             **parent,
             **{
@@ -177,6 +191,9 @@ class DITRFormattedTable(HistogramFormattedTable, LegacyFctnResults):
             results,
             config=config,
         )
+        table.predictions.raw = _extract_raw_predictions(d)
+        if table.predictions.raw is not None:
+            table.predictions.threshold = d["predictions.threshold"]
         table.recompute()
         table.outliers = d.get("outliers", None)
         table.predictions.indices = _extract_indices(d)
@@ -195,8 +212,7 @@ class DITRFormatter(TableFormatter):
 
     def __init__(self, config: DITRFormatConfig = None):
         import transformers
-        from transformers import AutoImageProcessor
-        from gmft.core.ml._huggingface import _load_tatr_from_pretrained
+        from gmft.core.ml.registry import get_model_registry
 
         if config is None:
             config = DITRFormatConfig()
@@ -207,12 +223,15 @@ class DITRFormatter(TableFormatter):
         if not config.warn_uninitialized_weights:
             previous_verbosity = transformers.logging.get_verbosity()
             transformers.logging.set_verbosity(transformers.logging.ERROR)
-        self.image_processor = AutoImageProcessor.from_pretrained(
-            config.image_processor_path
-        )
+        registry = get_model_registry()
+        self.image_processor = registry.get_image_processor(config.image_processor_path)
         # might need revision: "no_timm"
-        self.structor = _load_tatr_from_pretrained(config.formatter_path).to(
-            _resolve_device(config.torch_device)
+        self.structor = registry.get_model(
+            config.formatter_path,
+            device=_resolve_device(config.torch_device),
+            backend=config.backend,
+            onnx_path=config.onnx_path,
+            quantization=config.quantization,
         )
         self.config = config
         if not config.warn_uninitialized_weights:
@@ -221,57 +240,111 @@ class DITRFormatter(TableFormatter):
     def extract(
         self,
         table: CroppedTable,
-        dpi=144,
+        dpi=None,
         padding="auto",
         margin=None,
         config_overrides=None,
     ) -> DITRFormattedTable:
         """
         Extract the data from the table.
+
+        :param dpi: resolution at which the table is rendered, or 'auto' (see :attr:`.TATRFormatConfig.dpi`).
+            Defaults to config.dpi (144).
         """
 
         config = with_config(self.config, config_overrides)
+        if dpi is None:
+            dpi = config.dpi
+        dpi = _resolve_dpi(table, dpi, padding, margin, config)
 
-        image = table.image(dpi=dpi, padding=padding, margin=margin)  # (20, 20, 20, 20)
-        padding = table._img_padding
-        margin = table._img_margin
-
-        scale_factor = dpi / 72
-        encoding = self.image_processor(
-            image,
-            size={"shortest_edge": 800, "longest_edge": 1333},
-            return_tensors="pt",
-        ).to(_resolve_device(self.config.torch_device))
-        with torch.no_grad():
-            outputs = self.structor(**encoding)
-
-        target_sizes = [image.size[::-1]]
-        results = self.image_processor.post_process_object_detection(
-            outputs,
-            threshold=config.formatter_base_threshold,
-            target_sizes=target_sizes,
-        )[0]
-
-        # return formatted_table
-        results = {k: v.tolist() for k, v in results.items()}
-
-        # normalize results w.r.t. padding and scale factor
-        for i, bbox in enumerate(results["boxes"]):
-            results["boxes"][i] = _normalize_bbox(
-                bbox,
-                used_scale_factor=scale_factor,
-                used_padding=padding,
-                used_margin=margin,
-            )
+        image = table.image_array(dpi=dpi, padding=padding, margin=margin)
+        return self._extract_images([table], [image], [dpi], config)[0]
 
-        formatted_table = DITRFormattedTable(
-            table,
-            None,
-            results,
-            config=config,
+    def extract_batch(
+        self,
+        tables: list[CroppedTable],
+        batch_size: int = 8,
+        dpi=None,
+        padding="auto",
+        margin=None,
+        config_overrides=None,
+    ) -> list[DITRFormattedTable]:
+        """
+        Extract the data from several tables, running the model on batch_size tables at a time.
+
+        Batched images are padded to a common size, so tables are grouped by aspect ratio to keep the padding small.
+        Since the model sees padded, masked inputs, results can differ slightly from :meth:`extract`.
+
+        :return: formatted tables, in the order of tables
+        """
+        config = with_config(self.config, config_overrides)
+        if dpi is None:
+            dpi = config.dpi
+
+        dpis = [_resolve_dpi(table, dpi, padding, margin, config) for table in tables]
+        results = [None] * len(tables)
+        sizes = [(table.width, table.height) for table in tables]
+        for batch in _aspect_ratio_batches(sizes, batch_size):
+            batch_tables = [tables[i] for i in batch]
+            batch_dpis = [dpis[i] for i in batch]
+            images = [
+                table.image_array(dpi=table_dpi, padding=padding, margin=margin)
+                for table, table_dpi in zip(batch_tables, batch_dpis)
+            ]
+            formatted = self._extract_images(batch_tables, images, batch_dpis, config)
+            for i, ft in zip(batch, formatted):
+                results[i] = ft
+        return results
+
+    def _extract_images(
+        self,
+        tables: list[CroppedTable],
+        images: list[np.ndarray],
+        dpis: list[float],
+        config: DITRFormatConfig,
+    ) -> list[DITRFormattedTable]:
+        """
+        Run the model on a batch of table images produced by :meth:`.CroppedTable.image_array`, in one forward pass.
+
+        :param dpis: the dpi at which each image was rendered
+        """
+        batch_results = _predict(
+            self.structor,
+            images,
+            threshold=config.formatter_base_threshold,
+            preprocessing=config.preprocessing,
+            image_processor=self.image_processor,
+            device=_resolve_device(self.config.torch_device),
+            size=config.model_input_size,
+            keep_raw=config.keep_raw_predictions,
         )
-        formatted_table.recompute()
-        return formatted_table
+
+        formatted_tables = []
+        for table, results, dpi in zip(tables, batch_results, dpis):
+            scale_factor = dpi / 72
+            raw = results.pop("raw", None)
+            # normalize results w.r.t. padding and scale factor
+            for i, bbox in enumerate(results["boxes"]):
+                results["boxes"][i] = _normalize_bbox(
+                    bbox,
+                    used_scale_factor=scale_factor,
+                    used_padding=table._img_padding,
+                    used_margin=table._img_margin,
+                )
+
+            formatted_table = DITRFormattedTable(
+                table,
+                None,
+                results,
+                config=config,
+            )
+            if raw is not None:
+                _store_raw_predictions(
+                    formatted_table, raw, scale_factor, config.formatter_base_threshold
+                )
+            formatted_table.recompute()
+            formatted_tables.append(formatted_table)
+        return formatted_tables
 
 
 class DITRLabel:
@@ -320,23 +393,20 @@ def _determine_headers_and_projecting(
     return header_indices, projecting_indices
 
 
-def _non_maxima_suppression_t(sorted_rows: list[tuple], overlap_threshold=0.1):
+def _non_maxima_suppression_t(
+    sorted_rows: list[tuple], overlap_threshold=0.1, method: NMSMethod = "adjacent"
+):
     """
     accepts (xmin, ymin, xmax, ymax, confidence)
     """
-    num_removed = 0
-    i = 1
-    while i < len(sorted_rows):
-        prev = sorted_rows[i - 1]
-        cur = sorted_rows[i]
-        if _iob(prev[:4], cur[:4]) > overlap_threshold:
-            if prev[4] > cur[4]:
-                sorted_rows.pop(i)
-            else:
-                sorted_rows.pop(i - 1)
-            num_removed += 1
-        else:
-            i += 1
+    keep = non_maxima_suppression(
+        [row[:4] for row in sorted_rows],
+        [row[4] for row in sorted_rows],
+        overlap_threshold=overlap_threshold,
+        method=method,
+    )
+    num_removed = len(sorted_rows) - len(keep)
+    sorted_rows[:] = [sorted_rows[i] for i in keep.tolist()]
     return num_removed
 
 
@@ -456,10 +526,14 @@ def ditr_extract_to_df(table: DITRFormattedTable, config: DITRFormatConfig = Non
 
     # apply nms
     _non_maxima_suppression_t(
-        row_divider_boxes, overlap_threshold=config._nms_overlap_threshold
+        row_divider_boxes,
+        overlap_threshold=config._nms_overlap_threshold,
+        method=config._nms_method,
     )
     _non_maxima_suppression_t(
-        col_divider_boxes, overlap_threshold=config._nms_overlap_threshold
+        col_divider_boxes,
+        overlap_threshold=config._nms_overlap_threshold,
+        method=config._nms_method,
     )
 
     row_dividers = [(y0 + y1) / 2 for x0, y0, x1, y1, _ in row_divider_boxes]
@@ -550,14 +624,17 @@ def ditr_extract_to_df(table: DITRFormattedTable, config: DITRFormatConfig = Non
         _non_maxima_suppression(
             sorted_hier_top_headers,
             overlap_threshold=config._nms_overlap_threshold_larger,
+            method=config._nms_method,
         )
         _non_maxima_suppression(
             sorted_monosemantic_top_headers,
             overlap_threshold=config._nms_overlap_threshold_larger,
+            method=config._nms_method,
         )
         _non_maxima_suppression(
             sorted_hier_left_headers,
             overlap_threshold=config._nms_overlap_threshold_larger,
+            method=config._nms_method,
         )
         hier_left_idxs = _semantic_spanning_fill(
             table_array,
@@ -149,19 +149,14 @@ class HistogramFormatter(BaseFormatter):
         get the means of the sep lines for stability
         done
         """
-        words = list(
-            table.text_positions(remove_table_offset=True)
-        )  # list of tuples of (text, x0, y0, x1, y1)
-        x_histogram = IntervalHistogram()
-        y_histogram = IntervalHistogram()
-        for x0, y0, x1, y1, text in words:
-            # round to 0.05
-            x0 = round(x0, 2)
-            x1 = round(x1, 2)
-            y0 = round(y0, 2)
-            y1 = round(y1, 2)
-            x_histogram.append((x0, x1))  # x bounds are col separators
-            y_histogram.append((y0, y1))  # y bounds are row separators
+        words, positions = table._get_table_words()
+        # round to 0.01
+        x0s, y0s, x1s, y1s = (
+            [round(x, 2) for x in column] for column in words.bboxes.T.tolist()
+        )
+        # x bounds are col separators, y bounds are row separators
+        x_histogram = IntervalHistogram.from_intervals(x0s, x1s)
+        y_histogram = IntervalHistogram.from_intervals(y0s, y1s)
 
         x_sep_threshold = self.decide_histogram_threshold(x_histogram, is_row=False)
         x_sep_bounds = list(x_histogram.iter_intervals_below(x_sep_threshold))
@@ -192,7 +187,7 @@ class HistogramFormatter(BaseFormatter):
         table = HistogramFormattedTable(
             copy.copy(table), None, irvl_results, config=self.config
         )
-        table.recompute(_words=words)
+        table.recompute(_words=positions)
         if _populate_histograms:
             table.x_histogram = x_histogram
             table.y_histogram = y_histogram
@@ -1,3 +1,6 @@
+import numpy as np
+
+from gmft.base import BoxArray
 from gmft.formatters.base import FormattedTable
 from gmft.formatters.page.base import FormattedPage
 from gmft.formatters.page.components import Paragraph, TableComponent
@@ -20,9 +23,16 @@ def embed_tables_into_page(
 
     pagestuff = []
 
+    # the first table that each word intersects, if any
+    words = page.get_word_array()
+    hits = BoxArray(words.bboxes).is_intersecting(
+        BoxArray([table.rect for table in tables])
+    )
+    word_tables = np.where(hits.any(axis=1), hits.argmax(axis=1), -1).tolist()
+
     text_builder = ""
     done = [False for _ in tables]
-    for (
+    for j, (
         x0,
         y0,
         x1,
@@ -31,16 +41,14 @@ def embed_tables_into_page(
         blockno,
         lineno,
         wordno,
-    ) in page._get_positions_and_text_and_breaks():
-        for j, table in enumerate(tables):
-            if table.rect.is_intersecting((x0, y0, x1, y1)):
-                if not done[j]:
-                    # builder = builder +
-                    pagestuff.append(Paragraph(text_builder))
-                    text_builder = ""
-                    pagestuff.append(TableComponent(table))
-                    done[j] = True
-                break
+    ) in zip(word_tables, words.iter_positions_and_text_and_breaks()):
+        if j >= 0:
+            if not done[j]:
+                # builder = builder +
+                pagestuff.append(Paragraph(text_builder))
+                text_builder = ""
+                pagestuff.append(TableComponent(tables[j]))
+                done[j] = True
         else:
             # no table found
             if wordno == 0:
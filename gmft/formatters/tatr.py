@@ -3,20 +3,34 @@ import logging
 from typing import List, Union
 
 from gmft.core._dataclasses import non_defaults_only, with_config
-from gmft.core.io.serial.dicts import _extract_fctn_results, _extract_indices
+from gmft.core.io.serial.dicts import (
+    _encode_raw_predictions,
+    _extract_fctn_results,
+    _extract_indices,
+    _extract_raw_predictions,
+)
 from gmft.core.legacy.fctn_results import LegacyFctnResults
 from gmft.core.ml import _resolve_device
+from gmft.core.ml.batching import _aspect_ratio_batches
+from gmft.core.ml.processing import _predict
 from gmft.core.ml.prediction import (
     BboxPrediction,
     TablePredictions,
     _empty_effective_predictions,
     _empty_indices_predictions,
 )
+from gmft.base import Rect
 from gmft.detectors.base import CroppedTable, RotatedCroppedTable
 from gmft.impl.tatr.config import TATRFormatConfig
-from gmft.formatters.base import FormattedTable, TableFormatter, _normalize_bbox
+from gmft.formatters.base import (
+    FormattedTable,
+    TableFormatter,
+    _normalize_bbox,
+    _resolve_dpi,
+    _store_raw_predictions,
+)
 from gmft.pdf_bindings.base import BasePage
-import torch
+import numpy as np
 
 
 from gmft.algorithm.structure import extract_to_df
@@ -112,6 +126,8 @@ class TATRFormattedTable(FormattedTable, LegacyFctnResults):
                 handler.setFormatter(formatter)
                 gmft_logger.addHandler(handler)
 
+        if self.predictions.raw is not None:
+            self.predictions.rethreshold(config.formatter_base_threshold)
         self._df = extract_to_df(self, config=config)
         return self._df
 
@@ -196,6 +212,9 @@ class TATRFormattedTable(FormattedTable, LegacyFctnResults):
         optional = {}
         if self.predictions.indices:
             optional["predictions.indices"] = self.predictions.indices
+        if self.predictions.raw is not None:
+            optional["predictions.raw"] = _encode_raw_predictions(self.predictions.raw)
+            optional["predictions.threshold"] = self.predictions.threshold
         return {
             **parent,
             **{
@@ -225,6 +244,9 @@ class TATRFormattedTable(FormattedTable, LegacyFctnResults):
         )
         table.outliers = d.get("outliers", None)
         table.predictions.indices = _extract_indices(d)
+        table.predictions.raw = _extract_raw_predictions(d)
+        if table.predictions.raw is not None:
+            table.predictions.threshold = d["predictions.threshold"]
         return table
 
 
@@ -237,8 +259,7 @@ class TATRFormatter(TableFormatter):
 
     def __init__(self, config: TATRFormatConfig = None):
         import transformers
-        from transformers import AutoImageProcessor
-        from gmft.core.ml._huggingface import _load_tatr_from_pretrained
+        from gmft.core.ml.registry import get_model_registry
 
         if config is None:
             config = TATRFormatConfig()
@@ -249,13 +270,17 @@ class TATRFormatter(TableFormatter):
         if not config.warn_uninitialized_weights:
             previous_verbosity = transformers.logging.get_verbosity()
             transformers.logging.set_verbosity(transformers.logging.ERROR)
-        self.image_processor = AutoImageProcessor.from_pretrained(
-            config.image_processor_path
-        )
+        registry = get_model_registry()
+        self.image_processor = registry.get_image_processor(config.image_processor_path)
         revision = "no_timm" if config.no_timm else None
-        self.structor = _load_tatr_from_pretrained(
-            config.formatter_path, revision=revision
-        ).to(_resolve_device(config.torch_device))
+        self.structor = registry.get_model(
+            config.formatter_path,
+            revision=revision,
+            device=_resolve_device(config.torch_device),
+            backend=config.backend,
+            onnx_path=config.onnx_path,
+            quantization=config.quantization,
+        )
         self.config = config
         if not config.warn_uninitialized_weights:
             transformers.logging.set_verbosity(previous_verbosity)
@@ -263,60 +288,180 @@ class TATRFormatter(TableFormatter):
     def extract(
         self,
         table: CroppedTable,
-        dpi=144,
+        dpi=None,
         padding="auto",
         margin=None,
         config_overrides=None,
     ) -> TATRFormattedTable:
         """
         Extract the data from the table.
+
+        :param dpi: resolution at which the table is rendered, or 'auto' (see :attr:`.TATRFormatConfig.dpi`).
+            Defaults to config.dpi (144).
         """
 
         config = with_config(self.config, config_overrides)
+        if dpi is None:
+            dpi = config.dpi
+        dpi = _resolve_dpi(table, dpi, padding, margin, config)
 
-        image = table.image(dpi=dpi, padding=padding, margin=margin)  # (20, 20, 20, 20)
-        padding = table._img_padding
-        margin = table._img_margin
+        image = table.image_array(dpi=dpi, padding=padding, margin=margin)
+        return self._extract_image(table, image, dpi, config)
 
-        scale_factor = dpi / 72
-        encoding = self.image_processor(image, return_tensors="pt").to(
-            _resolve_device(self.config.torch_device)
-        )
-        with torch.no_grad():
-            outputs = self.structor(**encoding)
+    def extract_page(
+        self,
+        tables: list[CroppedTable],
+        dpi=None,
+        padding="auto",
+        margin=None,
+        config_overrides=None,
+    ) -> list[TATRFormattedTable]:
+        """
+        Extract the data from several tables, typically all the tables of a page.
+
+        Where the table images of a page overlap enough (for instance, adjacent tables with margins),
+        the region spanning them is rendered once, and each table image (crop, margin, rotation, padding)
+        is cut out of that rendering. Otherwise, each table is rendered as in :meth:`extract`,
+        since pdfium only rasterizes the requested region anyway.
+        Images cut from a shared rendering may differ from :meth:`extract`'s by a few antialiased pixels.
+        With dpi='auto', each table has its own dpi, so each table is rendered separately.
+        """
+        config = with_config(self.config, config_overrides)
+        if dpi is None:
+            dpi = config.dpi
+        dpis = [_resolve_dpi(table, dpi, padding, margin, config) for table in tables]
+
+        by_page: dict[int, list[int]] = {}
+        for i, table in enumerate(tables):
+            by_page.setdefault(id(table.page), []).append(i)
+
+        images = [None] * len(tables)
+        for indices in by_page.values():
+            page = tables[indices[0]].page
+            rects = [tables[i]._margin_rect(margin) for i in indices]
+            region = (
+                min(r.xmin for r in rects),
+                min(r.ymin for r in rects),
+                max(r.xmax for r in rects),
+                max(r.ymax for r in rects),
+            )
+            region_image = None
+            if (
+                len(rects) > 1
+                and dpi != "auto"
+                and Rect(region).area <= sum(r.area for r in rects)
+            ):
+                region_image = page.get_array(dpi=dpi, rect=Rect(region))
+            for i in indices:
+                images[i] = tables[i].image_array(
+                    dpi=dpis[i],
+                    padding=padding,
+                    margin=margin,
+                    page_image=region_image,
+                    page_image_bbox=region,
+                )
+        return [
+            self._extract_image(table, image, table_dpi, config)
+            for table, image, table_dpi in zip(tables, images, dpis)
+        ]
+
+    def extract_batch(
+        self,
+        tables: list[CroppedTable],
+        batch_size: int = 8,
+        dpi=None,
+        padding="auto",
+        margin=None,
+        config_overrides=None,
+    ) -> list[TATRFormattedTable]:
+        """
+        Extract the data from several tables, running the model on batch_size tables at a time.
 
-        target_sizes = [image.size[::-1]]
+        Batched images are padded to a common size, so tables are grouped by aspect ratio to keep the padding small.
+        Since the model sees padded, masked inputs, results can differ slightly from :meth:`extract`.
+
+        :return: formatted tables, in the order of tables
+        """
+        config = with_config(self.config, config_overrides)
+        if dpi is None:
+            dpi = config.dpi
+
+        dpis = [_resolve_dpi(table, dpi, padding, margin, config) for table in tables]
+        results = [None] * len(tables)
+        sizes = [(table.width, table.height) for table in tables]
+        for batch in _aspect_ratio_batches(sizes, batch_size):
+            batch_tables = [tables[i] for i in batch]
+            batch_dpis = [dpis[i] for i in batch]
+            images = [
+                table.image_array(dpi=table_dpi, padding=padding, margin=margin)
+                for table, table_dpi in zip(batch_tables, batch_dpis)
+            ]
+            formatted = self._extract_images(batch_tables, images, batch_dpis, config)
+            for i, ft in zip(batch, formatted):
+                results[i] = ft
+        return results
+
+    def _extract_image(
+        self,
+        table: CroppedTable,
+        image: np.ndarray,
+        dpi,
+        config: TATRFormatConfig,
+    ) -> TATRFormattedTable:
+        """
+        Run the model on the table image produced by :meth:`.CroppedTable.image_array`.
+        """
+        return self._extract_images([table], [image], [dpi], config)[0]
+
+    def _extract_images(
+        self,
+        tables: list[CroppedTable],
+        images: list[np.ndarray],
+        dpis: list[float],
+        config: TATRFormatConfig,
+    ) -> list[TATRFormattedTable]:
+        """
+        Run the model on a batch of table images produced by :meth:`.CroppedTable.image_array`, in one forward pass.
+
+        :param dpis: the dpi at which each image was rendered
+        """
         # threshold = 0.3
         # note that a LOW threshold is good because the model is overzealous in
         # but since we find the highest-intersecting row, same-row elements still tend to stay together
         # this is better than having a high threshold, because if we have fewer rows than expected, we merge cells
         # losing information
-        results = self.image_processor.post_process_object_detection(
-            outputs,
+        batch_results = _predict(
+            self.structor,
+            images,
             threshold=config.formatter_base_threshold,
-            target_sizes=target_sizes,
-        )[0]
+            preprocessing=config.preprocessing,
+            image_processor=self.image_processor,
+            device=_resolve_device(self.config.torch_device),
+            size=config.model_input_size,
+            keep_raw=config.keep_raw_predictions,
+        )
 
         # create a new FormattedTable instance with the cropped table and the dataframe
-
-        # return formatted_table
-        results = {k: v.tolist() for k, v in results.items()}
-
-        # normalize results w.r.t. padding and scale factor
-        for i, bbox in enumerate(results["boxes"]):
-            results["boxes"][i] = _normalize_bbox(
-                bbox,
-                used_scale_factor=scale_factor,
-                used_padding=padding,
-                used_margin=margin,
-            )
-
-        formatted_table = TATRFormattedTable(
-            table,
-            results,
-            config=config,
-        )
-        return formatted_table
+        formatted_tables = []
+        for table, results, dpi in zip(tables, batch_results, dpis):
+            scale_factor = dpi / 72
+            raw = results.pop("raw", None)
+            # normalize results w.r.t. padding and scale factor
+            for i, bbox in enumerate(results["boxes"]):
+                results["boxes"][i] = _normalize_bbox(
+                    bbox,
+                    used_scale_factor=scale_factor,
+                    used_padding=table._img_padding,
+                    used_margin=table._img_margin,
+                )
+
+            formatted_table = TATRFormattedTable(table, results, config=config)
+            if raw is not None:
+                _store_raw_predictions(
+                    formatted_table, raw, scale_factor, config.formatter_base_threshold
+                )
+            formatted_tables.append(formatted_table)
+        return formatted_tables
 
 
 # legacy aliases
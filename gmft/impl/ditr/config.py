@@ -1,5 +1,5 @@
-from dataclasses import dataclass
-from typing import Literal
+from dataclasses import dataclass, field
+from typing import Literal, Optional
 from typing_extensions import deprecated
 
 from gmft.formatters.histogram import HistogramConfig
@@ -16,6 +16,11 @@ class DITRFormatConfig(HistogramConfig, TATRFormatConfig):
 
     formatter_path: str = "conjuncts/ditr-e15"
 
+    model_input_size: Optional[dict] = field(
+        default_factory=lambda: {"shortest_edge": 800, "longest_edge": 1333}
+    )
+    """Size to which table images are resized for the model. DITR was trained at 800 and 1333."""
+
     enable_multi_header: bool = True
     """Enable multi-indices in the dataframe.
     If false, then multiple headers will be merged vertically."""
@@ -2,7 +2,7 @@ import torch
 
 
 from dataclasses import dataclass, field
-from typing import Literal, Union
+from typing import Literal, Optional, Union
 from typing_extensions import deprecated
 
 from gmft.core.legacy.removed_config import LegacyRemovedConfig
@@ -22,6 +22,32 @@ class TATRDetectorConfig:
     warn_uninitialized_weights: bool = False
     torch_device: str = "cuda" if torch.cuda.is_available() else "cpu"
 
+    backend: Literal["torch", "onnxruntime"] = "torch"
+    """Inference backend. 'onnxruntime' runs the model exported by ``python -m gmft.core.ml.onnx_export``."""
+
+    onnx_path: Optional[str] = None
+    """Exported model for the 'onnxruntime' backend. Defaults to the export location of detector_path."""
+
+    quantization: Literal["none", "dynamic-int8", "bf16"] = "none"
+    """Quantization of the model, for faster inference (torch backend only).
+    'dynamic-int8' (cpu only) quantizes the transformer's linear layers to int8; 'bf16' runs the model in bfloat16.
+    Quantized models may predict slightly different boxes than the float model, which can change the table."""
+
+    preprocessing: Literal["huggingface", "native"] = "huggingface"
+    """Image pre- and post-processing around the model.
+    'huggingface' uses the transformers image processor (from image_processor_path).
+    'native' uses gmft's equivalent for the Table Transformer (:mod:`gmft.core.ml.processing`),
+    which resizes the uint8 image directly and skips the processor's per-call overhead."""
+
+    dpi: int = 72
+    """Resolution at which pages are rendered for the detector. The image is resized to model_input_size anyway,
+    so higher values mostly cost rendering time."""
+
+    model_input_size: Optional[dict] = None
+    """Size to which images are resized for the model, as ``{"shortest_edge": ..., "longest_edge": ...}``.
+    None uses the image processor's (800 and 1333 for the Table Transformer).
+    Smaller sizes are faster, but less accurate."""
+
     detector_base_threshold: float = 0.9
     """Minimum confidence score required for a table"""
 
@@ -58,6 +84,44 @@ class TATRFormatConfig(LegacyRemovedConfig):
     # https://huggingface.co/microsoft/table-transformer-structure-recognition/discussions/5
     # "microsoft/table-transformer-structure-recognition-v1.1-all"
 
+    backend: Literal["torch", "onnxruntime"] = "torch"
+    """Inference backend. 'onnxruntime' runs the model exported by ``python -m gmft.core.ml.onnx_export``."""
+
+    onnx_path: Optional[str] = None
+    """Exported model for the 'onnxruntime' backend. Defaults to the export location of formatter_path."""
+
+    quantization: Literal["none", "dynamic-int8", "bf16"] = "none"
+    """Quantization of the model, for faster inference (torch backend only).
+    'dynamic-int8' (cpu only) quantizes the transformer's linear layers to int8; 'bf16' runs the model in bfloat16.
+    Quantized models may predict slightly different boxes than the float model, which can change the table."""
+
+    preprocessing: Literal["huggingface", "native"] = "huggingface"
+    """Image pre- and post-processing around the model.
+    'huggingface' uses the transformers image processor (from image_processor_path).
+    'native' uses gmft's equivalent for the Table Transformer (:mod:`gmft.core.ml.processing`),
+    which resizes the uint8 image directly and skips the processor's per-call overhead."""
+
+    dpi: Union[int, Literal["auto"]] = 144
+    """Resolution at which tables are rendered, unless the dpi is passed to extract().
+    'auto' picks the dpi of each table so that its image (with padding) is rendered at the size
+    the model resizes it to (see model_input_size), or within max_pixels.
+    Then large tables are not rendered at a resolution which the model discards,
+    and small tables are rendered sharply instead of being upsampled."""
+
+    max_pixels: Optional[int] = None
+    """With dpi='auto', the maximum number of pixels of a table image. None: no limit besides the model input size."""
+
+    model_input_size: Optional[dict] = None
+    """Size to which table images are resized for the model, as ``{"shortest_edge": ..., "longest_edge": ...}``.
+    None uses the image processor's (800 and 1333 for the Table Transformer).
+    Smaller sizes are faster, but less accurate."""
+
+    keep_raw_predictions: bool = False
+    """Keep the predictions of every query (label probabilities and boxes, as float16) in ``predictions.raw``,
+    and serialize them in :meth:`~.TATRFormattedTable.to_dict`. Then the table can be recomputed
+    with another formatter_base_threshold, or any other setting, without running the model again.
+    Costs about 3 kB per table."""
+
     verbosity: int = 1
     """
     -1: no logging\n
@@ -92,6 +156,11 @@ class TATRFormatConfig(LegacyRemovedConfig):
 
     # ---- df() settings ----
 
+    cell_assignment: Literal["numpy", "python"] = "numpy"
+    """How words are assigned to cells. 'numpy' computes the intersection over box area (iob)
+    of every word with every row and column in bulk. 'python' finds the best row and column word by word.
+    Both give the same tables; 'python' is kept for reference."""
+
     # ---- options ----
 
     remove_null_rows: bool = True
@@ -171,6 +240,10 @@ class TATRFormatConfig(LegacyRemovedConfig):
     """Non-maxima suppression: if two rows overlap by > threshold (default: 10%), then the one with the lower confidence is removed.
     A subsequent technique is able to fill in gaps created by NMS."""
 
+    _nms_method: Literal["adjacent", "pairwise"] = "adjacent"
+    """Non-maxima suppression: 'adjacent' only compares each row with the surviving row before it (as in the TATR authors' inference.py),
+    while 'pairwise' compares it with every surviving row of higher confidence."""
+
     _large_table_merge_distance: float = 0.6
     """In the large_table method, if two means are within (60% * text_height) of each other, then they are merged.
     This may be useful to adjust if text is being split due to subscripts/superscripts."""
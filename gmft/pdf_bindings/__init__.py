@@ -1,3 +1,6 @@
 from gmft.pdf_bindings.base import BasePage, BasePDFDocument, ImageOnlyPage
+from gmft.pdf_bindings.doc_pool import DocumentPool, get_document_pool
+from gmft.pdf_bindings.render_cache import RenderCache
+from gmft.pdf_bindings.words import WordArray, WordIndex
 
 from gmft.pdf_bindings.pdfium import PyPDFium2Page, PyPDFium2Document
@@ -1,12 +1,16 @@
 # Allow for different pdf extractors to be used
 
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 import logging
-from typing import Generator
+from typing import Callable, Generator, Literal, Optional
 
 import numpy as np
 
 from gmft.base import Rect
+from gmft.pdf_bindings.render_cache import RenderCache
+from gmft.pdf_bindings.words import WordArray, WordIndex
 from PIL.Image import Image as PILImage
 
 
@@ -16,6 +20,8 @@ class BasePage(ABC):
 
     def __init__(self, page_number: int):
         self.page_number = page_number
+        if not hasattr(self, "_word_array"):
+            self._word_array = None
 
     @abstractmethod
     def get_positions_and_text(
@@ -39,6 +45,32 @@ class BasePage(ABC):
         """
         raise NotImplementedError
 
+    def _take_prefetched_image(self, dpi: int, bbox) -> Optional[PILImage]:
+        """
+        The image rendered ahead by :meth:`.BasePDFDocument.iter_pages`, if it matches the request.
+        It is only given out once.
+        """
+        prefetched = getattr(self, "_prefetched_image", None)
+        if prefetched is None or bbox is not None or prefetched[0] != dpi:
+            return None
+        self._prefetched_image = None
+        return prefetched[1]
+
+    def get_array(
+        self, dpi: int = None, rect: Rect = None, mode: Literal["RGB", "L"] = "RGB"
+    ) -> np.ndarray:
+        """
+        Get an image of the page as a uint8 array, of shape (H, W, 3) for mode 'RGB',
+        or (H, W) for mode 'L' (grayscale). Same region and size as :meth:`get_image`.
+        The array may be read-only.
+
+        Grayscale halves the memory of later processing by 3. Pdfium-backed pages render it natively,
+        which may differ slightly from converting the RGB image.
+        """
+        if mode not in ("RGB", "L"):
+            raise ValueError(f"Unsupported mode: {mode}")
+        return np.asarray(self.get_image(dpi=dpi, rect=rect).convert(mode))
+
     def _get_positions_and_text_and_breaks(
         self,
     ) -> Generator[tuple[float, float, float, float, str, int, int, int], None, None]:
@@ -47,6 +79,34 @@ class BasePage(ABC):
         """
         return _infer_line_breaks(self.get_positions_and_text())
 
+    def get_word_array(self) -> WordArray:
+        """
+        Columnar view of the words on the page, including line breaks.
+        See :class:`.WordArray`.
+
+        The result is cached.
+        """
+        if getattr(self, "_word_array", None) is None:
+            # keep the coordinates exact, since they may come from the user
+            self._word_array = WordArray.from_tuples(
+                self._get_positions_and_text_and_breaks(), dtype=np.float64
+            )
+        return self._word_array
+
+    def get_word_index(self) -> WordIndex:
+        """
+        Spatial index over :meth:`get_word_array`, for finding the words within a rect.
+        See :class:`.WordIndex`.
+
+        The result is cached.
+        """
+        words = self.get_word_array()
+        index = getattr(self, "_word_index", None)
+        if index is None or index.words is not words:
+            index = WordIndex(words)
+            self._word_index = index
+        return index
+
     def _get_text_with_breaks(self) -> str:
         """
         warning: experimental, subject to change
@@ -75,6 +135,9 @@ class BasePage(ABC):
 
 
 class BasePDFDocument(ABC):
+    render_cache: RenderCache = None
+    """Cache of rendered page images, if the document keeps one."""
+
     @abstractmethod
     def get_page(self, n: int) -> BasePage:
         """
@@ -97,6 +160,73 @@ class BasePDFDocument(ABC):
         for i in range(len(self)):
             yield self.get_page(i)
 
+    def iter_pages(
+        self,
+        prefetch: int = 2,
+        workers: int = 1,
+        dpi: int = 72,
+        prefilter: Callable[[BasePage], bool] = None,
+    ) -> Generator[BasePage, None, None]:
+        """
+        Iterate over the pages, like ``iter(doc)``, while the next pages are prepared in the background.
+
+        While the caller works on a page (for instance, running a detector on it),
+        up to ``prefetch`` following pages are opened, rendered at ``dpi`` and have their words extracted,
+        on a pool of ``workers`` threads. The image goes into :attr:`render_cache` if it is enabled;
+        otherwise the page holds it until the first ``get_image(dpi)`` of the whole page.
+        At most ``prefetch + 1`` pages are in flight at once.
+
+        PDFium calls are serialized by a lock, so this overlaps PDFium with other work
+        (such as pytorch, which releases the GIL), rather than PDFium with itself.
+
+        :param prefetch: number of pages to prepare ahead. 0 iterates serially.
+        :param workers: number of background threads.
+        :param dpi: dpi of the image to render ahead. 72 is what :class:`.TATRDetector` uses.
+        :param prefilter: if given, only the pages for which it is true are yielded (and rendered),
+            for instance a :class:`.PagePrefilter`. It is called after the words are extracted.
+        """
+        if prefetch <= 0:
+            for page in self:
+                if prefilter is None or prefilter(page):
+                    yield page
+            return
+        n = len(self)
+        pending = deque()
+        submitted = 0
+        with ThreadPoolExecutor(workers, thread_name_prefix="gmft-prefetch") as pool:
+            try:
+                for _ in range(n):
+                    while submitted < n and len(pending) <= prefetch:
+                        pending.append(
+                            pool.submit(self._prefetch_page, submitted, dpi, prefilter)
+                        )
+                        submitted += 1
+                    page = pending.popleft().result()
+                    if page is not None:
+                        yield page
+            finally:
+                # stopped early: skip the pages that have not started
+                for future in pending:
+                    future.cancel()
+
+    def _prefetch_page(
+        self, n: int, dpi: int, prefilter: Callable[[BasePage], bool] = None
+    ) -> Optional[BasePage]:
+        """
+        Open page n, and fill the caches which are slow to compute.
+        Returns None if the prefilter rejects the page.
+        """
+        page = self.get_page(n)
+        page.get_word_array()
+        if prefilter is not None and not prefilter(page):
+            return None
+        if self.render_cache is not None and self.render_cache.max_bytes > 0:
+            page.get_image(dpi=dpi)
+        else:
+            # without a cache, the page keeps the image until it is first requested
+            page._prefetched_image = (dpi, page.get_image(dpi=dpi))
+        return page
+
     def close(self):
         pass
 
@@ -0,0 +1,177 @@
+"""
+Process-local pool of open documents, shared by unpickled pages.
+"""
+
+import os
+import threading
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from gmft.pdf_bindings.pdfium import PyPDFium2Document
+
+
+class _Entry:
+    __slots__ = ("doc", "refs")
+
+    def __init__(self, doc: "PyPDFium2Document"):
+        self.doc = doc
+        self.refs = 0
+
+
+class DocumentPool:
+    """
+    Reference-counted pool of open :class:`.PyPDFium2Document`, keyed by (path, mtime).
+
+    Documents are borrowed with :meth:`acquire` and given back with :meth:`release`.
+    A document stays open while it is borrowed. Once nobody borrows it, it is kept open
+    for later borrowers, and closed in least-recently-used order when more than ``max_open``
+    documents are open. Borrowed documents are never closed by the pool, so the cap may be exceeded
+    while they are in use.
+
+    If the file is modified, later borrowers get a freshly opened document.
+
+    Pooled documents belong to the pool, and should not be closed directly.
+    """
+
+    def __init__(self, max_open: int = 8):
+        """
+        :param max_open: number of open documents to keep, including those not borrowed.
+        """
+        self.max_open = max_open
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        self.hits = 0
+        self.opens = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        # documents given back by finalizers, see release_later
+        self._released = deque()
+
+    def acquire(self, filename: str) -> "PyPDFium2Document":
+        """
+        Borrow the open document for filename, opening it if needed.
+        Every call must be matched by a call to :meth:`release`.
+        """
+        from gmft.pdf_bindings.pdfium import PyPDFium2Document
+
+        key = (os.path.abspath(filename), os.stat(filename).st_mtime_ns)
+        with self._lock:
+            self._drain()
+            doc = self._borrow(key)
+            to_close = self._evict()
+        if doc is None:
+            # pdfium is never called while holding the lock
+            opened = PyPDFium2Document(filename)
+            with self._lock:
+                doc = self._borrow(key)
+                if doc is None:
+                    entry = _Entry(opened)
+                    entry.refs += 1
+                    self._entries[key] = entry
+                    self.opens += 1
+                    doc = opened
+                else:
+                    # opened by another thread in the meantime
+                    to_close.append(opened)
+                to_close += self._evict()
+        self._close(to_close)
+        return doc
+
+    def _borrow(self, key: tuple) -> "PyPDFium2Document":
+        entry = self._entries.get(key)
+        if entry is not None and entry.doc._is_closed():
+            # closed behind the pool's back
+            del self._entries[key]
+            entry = None
+        if entry is None:
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        entry.refs += 1
+        return entry.doc
+
+    def release(self, doc: "PyPDFium2Document"):
+        """
+        Give back a document borrowed with :meth:`acquire`. Unknown documents are ignored.
+        """
+        with self._lock:
+            self._drain()
+            self._release(doc)
+            to_close = self._evict()
+        self._close(to_close)
+
+    def release_later(self, doc: "PyPDFium2Document"):
+        """
+        Like :meth:`release`, but only queues the document, to be given back at the next
+        :meth:`acquire`, :meth:`release` or :meth:`clear`.
+
+        Safe to call from a garbage collection finalizer: it never takes the lock,
+        which the collecting thread may already hold.
+        """
+        self._released.append(doc)
+
+    def _drain(self):
+        while self._released:
+            self._release(self._released.popleft())
+
+    def _release(self, doc: "PyPDFium2Document"):
+        for entry in self._entries.values():
+            if entry.doc is doc:
+                entry.refs = max(entry.refs - 1, 0)
+                break
+
+    def _evict(self) -> list:
+        """Remove the excess idle documents, and return them to be closed outside of the lock."""
+        excess = len(self._entries) - self.max_open
+        if excess <= 0:
+            return []
+        idle = [key for key, entry in self._entries.items() if entry.refs == 0]
+        self.evictions += len(idle[:excess])
+        return [self._entries.pop(key).doc for key in idle[:excess]]
+
+    @staticmethod
+    def _close(docs: list):
+        for doc in docs:
+            doc.close()
+
+    def clear(self):
+        """Close all documents that are not borrowed."""
+        with self._lock:
+            self._drain()
+            idle = [k for k, e in self._entries.items() if e.refs == 0]
+            to_close = [self._entries.pop(key).doc for key in idle]
+        self._close(to_close)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict:
+        """Counters and current pool contents."""
+        with self._lock:
+            self._drain()
+        return {
+            "hits": self.hits,
+            "opens": self.opens,
+            "evictions": self.evictions,
+            "open": len(self._entries),
+            "borrowed": sum(1 for e in self._entries.values() if e.refs > 0),
+        }
+
+
+_pool: DocumentPool = None
+_pool_pid: int = None
+_pool_lock = threading.Lock()
+
+
+def get_document_pool() -> DocumentPool:
+    """
+    The pool of the current process. A forked child gets a new, empty pool,
+    rather than sharing the parent's documents.
+    """
+    global _pool, _pool_pid
+    with _pool_lock:
+        if _pool is None or _pool_pid != os.getpid():
+            _pool = DocumentPool()
+            _pool_pid = os.getpid()
+        return _pool
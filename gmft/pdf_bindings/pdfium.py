@@ -1,13 +1,24 @@
 from __future__ import annotations  # 3.7
 
 # PyPDFium2 bindings
-from typing import Generator, Tuple
+import ctypes
+import functools
+import mmap
+import os
+import threading
+from typing import BinaryIO, Generator, Literal, Optional, Tuple, Union
 import weakref
+
+import numpy as np
 import pypdfium2 as pdfium
+import pypdfium2.raw as pdfium_c
 
 from gmft.base import Rect
 from gmft.core.exception import DocumentClosedException
 from gmft.pdf_bindings.base import BasePDFDocument, BasePage, _infer_line_breaks
+from gmft.pdf_bindings.doc_pool import DocumentPool, get_document_pool
+from gmft.pdf_bindings.render_cache import RenderCache
+from gmft.pdf_bindings.words import WordArray
 
 from PIL.Image import Image as PILImage
 
@@ -18,14 +29,247 @@ if TYPE_CHECKING:
     from gmft.formatters.base import CroppedTable
 
 
-def _close_document_quietly(doc: "PyPDFium2Document"):
-    """Best-effort close used by pickle cleanup finalizers."""
-    if doc is None:
-        return
-    try:
-        doc.close()
-    except Exception:
-        pass
+_pdfium_lock = threading.RLock()
+"""PDFium is not thread-safe: every call into it goes through this lock."""
+
+
+def _as_pdfium_buffer(
+    data,
+) -> Tuple[Union[bytes, ctypes.Array], Optional[memoryview]]:
+    """
+    View a bytes-like object (bytes, bytearray, memoryview, mmap, numpy array...) as something
+    pdfium can load from memory, without copying it.
+
+    :return: (buffer for pdfium, memoryview to release once pdfium is done with the buffer, or None)
+    """
+    if isinstance(data, bytes):
+        return data, None
+    view = memoryview(data).cast("B")
+    # read-only buffers (bytes views, read-only mmaps) cannot go through ctypes' from_buffer,
+    # so address the memory directly. The view keeps the memory alive.
+    address = np.frombuffer(view, dtype=np.uint8).ctypes.data
+    return (ctypes.c_char * view.nbytes).from_address(address), view
+
+
+def _extract_words_per_char(
+    text_page: pdfium.PdfTextPage, page_height: float
+) -> list[tuple[float, float, float, float, str]]:
+    """
+    Aggregate chars into words, querying pdfium once per char.
+
+    This is the original (slow) implementation, kept for reference and benchmarking.
+    """
+    result = []
+
+    # "char" seems to not actually be a char, but a string-like token
+    # for index in range(text_page.count_chars()):
+    #     bbox = text_page.get_charbox(index)
+    #     char = text_page.get_text_range(index, 1)
+    #     yield *bbox, char
+
+    # Aggregate chars into words
+    current_word = ""
+    current_bbox = None
+    for index in range(text_page.count_chars()):
+        bbox = text_page.get_charbox(index)
+        char = text_page.get_text_range(index, 1)
+        # if is whitespace
+        if char.isspace():
+            if current_word:
+                # perform negation
+                current_bbox = (
+                    current_bbox[0],
+                    page_height - current_bbox[3],
+                    current_bbox[2],
+                    page_height - current_bbox[1],
+                )
+                result.append((*current_bbox, current_word))
+                # cache, because it is slow
+                current_word = ""
+                current_bbox = None
+        else:
+            current_word += char
+            if current_bbox is None:
+                current_bbox = bbox
+            else:
+                # for the bbox, simply get the min/max
+                current_bbox = (
+                    min(current_bbox[0], bbox[0]),
+                    min(current_bbox[1], bbox[1]),
+                    max(current_bbox[2], bbox[2]),
+                    max(current_bbox[3], bbox[3]),
+                )
+    # Add the last word
+    if current_word:
+        current_bbox = (
+            current_bbox[0],
+            page_height - current_bbox[3],
+            current_bbox[2],
+            page_height - current_bbox[1],
+        )
+        result.append((*current_bbox, current_word))
+    return result
+
+
+@functools.lru_cache(maxsize=None)
+def _whitespace_code_units() -> np.ndarray:
+    """UTF-16 code units which python considers to be whitespace."""
+    return np.array([c for c in range(0x10000) if chr(c).isspace()], dtype=np.int64)
+
+
+def _extract_words_bulk(
+    text_page: pdfium.PdfTextPage, page_height: float
+) -> list[tuple[float, float, float, float, str]]:
+    """
+    Aggregate chars into words, querying pdfium for the raw codepoints and boxes
+    in one tight loop and grouping them with numpy.
+
+    Produces the same output as :func:`_extract_words_per_char`, including its quirks:
+    chars which pdfium excludes from the text (no text index) contribute to the bbox
+    of the next word, but not to its text.
+    """
+    n_chars = text_page.count_chars()
+    if n_chars <= 0:
+        return []
+
+    # pdfium has no batch API for chars, so call the raw functions directly,
+    # reusing the output buffers rather than going through the helper wrappers
+    raw_page = text_page.raw
+    get_text_index = pdfium_c.FPDFText_GetTextIndexFromCharIndex
+    get_unicode = pdfium_c.FPDFText_GetUnicode
+    get_charbox = pdfium_c.FPDFText_GetCharBox
+    left, bottom = ctypes.c_double(), ctypes.c_double()
+    right, top = ctypes.c_double(), ctypes.c_double()
+    code_list = [0] * n_chars
+    box_list = [None] * n_chars
+    for index in range(n_chars):
+        if get_text_index(raw_page, index) < 0:
+            code_list[index] = -1  # excluded from the text
+        else:
+            code_list[index] = get_unicode(raw_page, index)
+        if not get_charbox(raw_page, index, left, right, bottom, top):  # yes, lrbt!
+            raise pdfium.PdfiumError("Failed to get charbox.")
+        box_list[index] = (left.value, bottom.value, right.value, top.value)
+    codes = np.array(code_list, dtype=np.int64)  # -1 means "no text"
+    boxes = np.array(box_list, dtype=np.float64)  # left, bottom, right, top
+
+    # match get_text_range(index, 1): it is limited to a single UCS-2 code unit,
+    # and pdfium reports generated hyphens (0x02) as U+FFFE
+    codes[(codes > 0xFFFF) | ((codes >= 0xD800) & (codes <= 0xDFFF))] = -1
+    codes[codes == 0x02] = 0xFFFE
+
+    is_space = np.isin(codes, _whitespace_code_units())
+    is_text = (codes >= 0) & ~is_space
+
+    # A whitespace char ends a word iff the closest preceding char that is
+    # text or whitespace (ignoring chars without text) is text.
+    significant = np.where(is_space | is_text, np.arange(n_chars), -1)
+    last_significant = np.maximum.accumulate(significant)
+    prev_is_text = np.zeros(n_chars, dtype=bool)
+    has_prev = last_significant[:-1] >= 0
+    prev_is_text[1:][has_prev] = is_text[last_significant[:-1][has_prev]]
+    ends_word = is_space & prev_is_text
+
+    # every non-whitespace char belongs to the word after the preceding word ends
+    word_ids = np.cumsum(ends_word) - ends_word
+    members = np.flatnonzero(~is_space)
+    member_ids = word_ids[members]
+    text_counts = np.bincount(word_ids[is_text], minlength=int(word_ids[-1]) + 1)
+    # the trailing group may lack text, in which case it is dropped
+    n_words = int(np.count_nonzero(text_counts))
+    if n_words == 0:
+        return []
+
+    member_boxes = boxes[members]
+    group_starts = np.flatnonzero(np.r_[True, member_ids[1:] != member_ids[:-1]])
+    mins = np.minimum.reduceat(member_boxes[:, :2], group_starts)[:n_words]
+    maxs = np.maximum.reduceat(member_boxes[:, 2:], group_starts)[:n_words]
+
+    text = codes[is_text].astype(np.uint16).tobytes().decode("utf-16-le")
+    text_ends = np.cumsum(text_counts[:n_words]).tolist()
+    text_starts = [0] + text_ends[:-1]
+
+    # perform negation
+    x0s = mins[:, 0].tolist()
+    x1s = maxs[:, 0].tolist()
+    y0s = (page_height - maxs[:, 1]).tolist()
+    y1s = (page_height - mins[:, 1]).tolist()
+    return [
+        (x0s[i], y0s[i], x1s[i], y1s[i], text[text_starts[i] : text_ends[i]])
+        for i in range(n_words)
+    ]
+
+
+def _render_pdfium(
+    page: pdfium.PdfPage,
+    width: float,
+    height: float,
+    dpi: float,
+    bbox: Optional[tuple[float, float, float, float]],
+) -> PILImage:
+    """
+    Render the page (or the region bbox, in PIL coordinates) to an image.
+    """
+    with _pdfium_lock:
+        return _render_bitmap(page, width, height, dpi, bbox).to_pil()
+
+
+def _render_pdfium_array(
+    page: pdfium.PdfPage,
+    width: float,
+    height: float,
+    dpi: float,
+    bbox: Optional[tuple[float, float, float, float]],
+    mode: Literal["RGB", "L"] = "RGB",
+) -> np.ndarray:
+    """
+    Render the page (or the region bbox, in PIL coordinates) to an array,
+    which is a view of the bitmap's buffer. See :meth:`.BasePage.get_array`.
+    """
+    if mode not in ("RGB", "L"):
+        raise ValueError(f"Unsupported mode: {mode}")
+    with _pdfium_lock:
+        bitmap = _render_bitmap(
+            page, width, height, dpi, bbox, grayscale=mode == "L", rev_byteorder=True
+        )
+        array = bitmap.to_numpy()
+        # the buffer belongs to python, and stays alive with the array
+        bitmap.close()
+    return array
+
+
+def _render_bitmap(
+    page: pdfium.PdfPage,
+    width: float,
+    height: float,
+    dpi: float,
+    bbox: Optional[tuple[float, float, float, float]],
+    **kwargs,
+) -> pdfium.PdfBitmap:
+    """Must be called with the pdfium lock held."""
+    scale_factor = dpi / 72
+    if bbox is None:
+        return page.render(scale=scale_factor, **kwargs)
+    # crop is "amount to cut off" from each side
+    # left, bottom, right, top
+    xmin, ymin, xmax, ymax = bbox
+    # also remember that the origin is at the bottom left
+    crop = (xmin, height - ymax, width - xmax, ymin)
+    return page.render(scale=scale_factor, crop=crop, **kwargs)
+
+
+def _get_path_sizes(page: pdfium.PdfPage) -> list[tuple[float, float]]:
+    """
+    (width, height) of the bounding box of each path object on a pdfium page, including those in form objects.
+    """
+    sizes = []
+    with _pdfium_lock:
+        for obj in page.get_objects(filter=[pdfium_c.FPDF_PAGEOBJ_PATH], max_depth=2):
+            # pypdfium2 v5 renamed get_pos to get_bounds
+            bounds = obj.get_bounds() if hasattr(obj, "get_bounds") else obj.get_pos()
+            left, bottom, right, top = bounds
+            sizes.append((right - left, top - bottom))
+    return sizes
 
 
 class PyPDFium2Page(BasePage):
@@ -45,10 +289,14 @@ class PyPDFium2Page(BasePage):
         self.parent = parent
         self.page = page
         self.filename = filename
-        self.width = page.get_width()
-        self.height = page.get_height()
-        self._positions_and_text_and_breaks = None
-        self._pickle_parent_close_finalizer = None
+        with _pdfium_lock:
+            self.width = page.get_width()
+            self.height = page.get_height()
+        self._word_array = None
+        self._pool_lease: Optional[weakref.finalize] = None
+        # the pool which lent the document, if any
+        self._pool: Optional[DocumentPool] = None
+        self.word_extraction = parent.word_extraction if parent is not None else "bulk"
         super().__init__(page_no)
 
     def get_positions_and_text(
@@ -73,12 +321,7 @@ class PyPDFium2Page(BasePage):
         #     adjusted = (rect[0], self.height - rect[3], rect[2], self.height - rect[1])
         #     yield *adjusted, text
 
-        if self._positions_and_text_and_breaks is None:
-            self._initialize_word_bboxes()
-            assert self._positions_and_text_and_breaks is not None
-
-        for x0, y0, x1, y1, text, _, _, _ in self._positions_and_text_and_breaks:
-            yield x0, y0, x1, y1, text
+        yield from self.get_word_array().iter_positions_and_text()
 
     def get_filename(self) -> str:
         return self.filename
@@ -88,26 +331,63 @@ class PyPDFium2Page(BasePage):
             raise DocumentClosedException("Document was already closed")
         if dpi is None:
             dpi = 72
-        scale_factor = dpi / 72
-        if rect is None:
-            bitmap = self.page.render(scale=scale_factor)
-        else:
-            # crop is "amount to cut off" from each side
-            # left, bottom, right, top
-            xmin, ymin, xmax, ymax = rect.bbox
-            # also remember that the origin is at the bottom left
-            crop = (xmin, self.height - ymax, self.width - xmax, ymin)
-            bitmap = self.page.render(scale=scale_factor, crop=crop)
-        return bitmap.to_pil()
+        bbox = None if rect is None else rect.bbox
+        prefetched = self._take_prefetched_image(dpi, bbox)
+        if prefetched is not None:
+            return prefetched
+        render = functools.partial(
+            _render_pdfium, self.page, self.width, self.height, dpi, bbox
+        )
+        if self.parent is None:
+            return render()
+        return self.parent.render_cache.get(
+            self.page_number, self.width, self.height, dpi, bbox, render
+        )
+
+    def get_array(
+        self, dpi: int = None, rect: Rect = None, mode: Literal["RGB", "L"] = "RGB"
+    ) -> np.ndarray:
+        """
+        Like :meth:`.BasePage.get_array`, but renders straight into the array, without going through PIL.
+        Unlike :meth:`get_image`, results are not cached.
+        """
+        if self._is_closed():
+            raise DocumentClosedException("Document was already closed")
+        if dpi is None:
+            dpi = 72
+        bbox = None if rect is None else rect.bbox
+        return _render_pdfium_array(self.page, self.width, self.height, dpi, bbox, mode)
+
+    def get_path_sizes(self) -> list[tuple[float, float]]:
+        """
+        (width, height) of the bounding box of each path object (lines, rectangles, curves) on the page,
+        including those in form objects.
+        """
+        if self._is_closed():
+            raise DocumentClosedException("Document was already closed")
+        return _get_path_sizes(self.page)
 
     def close(self):
         """
         Not recommended: use close_document instead.
         """
-        self.page.close()
+        with _pdfium_lock:
+            self.page.close()
         self.page = None
 
     def close_document(self):
+        if self._pool_lease is not None:
+            # borrowed from the document pool: give it back instead
+            if self.page is not None:
+                with _pdfium_lock:
+                    self.page.close()
+                self.page = None
+            lease = self._pool_lease.detach()
+            if lease is not None:
+                # not called by the garbage collector, so the document can be given back right away
+                _, _, (doc,), _ = lease
+                self._pool.release(doc)
+            return
         if self.parent:
             self.parent.close()
         elif self.page.parent:
@@ -121,75 +401,44 @@ class PyPDFium2Page(BasePage):
         return self.page is None or self.parent._is_closed()
 
     def _initialize_word_bboxes(self):
-        if self._positions_and_text_and_breaks is not None:
+        if self._word_array is not None:
             return  # nothing to do
 
         if self._is_closed():
             raise DocumentClosedException("Document was already closed")
 
-        result = []
-        text_page = self.page.get_textpage()
-
-        # "char" seems to not actually be a char, but a string-like token
-        # for index in range(text_page.count_chars()):
-        #     bbox = text_page.get_charbox(index)
-        #     char = text_page.get_text_range(index, 1)
-        #     yield *bbox, char
-
-        # Aggregate chars into words
-        current_word = ""
-        current_bbox = None
-        for index in range(text_page.count_chars()):
-            bbox = text_page.get_charbox(index)
-            char = text_page.get_text_range(index, 1)
-            # if is whitespace
-            if char.isspace():
-                if current_word:
-                    # perform negation
-                    current_bbox = (
-                        current_bbox[0],
-                        self.height - current_bbox[3],
-                        current_bbox[2],
-                        self.height - current_bbox[1],
-                    )
-                    result.append((*current_bbox, current_word))
-                    # cache, because it is slow
-                    current_word = ""
-                    current_bbox = None
+        with _pdfium_lock:
+            text_page = self.page.get_textpage()
+            if self.word_extraction == "bulk":
+                result = _extract_words_bulk(text_page, self.height)
             else:
-                current_word += char
-                if current_bbox is None:
-                    current_bbox = bbox
-                else:
-                    # for the bbox, simply get the min/max
-                    current_bbox = (
-                        min(current_bbox[0], bbox[0]),
-                        min(current_bbox[1], bbox[1]),
-                        max(current_bbox[2], bbox[2]),
-                        max(current_bbox[3], bbox[3]),
-                    )
-        # Add the last word
-        if current_word:
-            current_bbox = (
-                current_bbox[0],
-                self.height - current_bbox[3],
-                current_bbox[2],
-                self.height - current_bbox[1],
-            )
-            result.append((*current_bbox, current_word))
-        words = list(_infer_line_breaks(result))
-        self._positions_and_text_and_breaks = words
+                result = _extract_words_per_char(text_page, self.height)
+            text_page.close()
+        self._word_array = WordArray.from_tuples(_infer_line_breaks(result))
 
     def _get_positions_and_text_and_breaks(self):
         """
         [Experimental] This is a generator that returns the positions and text of the page, as well as the breaks.
         """
+        yield from self.get_word_array().iter_positions_and_text_and_breaks()
+
+    def get_word_array(self) -> WordArray:
+        """
+        Columnar view of the words on the page. See :class:`.WordArray`.
+
+        Warning: PyPDFium2Page caches the results of this method.
+        """
         # cache, since it is slow
-        if self._positions_and_text_and_breaks is None:
+        if self._word_array is None:
             self._initialize_word_bboxes()
+        return self._word_array
 
-        for item in self._positions_and_text_and_breaks:
-            yield item
+    def __del__(self):
+        # close explicitly, so that the page is not released by a finalizer outside the lock
+        page = self.__dict__.get("page")
+        if page is not None:
+            with _pdfium_lock:
+                page.close()
 
     def __getstate__(self):
         return {
@@ -199,14 +448,13 @@ class PyPDFium2Page(BasePage):
 
     def __setstate__(self, state):
         # copy-and-swap idiom
-        copy = PyPDFium2Utils.load_page_from_dict(state)  # this opens a new document!
+        copy = PyPDFium2Utils.load_page_from_dict(
+            state
+        )  # borrows from the document pool
+        # move the lease to self, so that the document is released with self rather than copy
+        _, release, args, _ = copy._pool_lease.detach()
         self.__dict__, copy.__dict__ = copy.__dict__, self.__dict__
-
-        # avoid pypdfium2 memory leak #55
-        if self.parent is not None:
-            self._pickle_parent_close_finalizer = weakref.finalize(
-                self, _close_document_quietly, self.parent
-            )  # best-effort close document
+        self._pool_lease = weakref.finalize(self, release, *args)
 
 
 class PyPDFium2Document(BasePDFDocument):
@@ -214,17 +462,120 @@ class PyPDFium2Document(BasePDFDocument):
     Wraps a pdfium.PdfDocument object.
     Note that you (the user) are responsible for calling doc.close() once you are done,
     otherwise the document will remain open and consume resources.
+
+    Besides a filename, documents can be opened from memory, without copying the pdf:
+    see :meth:`from_bytes`, :meth:`from_file` and :meth:`from_mmap`.
     """
 
-    def __init__(self, filename: str):
-        self._doc = pdfium.PdfDocument(filename)
+    def __init__(
+        self,
+        filename: str,
+        *,
+        word_extraction: Literal["bulk", "per_char"] = "bulk",
+        render_cache_bytes: int = 0,
+    ):
+        """
+        :param filename: path to the pdf
+        :param word_extraction: how words are extracted from the text layer.
+            'bulk' still queries pdfium once per char, but only for its code point and box,
+            through the raw C functions with reused buffers; the chars are then grouped into words with numpy.
+            'per_char' goes through pypdfium2's ``get_charbox`` and ``get_text_range`` for each char,
+            and builds the words in python (slower, kept for reference).
+            Both produce the same words.
+        :param render_cache_bytes: memory budget for cached page images, see :class:`.RenderCache`.
+            The cache is off by default (0): outside of :meth:`.BasePDFDocument.iter_pages`,
+            the detector and formatter rarely request the same image twice.
+        """
+        self._init_options(filename, word_extraction, render_cache_bytes)
+        with _pdfium_lock:
+            self._doc = pdfium.PdfDocument(filename)
+
+    def _init_options(
+        self,
+        filename: Optional[str],
+        word_extraction: Literal["bulk", "per_char"] = "bulk",
+        render_cache_bytes: int = 0,
+    ):
+        if word_extraction not in ("bulk", "per_char"):
+            raise ValueError(f"Unknown word_extraction: {word_extraction}")
         self.filename = filename
+        self.word_extraction = word_extraction
+        self.render_cache = RenderCache(max_bytes=render_cache_bytes)
+        self._doc = None
+        self._source = None  # in-memory pdf or file object, kept alive while open
+        self._view = None
+        self._mmap = None
+
+    @classmethod
+    def from_bytes(cls, data, *, filename: str = None, **kwargs) -> "PyPDFium2Document":
+        """
+        Open a pdf held in memory, without copying it.
+
+        :param data: bytes, or any contiguous bytes-like object (bytearray, memoryview, mmap, numpy array).
+            It must not be modified or released while the document is open.
+        :param filename: reported by :meth:`get_filename`.
+            Pickled pages are reopened from the filename, so without one they cannot be unpickled.
+        :param kwargs: as in :meth:`__init__`
+        """
+        doc = cls.__new__(cls)
+        doc._init_options(filename, **kwargs)
+        doc._source, doc._view = _as_pdfium_buffer(data)
+        try:
+            with _pdfium_lock:
+                doc._doc = pdfium.PdfDocument(doc._source)
+        except BaseException:
+            doc.close()
+            raise
+        return doc
+
+    @classmethod
+    def from_file(
+        cls, fp: BinaryIO, *, filename: str = None, **kwargs
+    ) -> "PyPDFium2Document":
+        """
+        Open a pdf from a seekable binary file object. Pdfium reads from it on demand,
+        so the file is never loaded whole. The file object must stay open while the document is open;
+        it is not closed by :meth:`close`.
+
+        :param filename: reported by :meth:`get_filename`. Defaults to ``fp.name``, if it is a path.
+        :param kwargs: as in :meth:`__init__`
+        """
+        if filename is None:
+            name = getattr(fp, "name", None)
+            filename = name if isinstance(name, str) else None
+        doc = cls.__new__(cls)
+        doc._init_options(filename, **kwargs)
+        doc._source = fp
+        with _pdfium_lock:
+            doc._doc = pdfium.PdfDocument(fp)
+        return doc
+
+    @classmethod
+    def from_mmap(
+        cls, filename: Union[str, os.PathLike], **kwargs
+    ) -> "PyPDFium2Document":
+        """
+        Memory-map the pdf file, and open it without reading it into memory.
+        The OS loads pages of the file as pdfium needs them, and shares them between processes.
+
+        :param kwargs: as in :meth:`__init__`
+        """
+        with open(filename, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            doc = cls.from_bytes(mapped, filename=os.fspath(filename), **kwargs)
+        except BaseException:
+            mapped.close()
+            raise
+        doc._mmap = mapped
+        return doc
 
     def get_page(self, n: int) -> BasePage:
         """
         Get 0-indexed page
         """
-        return PyPDFium2Page(self._doc[n], self.filename, n, parent=self)
+        with _pdfium_lock:
+            return PyPDFium2Page(self._doc[n], self.filename, n, parent=self)
 
     def get_filename(self) -> str:
         return self.filename
@@ -232,15 +583,26 @@ class PyPDFium2Document(BasePDFDocument):
     def __len__(self) -> int:
         if self._is_closed():
             raise DocumentClosedException("Document was already closed")
-        return len(self._doc)
+        with _pdfium_lock:
+            return len(self._doc)
 
     def close(self):
         """
         Close the document
         """
         if self._doc is not None:
-            self._doc.close()
+            with _pdfium_lock:
+                self._doc.close()
         self._doc = None
+        # only once pdfium is done with the memory
+        self._source = None
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self.render_cache.clear()
 
     def _is_closed(self):
         """
@@ -258,15 +620,25 @@ class PyPDFium2Utils:
     def load_page_from_dict(d: dict) -> BasePage:
         """
         Helper method to load a BasePage from a serialized CroppedTable or TATRFormattedTable.
-        This method reads a pdf from disk! You will need to close it manually! (through page.close_document())
 
-        ie. `page.close_document()`
+        The document is borrowed from the process's :class:`.DocumentPool`, so loading many pages of
+        the same pdf opens it only once. It is given back when the page is garbage collected,
+        or when `page.close_document()` is called.
         """
         filename = d["filename"]
         page_number = d["page_no"]
 
-        doc = PyPDFium2Document(filename)
-        return doc.get_page(page_number)
+        pool = get_document_pool()
+        doc = pool.acquire(filename)
+        try:
+            page = doc.get_page(page_number)
+        except BaseException:
+            pool.release(doc)
+            raise
+        page.filename = filename
+        page._pool = pool
+        page._pool_lease = weakref.finalize(page, pool.release_later, doc)
+        return page
 
     @staticmethod
     def reload(
@@ -277,14 +649,57 @@ class PyPDFium2Utils:
         This is useful for a :class:`.CroppedTable` whose document has been closed.
 
         :param ct: The :class:`.CroppedTable` to reload.
-        :param doc: The :class:`.PyPDFium2Document` to reload from. If None, the document is loaded from disk.
+        :param doc: The :class:`.PyPDFium2Document` to reload from. If None, the document is borrowed
+            from the :class:`.DocumentPool`, like :meth:`load_page_from_dict`, so reloading many tables
+            of the same pdf opens it only once.
+        :return: the table, and the document. A borrowed document is returned as a :class:`PooledDocument`,
+            whose ``close()`` gives it back to the pool.
         """
         page_number = ct.page.page_number
 
         if doc is None:
-            filename = ct.page.filename
-            doc = PyPDFium2Document(filename)
-        page = doc.get_page(page_number)
+            page = PyPDFium2Utils.load_page_from_dict(
+                {"filename": ct.page.filename, "page_no": page_number}
+            )
+            doc = PooledDocument(page)
+        else:
+            page = doc.get_page(page_number)
 
         ct.page = page
         return ct, doc  # escape analysis means we need to give doc back
+
+
+class PooledDocument:
+    """
+    A document borrowed from the :class:`.DocumentPool` by :meth:`PyPDFium2Utils.reload`.
+
+    It behaves like the :class:`.PyPDFium2Document`, except that ``close()`` ends the lease
+    instead of closing the shared document. The lease is held by the reloaded page,
+    so the document is also given back once both are garbage collected.
+    """
+
+    def __init__(self, page: PyPDFium2Page):
+        self._page = page
+        self._doc = page.parent
+
+    def __getattr__(self, name):
+        if name in ("_page", "_doc"):
+            raise AttributeError(name)
+        return getattr(self._doc, name)
+
+    def __len__(self) -> int:
+        return len(self._doc)
+
+    def __getitem__(self, n: int) -> BasePage:
+        return self._doc[n]
+
+    def __iter__(self) -> Generator[BasePage, None, None]:
+        return iter(self._doc)
+
+    def close(self):
+        """
+        Give the document back to the pool. Pages of the document should not be used afterwards.
+        """
+        if self._page is not None:
+            self._page.close_document()
+            self._page = None
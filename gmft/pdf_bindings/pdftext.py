@@ -1,12 +1,24 @@
 from __future__ import annotations  # 3.7
 
-from typing import Generator
+import functools
+from typing import Generator, Iterable, Literal
+
+import numpy as np
 
 from gmft.base import Rect
 from gmft.pdf_bindings.base import BasePDFDocument, BasePage, _infer_line_breaks
+from gmft.pdf_bindings.pdfium import (
+    _as_pdfium_buffer,
+    _get_path_sizes,
+    _pdfium_lock,
+    _render_pdfium,
+    _render_pdfium_array,
+)
+from gmft.pdf_bindings.render_cache import RenderCache
+from gmft.pdf_bindings.words import WordArray
 
 from PIL.Image import Image as PILImage
-import io
+import mmap
 
 from typing import TYPE_CHECKING
 
@@ -29,10 +41,10 @@ class PDFTextPage(BasePage):
         self.page = page
         self.parent = parent
         self.filename = filename
-        self.width = self.page.get_width()
-        self.height = self.page.get_height()
-        self._positions_and_text = []  # cache results, because this appears to be slow
-        self._positions_and_text_and_breaks = []
+        with _pdfium_lock:
+            self.width = self.page.get_width()
+            self.height = self.page.get_height()
+        self._word_array = None  # cache results, because this appears to be slow
         super().__init__(page_no)
 
     def get_positions_and_text(
@@ -53,20 +65,38 @@ class PDFTextPage(BasePage):
     def get_image(self, dpi: int = None, rect: Rect = None) -> PILImage:
         if dpi is None:
             dpi = 72
-        scale_factor = dpi / 72
-        if rect is None:
-            bitmap = self.page.render(scale=scale_factor)
-        else:
-            # crop is "amount to cut off" from each side
-            # left, bottom, right, top
-            xmin, ymin, xmax, ymax = rect.bbox
-            # also remember that the origin is at the bottom left
-            crop = (xmin, self.height - ymax, self.width - xmax, ymin)
-            bitmap = self.page.render(scale=scale_factor, crop=crop)
-        return bitmap.to_pil()
+        bbox = None if rect is None else rect.bbox
+        prefetched = self._take_prefetched_image(dpi, bbox)
+        if prefetched is not None:
+            return prefetched
+        render = functools.partial(
+            _render_pdfium, self.page, self.width, self.height, dpi, bbox
+        )
+        return self.parent.render_cache.get(
+            self.page_number, self.width, self.height, dpi, bbox, render
+        )
+
+    def get_array(
+        self, dpi: int = None, rect: Rect = None, mode: Literal["RGB", "L"] = "RGB"
+    ) -> np.ndarray:
+        """
+        Like :meth:`.BasePage.get_array`, but renders straight into the array, without going through PIL.
+        Unlike :meth:`get_image`, results are not cached.
+        """
+        if dpi is None:
+            dpi = 72
+        bbox = None if rect is None else rect.bbox
+        return _render_pdfium_array(self.page, self.width, self.height, dpi, bbox, mode)
+
+    def get_path_sizes(self) -> list[tuple[float, float]]:
+        """
+        (width, height) of the bounding box of each path object on the page, like :meth:`.PyPDFium2Page.get_path_sizes`.
+        """
+        return _get_path_sizes(self.page)
 
     def close(self):
-        self.page.close()
+        with _pdfium_lock:
+            self.page.close()
         self.page = None
 
     def close_document(self):
@@ -76,66 +106,183 @@ class PDFTextPage(BasePage):
         """
         [Experimental] This is a generator that returns the positions and text of the page, as well as the breaks.
         """
-        # cache, since it is slow
-        if self._positions_and_text_and_breaks:
-            for item in self._positions_and_text_and_breaks:
-                yield item
-            return
+        yield from self.get_word_array().iter_positions_and_text_and_breaks()
 
-        # generate
-        captured = []
-        # disable_links necessary to not close the document
-        dict_page = dictionary_output(
-            self.parent.pdfbytes, page_range=[self.page_number], disable_links=True
-        )[0]
-        for b, block in enumerate(dict_page["blocks"]):
-            for l, line in enumerate(block["lines"]):
-                for s, span in enumerate(line["spans"]):
-                    bbox = span["bbox"]
-                    out = (
-                        bbox[0],
-                        bbox[1],
-                        bbox[2],
-                        bbox[3],
-                        span["text"].replace("\n", "").strip(),
-                        b,
-                        l,
-                        s,
-                    )
-                    captured.append(out)
-                    yield out
-        self._positions_and_text_and_breaks = captured
+    def get_word_array(self) -> WordArray:
+        """
+        Columnar view of the words on the page. See :class:`.WordArray`.
+
+        Words are extracted by the document, several pages at a time. See :class:`.PDFTextDocument`.
+        """
+        if self._word_array is None:
+            self._word_array = self.parent._get_word_array(self.page_number)
+        return self._word_array
+
+
+def _word_array_from_pdftext(dict_page: dict) -> WordArray:
+    """
+    Convert a page of pdftext's dictionary_output. Each span becomes a word.
+    """
+    captured = []
+    for b, block in enumerate(dict_page["blocks"]):
+        for l, line in enumerate(block["lines"]):
+            for s, span in enumerate(line["spans"]):
+                bbox = span["bbox"]
+                out = (
+                    bbox[0],
+                    bbox[1],
+                    bbox[2],
+                    bbox[3],
+                    span["text"].replace("\n", "").strip(),
+                    b,
+                    l,
+                    s,
+                )
+                captured.append(out)
+    return WordArray.from_tuples(captured)
 
 
 class PDFTextDocument(BasePDFDocument):
     """
     Wraps a pdfium.PdfDocument object. Note that the memory lifecycle is tightly coupled to the pdfium.PdfDocument object. When this object is destroyed,
     the underlying document is also destroyed.
+
+    The pdf is held in memory once, and shared by pdfium and pdftext.
+
+    Words are extracted by pdftext several pages at a time (see ``chunk_size``), since each call
+    has a large fixed cost. They are cached here, and read by the pages.
     """
 
-    def __init__(self, filename: str):
+    def __init__(
+        self,
+        filename: str,
+        *,
+        render_cache_bytes: int = 0,
+        chunk_size: int = 16,
+        workers: int = None,
+    ):
+        """
+        :param filename: path to the pdf
+        :param render_cache_bytes: memory budget for cached page images, see :class:`.RenderCache`.
+            The cache is off by default (0): outside of :meth:`.BasePDFDocument.iter_pages`,
+            the detector and formatter rarely request the same image twice.
+        :param chunk_size: number of pages whose words are extracted together,
+            starting from the first page that is requested.
+        :param workers: number of processes pdftext may use for one chunk.
+            pdftext gives each process at least 10 pages, and only uses processes for pdfs opened from a filename or bytes.
+        """
         with open(filename, "rb") as f:
             pdfbytes = f.read()
-        self.pdfbytes = io.BytesIO(pdfbytes)
-        self._doc = pdfium.PdfDocument(pdfbytes)
+        self._open(pdfbytes, filename, render_cache_bytes, chunk_size, workers)
+
+    def _open(
+        self,
+        data,
+        filename: str,
+        render_cache_bytes: int = 0,
+        chunk_size: int = 16,
+        workers: int = None,
+    ):
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
         self.filename = filename
+        self.render_cache = RenderCache(max_bytes=render_cache_bytes)
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self._word_arrays: dict[int, WordArray] = {}
+        self._mmap = None
+        # both pdfium and pdftext load from this buffer, without copying it
+        self.pdfbytes, self._view = _as_pdfium_buffer(data)
+        with _pdfium_lock:
+            self._doc = pdfium.PdfDocument(self.pdfbytes)
+
+    @classmethod
+    def from_bytes(cls, data, *, filename: str = None, **kwargs) -> PDFTextDocument:
+        """
+        Open a pdf held in memory, without copying it.
+
+        :param data: bytes, or any contiguous bytes-like object (bytearray, memoryview, mmap, numpy array).
+            It must not be modified or released while the document is open.
+        :param filename: reported by :meth:`get_filename`.
+        :param kwargs: as in :meth:`__init__`
+        """
+        doc = cls.__new__(cls)
+        doc._open(data, filename, **kwargs)
+        return doc
+
+    @classmethod
+    def from_mmap(cls, filename: str, **kwargs) -> PDFTextDocument:
+        """
+        Memory-map the pdf file, and open it without reading it into memory.
+
+        :param kwargs: as in :meth:`__init__`
+        """
+        with open(filename, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        doc = cls.from_bytes(mapped, filename=filename, **kwargs)
+        doc._mmap = mapped
+        return doc
+
+    def load_words(self, page_numbers: Iterable[int] = None):
+        """
+        Extract the words of the given pages (default: all) into the cache, ``chunk_size`` pages per pdftext call.
+        Pages already cached are skipped.
+        """
+        if page_numbers is None:
+            page_numbers = range(len(self))
+        todo = sorted(set(page_numbers) - self._word_arrays.keys())
+        for i in range(0, len(todo), self.chunk_size):
+            self._extract_words(todo[i : i + self.chunk_size])
+
+    def _get_word_array(self, n: int) -> WordArray:
+        words = self._word_arrays.get(n)
+        if words is None:
+            # pages are usually visited in order, so extract the following pages too
+            end = min(n + self.chunk_size, len(self))
+            self._extract_words(
+                [i for i in range(n, end) if i not in self._word_arrays]
+            )
+            words = self._word_arrays[n]
+        return words
+
+    def _extract_words(self, page_numbers: list[int]):
+        kwargs = {} if self.workers is None else {"workers": self.workers}
+        # disable_links necessary to not close the document
+        with _pdfium_lock:
+            dict_pages = dictionary_output(
+                self.pdfbytes, page_range=page_numbers, disable_links=True, **kwargs
+            )
+        for n, dict_page in zip(page_numbers, dict_pages):
+            self._word_arrays[n] = _word_array_from_pdftext(dict_page)
 
     def get_page(self, n: int) -> BasePage:
         """
         Get 0-indexed page
         """
-        return PDFTextPage(self, self._doc[n], self.filename, n)
+        with _pdfium_lock:
+            return PDFTextPage(self, self._doc[n], self.filename, n)
 
     def get_filename(self) -> str:
         return self.filename
 
     def __len__(self) -> int:
-        return len(self._doc)
+        with _pdfium_lock:
+            return len(self._doc)
 
     def close(self):
         """
         Close the document
         """
         if self._doc is not None:
-            self._doc.close()
+            with _pdfium_lock:
+                self._doc.close()
         self._doc = None
+        self.pdfbytes = None
+        self._word_arrays.clear()
+        if self._view is not None:
+            self._view.release()
+            self._view = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+        self.render_cache.clear()
@@ -0,0 +1,273 @@
+"""
+Cache of rendered page images, shared by the pages of a document.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from typing import Callable, Optional
+
+import numpy as np
+from PIL import Image
+from PIL.Image import Image as PILImage
+
+_Bbox = tuple[float, float, float, float]
+
+
+def _pixel_box(
+    width: float, height: float, dpi: float, bbox: Optional[_Bbox]
+) -> tuple[int, int, int, int]:
+    """
+    Pixel box (left, top, right, bottom) that pdfium renders for the given bbox (in pdf units),
+    relative to the full page rendered at the same dpi.
+    Mirrors the rounding of :meth:`pypdfium2.PdfPage.render`.
+    """
+    scale = dpi / 72
+    full_w = math.ceil(width * scale)
+    full_h = math.ceil(height * scale)
+    if bbox is None:
+        return 0, 0, full_w, full_h
+    xmin, ymin, xmax, ymax = bbox
+    return (
+        math.ceil(xmin * scale),
+        math.ceil(ymin * scale),
+        full_w - math.ceil((width - xmax) * scale),
+        full_h - math.ceil((height - ymax) * scale),
+    )
+
+
+def _crop_rendered_array(
+    image: np.ndarray,
+    width: float,
+    height: float,
+    dpi: float,
+    bbox: _Bbox,
+    image_bbox: Optional[_Bbox] = None,
+) -> np.ndarray:
+    """
+    Cut the region bbox (in pdf units) out of an image rendered at dpi,
+    with the same pixel geometry as rendering bbox directly.
+    Parts of bbox that the image does not show are white, as pdfium leaves them beyond the page.
+    If the image shows all of bbox, the result is a view.
+
+    :param image: array (H, W, ...) of the page region image_bbox, rendered at dpi
+    :param image_bbox: region shown by image. Defaults to the full page.
+    """
+    left, top, right, bottom = _pixel_box(width, height, dpi, bbox)
+    img_left, img_top, _, _ = _pixel_box(width, height, dpi, image_bbox)
+    left, right = left - img_left, right - img_left
+    top, bottom = top - img_top, bottom - img_top
+
+    img_h, img_w = image.shape[:2]
+    if left >= 0 and top >= 0 and right <= img_w and bottom <= img_h:
+        return image[top:bottom, left:right]
+    out = np.full((bottom - top, right - left) + image.shape[2:], 255, image.dtype)
+    x0, y0 = max(left, 0), max(top, 0)
+    x1, y1 = min(right, img_w), min(bottom, img_h)
+    if x0 < x1 and y0 < y1:
+        out[y0 - top : y1 - top, x0 - left : x1 - left] = image[y0:y1, x0:x1]
+    return out
+
+
+def _crop_rendered_page(
+    image: np.ndarray,
+    width: float,
+    height: float,
+    dpi: float,
+    bbox: _Bbox,
+    image_bbox: Optional[_Bbox] = None,
+) -> PILImage:
+    """
+    Like :func:`_crop_rendered_array`, as a PIL image.
+    """
+    return Image.fromarray(
+        np.ascontiguousarray(
+            _crop_rendered_array(image, width, height, dpi, bbox, image_bbox)
+        )
+    )
+
+
+def _shared(image: PILImage) -> PILImage:
+    """
+    A new image object on the same pixels, which PIL copies before any modification.
+    """
+    shared = image._new(image.im)
+    shared.readonly = 1
+    return shared
+
+
+class _Entry:
+    __slots__ = ("key", "page_no", "dpi", "box", "image", "nbytes")
+
+    def __init__(self, key: tuple, box: tuple[int, int, int, int], image: PILImage):
+        self.key = key
+        self.page_no, self.dpi, _ = key
+        self.box = box
+        self.image = image
+        self.nbytes = image.width * image.height * len(image.getbands())
+
+
+class RenderCache:
+    """
+    LRU cache of rendered page images, keyed by (page, dpi, rect), and bounded by a memory budget.
+
+    By default, only identical requests are served from the cache.
+    With ``derive=True``, a request may also be served from a cached image
+    of the same page which covers the requested region at the same or a higher dpi,
+    by cropping (and downscaling) it instead of re-rasterizing.
+    Derived images are close to, but not bit-identical with, a direct render,
+    because pdfium's antialiasing depends on the render origin.
+
+    Counters ``hits``, ``derived`` (the subset of hits that were derived), ``misses`` and ``evictions``
+    are kept for profiling; see :attr:`stats`.
+
+    The cache may be used from several threads (see :meth:`.BasePDFDocument.iter_pages`).
+    Rendering happens outside of its lock.
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20, derive: bool = False):
+        """
+        :param max_bytes: memory budget for the cached images (assuming 1 byte per channel). 0 disables caching.
+        :param derive: whether to serve cropped or lower-dpi requests from a larger cached image.
+        """
+        self.max_bytes = max_bytes
+        self.derive = derive
+        self._entries: OrderedDict[tuple, _Entry] = OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.derived = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self,
+        page_no: int,
+        width: float,
+        height: float,
+        dpi: float,
+        bbox: Optional[_Bbox],
+        render: Callable[[], PILImage],
+    ) -> PILImage:
+        """
+        Get the image of a page region, rendering it with ``render()`` on a miss.
+
+        :param page_no: page number
+        :param width: page width, in pdf units
+        :param height: page height, in pdf units
+        :param dpi: dpi of the requested image
+        :param bbox: requested region (xmin, ymin, xmax, ymax) in pdf units, or None for the full page
+        :param render: renders the requested image
+        :return: an image which shares its pixels with the cache, without a copy.
+            Modifying it (paste, ImageDraw, ...) copies it first, so the cache is left intact,
+            but its pixel access (``load()``) is read-only: use ``.copy()`` to write pixels directly.
+        """
+        if self.max_bytes <= 0:
+            self.misses += 1
+            return render()
+
+        key = (page_no, dpi, None if bbox is None else tuple(bbox))
+        box = _pixel_box(width, height, dpi, bbox)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return _shared(entry.image)
+
+            if self.derive:
+                img = self._derive(page_no, dpi, box)
+                if img is not None:
+                    self.hits += 1
+                    self.derived += 1
+                    return img
+            self.misses += 1
+
+        img = render()
+        with self._lock:
+            self._put(_Entry(key, box, img))
+        return _shared(img)
+
+    def _derive(
+        self, page_no: int, dpi: float, box: tuple[int, int, int, int]
+    ) -> Optional[PILImage]:
+        """
+        Crop (and downscale) the requested pixel box from a cached image that covers it.
+        Same-dpi images are preferred, then the lowest sufficient dpi.
+        """
+        best = None
+        for entry in self._entries.values():
+            if entry.page_no != page_no or entry.dpi < dpi:
+                continue
+            if best is not None and entry.dpi >= best.dpi:
+                continue
+            if entry.dpi == dpi:
+                src = box
+            else:
+                # the requested pixel box, in the pixel space of the cached image
+                ratio = entry.dpi / dpi
+                src = tuple(v * ratio for v in box)
+            left, top, right, bottom = entry.box
+            if (
+                src[0] >= left
+                and src[1] >= top
+                and src[2] <= right
+                and src[3] <= bottom
+            ):
+                best = entry
+                if entry.dpi == dpi:
+                    break
+        if best is None:
+            return None
+
+        self._entries.move_to_end(best.key)
+        left, top = best.box[:2]
+        if best.dpi == dpi:
+            return best.image.crop(
+                (box[0] - left, box[1] - top, box[2] - left, box[3] - top)
+            )
+        ratio = best.dpi / dpi
+        src = (
+            box[0] * ratio - left,
+            box[1] * ratio - top,
+            box[2] * ratio - left,
+            box[3] * ratio - top,
+        )
+        return best.image.resize(
+            (box[2] - box[0], box[3] - box[1]), Image.Resampling.BOX, box=src
+        )
+
+    def _put(self, entry: _Entry):
+        if entry.nbytes > self.max_bytes:
+            return
+        previous = self._entries.pop(entry.key, None)
+        if previous is not None:
+            # rendered concurrently by another thread
+            self.nbytes -= previous.nbytes
+        self._entries[entry.key] = entry
+        self.nbytes += entry.nbytes
+        while self.nbytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= evicted.nbytes
+            self.evictions += 1
+
+    def clear(self):
+        """Drop all cached images. Counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict:
+        """Counters and current memory use."""
+        return {
+            "hits": self.hits,
+            "derived": self.derived,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "nbytes": self.nbytes,
+        }
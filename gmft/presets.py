@@ -1,23 +1,63 @@
+from typing import Union
+
 from gmft.pdf_bindings.pdfium import PyPDFium2Document
 from gmft.detectors.base import CroppedTable
+from gmft.detectors.prefilter import PagePrefilter
 from gmft.auto import AutoTableDetector
+from gmft.profiles import PipelineProfile, get_profile
 
 
 default_detector = None
+"""If set, the detector used by :func:`ingest_pdf`."""
+
+default_prefilter: PagePrefilter = None
+"""If set, the page prefilter used by :func:`ingest_pdf`, for instance :func:`.builtin_prefilter()`."""
 
 
-def ingest_pdf(pdf_path) -> tuple[list[CroppedTable], PyPDFium2Document]:
+def ingest_pdf(
+    pdf_path,
+    prefilter: PagePrefilter = None,
+    profile: Union[str, PipelineProfile] = None,
+    detector=None,
+) -> tuple[list[CroppedTable], PyPDFium2Document]:
     """
     Default ingestion function for PDFs.
     For finer-grained control, modify this function.
+
+    :param prefilter: skip the pages which it rejects, without rendering them or running the detector.
+        Defaults to the profile's, or else :data:`default_prefilter` (no filtering, unless set).
+    :param profile: a speed/accuracy profile from :mod:`gmft.profiles` ("fast", "balanced" or "accurate"),
+        which sets the detector, the prefilter and the batch size.
+    :param detector: Defaults to the profile's detector, or else :data:`default_detector`.
     """
     doc = PyPDFium2Document(pdf_path)
-    global default_detector
-    if default_detector is None:
-        default_detector = AutoTableDetector()
+    batch_size = 1
+    if profile is not None:
+        profile = get_profile(profile)
+        if detector is None:
+            detector = profile.make_detector()
+        if prefilter is None:
+            prefilter = profile.make_prefilter()
+        batch_size = profile.batch_size
+    if detector is None:
+        detector = default_detector
+    if detector is None:
+        # cheap after the first call: the model is shared through the model registry
+        detector = AutoTableDetector()
+    if prefilter is None:
+        prefilter = default_prefilter
 
+    # render and read the next pages while the detector runs
+    pages = doc.iter_pages(
+        prefetch=2,
+        dpi=getattr(getattr(detector, "config", None), "dpi", 72),
+        prefilter=prefilter,
+    )
     tables = []
-    for page in doc:
-        # Possible to insert a text regex before extraction to filter out unwanted text
-        tables += default_detector.extract(page)
+    if batch_size > 1:
+        for page_tables in detector.extract_batch(pages, batch_size=batch_size):
+            tables += page_tables
+    else:
+        for page in pages:
+            tables += detector.extract(page)
     return tables, doc
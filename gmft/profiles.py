@@ -0,0 +1,146 @@
+"""
+Named speed/accuracy profiles, which set the knobs of the whole pipeline together:
+page prefiltering, render resolutions, model input sizes, preprocessing, quantization and batching.
+
+- "accurate": the defaults. Every page is rendered and detected, and tables are rendered at 144 dpi.
+- "balanced": the same models and resolutions, with native preprocessing, the built-in page prefilter
+  and batches of 4. Tables match "accurate", except on pages which the prefilter wrongly skips
+  and small differences from batching.
+- "fast": also shrinks the model inputs (600 / 1000 pixels instead of 800 / 1333), renders each table
+  at the dpi which fits that size (``dpi="auto"``), quantizes the models to int8 on cpu, and runs batches of 8.
+
+Thresholds are left at their defaults: lowering the resolution already costs recall,
+and higher thresholds would only cost more.
+
+In a checkout of the repository, ``test/scripts/script_profile_report.py`` measures the profiles on your own pdfs.
+
+Example::
+
+    from gmft.presets import ingest_pdf
+    from gmft.profiles import get_profile
+
+    profile = get_profile("fast")
+    tables, doc = ingest_pdf("paper.pdf", profile=profile)
+    formatter = profile.make_formatter()
+    formatted = formatter.extract_batch(tables, batch_size=profile.batch_size)
+"""
+
+from dataclasses import dataclass, field, replace
+from typing import Callable, Optional, TypeVar, Union
+
+from gmft.core._dataclasses import with_config
+from gmft.core.ml import _resolve_device
+from gmft.detectors.prefilter import PagePrefilter, builtin_prefilter
+from gmft.detectors.tatr import TATRDetector
+from gmft.impl.tatr.config import TATRDetectorConfig, TATRFormatConfig
+
+ConfigT = TypeVar("ConfigT", TATRDetectorConfig, TATRFormatConfig)
+
+
+@dataclass
+class PipelineProfile:
+    """
+    Settings for the detector, the formatter and the pipeline around them, chosen together.
+    """
+
+    name: str
+
+    detector: dict = field(default_factory=dict)
+    """Overrides of :class:`.TATRDetectorConfig`."""
+
+    formatter: dict = field(default_factory=dict)
+    """Overrides of the formatter's config (:class:`.TATRFormatConfig`, or a subclass like :class:`.DITRFormatConfig`)."""
+
+    prefilter: Optional[Callable[[], PagePrefilter]] = None
+    """Makes the page prefilter. None: every page is detected."""
+
+    batch_size: int = 1
+    """Number of pages (or tables) per forward pass."""
+
+    def detector_config(self, config: TATRDetectorConfig = None) -> TATRDetectorConfig:
+        """
+        The detector config of this profile, on top of config (by default, the defaults).
+        """
+        return _apply(config or TATRDetectorConfig(), self.detector)
+
+    def formatter_config(self, config: TATRFormatConfig = None) -> TATRFormatConfig:
+        """
+        The formatter config of this profile, on top of config (by default, the defaults of :class:`.TATRFormatConfig`).
+        Pass a :class:`.DITRFormatConfig` for the DITR formatter.
+        """
+        return _apply(config or TATRFormatConfig(), self.formatter)
+
+    def make_detector(self, config: TATRDetectorConfig = None) -> TATRDetector:
+        return TATRDetector(self.detector_config(config))
+
+    def make_formatter(self, config: TATRFormatConfig = None):
+        """
+        A :class:`.TATRFormatter`, or a :class:`.DITRFormatter` if config is a :class:`.DITRFormatConfig`.
+        """
+        from gmft.impl.ditr.config import DITRFormatConfig
+
+        config = self.formatter_config(config)
+        if isinstance(config, DITRFormatConfig):
+            from gmft.formatters.ditr import DITRFormatter
+
+            return DITRFormatter(config)
+        from gmft.formatters.tatr import TATRFormatter
+
+        return TATRFormatter(config)
+
+    def make_prefilter(self) -> Optional[PagePrefilter]:
+        return self.prefilter() if self.prefilter is not None else None
+
+
+def _apply(config: ConfigT, overrides: dict) -> ConfigT:
+    config = with_config(config, overrides)
+    if (
+        config.quantization == "dynamic-int8"
+        and _resolve_device(config.torch_device) != "cpu"
+    ):
+        # dynamic int8 quantization only runs on cpu
+        config = replace(config, quantization="none")
+    return config
+
+
+_SMALL_INPUT = {"shortest_edge": 600, "longest_edge": 1000}
+
+PROFILES: dict[str, PipelineProfile] = {
+    "accurate": PipelineProfile("accurate"),
+    "balanced": PipelineProfile(
+        "balanced",
+        detector={"preprocessing": "native"},
+        formatter={"preprocessing": "native"},
+        prefilter=builtin_prefilter,
+        batch_size=4,
+    ),
+    "fast": PipelineProfile(
+        "fast",
+        detector={
+            "preprocessing": "native",
+            "model_input_size": dict(_SMALL_INPUT),
+            "quantization": "dynamic-int8",
+        },
+        formatter={
+            "preprocessing": "native",
+            "dpi": "auto",
+            "model_input_size": dict(_SMALL_INPUT),
+            "quantization": "dynamic-int8",
+        },
+        prefilter=builtin_prefilter,
+        batch_size=8,
+    ),
+}
+
+
+def get_profile(profile: Union[str, PipelineProfile]) -> PipelineProfile:
+    """
+    Look up a profile by name: "fast", "balanced" or "accurate". Profiles are passed through.
+    """
+    if isinstance(profile, PipelineProfile):
+        return profile
+    if profile not in PROFILES:
+        raise ValueError(
+            f"Unknown profile {profile!r}: expected one of {', '.join(PROFILES)}"
+        )
+    return PROFILES[profile]
@@ -1,8 +1,11 @@
+import dataclasses
 import json
 import os
 import pytest
 
 import matplotlib
+import numpy as np
+from pandas.testing import assert_frame_equal
 
 from gmft.formatters.tatr import TATRFormattedTable
 
@@ -11,6 +14,10 @@ matplotlib.use("Agg")
 from gmft.pdf_bindings.pdfium import PyPDFium2Document
 from gmft.detectors.tatr import TATRDetector, TATRDetectorConfig
 from gmft.auto import AutoTableDetector, AutoTableFormatter
+from gmft.formatters.ditr import DITRFormatter
+from gmft.formatters.tatr import TATRFormatter
+from gmft.impl.ditr.config import DITRFormatConfig
+from gmft.impl.tatr.config import TATRFormatConfig
 
 # from gmft_pymupdf import PyMuPDFDocument
 # from gmft.pdf_bindings.pdftext import PDFTextDocument
@@ -29,6 +36,134 @@ def formatter():
     yield AutoTableFormatter()
 
 
+@pytest.fixture(scope="session")
+def tiny_tatr_model():
+    """A small TableTransformer with random weights, for tests which cannot download the models."""
+    import torch
+    from transformers import (
+        ResNetConfig,
+        TableTransformerConfig,
+        TableTransformerForObjectDetection,
+    )
+
+    torch.manual_seed(0)
+    config = TableTransformerConfig(
+        use_timm_backbone=False,
+        use_pretrained_backbone=False,
+        backbone=None,
+        backbone_config=ResNetConfig(
+            out_features=["stage4"],
+            depths=[1, 1, 1, 1],
+            hidden_sizes=[16, 32, 64, 128],
+            embedding_size=16,
+        ),
+        num_labels=6,
+        d_model=32,
+        encoder_layers=1,
+        decoder_layers=1,
+        num_queries=20,
+    )
+    return TableTransformerForObjectDetection(config).eval()
+
+
+TINY_MODEL_PATH = "gmft-test/tiny-table-transformer"
+
+
+@pytest.fixture(scope="session")
+def tiny_model_path(tiny_tatr_model):
+    """
+    Registers tiny_tatr_model in the model registry, so that detectors and formatters
+    whose config names this path are built by their regular constructors, without downloads.
+    """
+    from transformers import DetrImageProcessor
+
+    from gmft.core.ml.registry import get_model_registry
+
+    registry = get_model_registry()
+    # TATR models are loaded from the "no_timm" revision, DITR from the default one
+    for revision in ["no_timm", None]:
+        registry.register(
+            TINY_MODEL_PATH,
+            tiny_tatr_model,
+            image_processor=DetrImageProcessor(),
+            revision=revision,
+        )
+    yield TINY_MODEL_PATH
+    registry.evict(TINY_MODEL_PATH)
+
+
+@pytest.fixture
+def tiny_detector(tiny_model_path):
+    """
+    Factory of TATRDetectors on the tiny model: ``tiny_detector(config)``.
+    The config defaults to cpu and native preprocessing; its model paths are replaced.
+    """
+
+    def make(config: TATRDetectorConfig = None) -> TATRDetector:
+        if config is None:
+            config = TATRDetectorConfig(torch_device="cpu", preprocessing="native")
+        return TATRDetector(
+            dataclasses.replace(
+                config,
+                detector_path=tiny_model_path,
+                image_processor_path=tiny_model_path,
+            )
+        )
+
+    return make
+
+
+@pytest.fixture
+def tiny_formatter(tiny_model_path):
+    """
+    Factory of formatters on the tiny model: ``tiny_formatter(config)``.
+    A DITRFormatConfig gives a DITRFormatter, otherwise a TATRFormatter.
+    The config defaults to cpu and native preprocessing; its model paths are replaced.
+    """
+
+    def make(config: TATRFormatConfig = None) -> TATRFormatter:
+        if config is None:
+            config = TATRFormatConfig(torch_device="cpu", preprocessing="native")
+        cls = DITRFormatter if isinstance(config, DITRFormatConfig) else TATRFormatter
+        return cls(
+            dataclasses.replace(
+                config,
+                formatter_path=tiny_model_path,
+                image_processor_path=tiny_model_path,
+            )
+        )
+
+    return make
+
+
+@pytest.fixture
+def fake_predict(monkeypatch):
+    """
+    Replaces the model inference of the detector and the formatters: ``images = fake_predict(predict)``.
+    Each image passed to the model is recorded in images, and predict(image) is returned for it
+    (by default, no boxes).
+    """
+
+    def install(predict=None) -> list:
+        images = []
+
+        def fake(model, batch, threshold, **kwargs):
+            images.extend(batch)
+            if predict is None:
+                return [{"scores": [], "labels": [], "boxes": []} for _ in batch]
+            return [predict(image) for image in batch]
+
+        for module in [
+            "gmft.detectors.tatr",
+            "gmft.formatters.tatr",
+            "gmft.formatters.ditr",
+        ]:
+            monkeypatch.setattr(f"{module}._predict", fake)
+        return images
+
+    return install
+
+
 @pytest.fixture(scope="session")
 def doc_pubt():
     doc = PyPDFium2Document("data/pdfs/tatr.pdf")
@@ -107,6 +242,21 @@ def get_tables_for_pdf(
     return tables
 
 
+def assert_same_extraction(actual, expected, atol: float = 0.5):
+    """
+    Helper function to check that a formatted table (for instance, from a batch) matches the one from extract():
+    same labels, boxes within atol pdf units, and the same df.
+    """
+    assert actual.bbox == expected.bbox
+    assert actual.predictions.tatr["labels"] == expected.predictions.tatr["labels"]
+    np.testing.assert_allclose(
+        np.reshape(actual.predictions.tatr["boxes"], (-1, 4)),
+        np.reshape(expected.predictions.tatr["boxes"], (-1, 4)),
+        atol=atol,
+    )
+    assert_frame_equal(actual.df(), expected.df())
+
+
 def dump_text(string: str, filename: str):
     """
     Helper function to dump text to a file.
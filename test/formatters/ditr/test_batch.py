@@ -0,0 +1,23 @@
+from gmft.detectors.base import CroppedTable
+from gmft.impl.ditr.config import DITRFormatConfig
+from test.conftest import assert_same_extraction
+
+
+def test_ditr_extract_batch(tiny_formatter, cropped_tables, docs_bulk):
+    # the random model's boxes are all below the default threshold
+    formatter = tiny_formatter(
+        DITRFormatConfig(
+            torch_device="cpu", preprocessing="native", formatter_base_threshold=0.0
+        )
+    )
+    doc = docs_bulk[0]
+    tables = [
+        CroppedTable.from_dict(d, doc[d["page_no"]])
+        for name, d in cropped_tables.items()
+        if name.startswith("pdf1_")
+    ]
+    batched = formatter.extract_batch(tables, batch_size=4)
+    assert len(batched) == len(tables)
+    for table, ft in zip(tables, batched):
+        assert ft.predictions.tatr["boxes"]
+        assert_same_extraction(ft, formatter.extract(table))
@@ -1,3 +1,6 @@
+import numpy as np
+import pytest
+
 from gmft.algorithm.histogram import IntervalHistogram
 
 
@@ -120,3 +123,31 @@ def test_histogram_8():
     assert hist.sorted_points == expected_points, (
         f"Expected {expected_points}, got {hist.sorted_points}"
     )
+
+
+def test_histogram_height():
+    # the second interval raises the frequency of [2, 3), which lies inside it, to 2
+    hist = IntervalHistogram()
+    hist.append((2, 3))
+    hist.append((0, 10))
+    assert hist.height == 2
+    assert hist.height == max(freq for _, freq in hist.sorted_points)
+    assert IntervalHistogram.from_intervals([2, 0], [3, 10]).height == 2
+
+
+def test_from_intervals():
+    rng = np.random.default_rng(0)
+    for trial in range(50):
+        n = int(rng.integers(0, 60))
+        starts = rng.integers(0, 30, n).round(1)
+        ends = starts + rng.integers(0, 10, n)
+        min_x, max_x = (5, 40) if trial % 2 else (None, None)
+        expected = IntervalHistogram(min_x, max_x)
+        for interval in zip(starts.tolist(), ends.tolist()):
+            expected.append(interval)
+        actual = IntervalHistogram.from_intervals(starts, ends, min_x, max_x)
+        assert actual.sorted_points == expected.sorted_points
+        assert actual.height == expected.height
+
+    with pytest.raises(ValueError):
+        IntervalHistogram.from_intervals([5], [3])
@@ -0,0 +1,48 @@
+import pytest
+
+from gmft.core.ml.processing import _resized_size
+from gmft.detectors.base import CroppedTable
+from gmft.formatters.base import _auto_dpi
+from gmft.impl.tatr.config import TATRFormatConfig
+
+
+@pytest.mark.parametrize(
+    "bbox", [(50, 50, 560, 740), (100, 100, 160, 130), (72, 300, 540, 320)]
+)
+def test_auto_dpi_matches_model_input(doc_tiny, bbox):
+    table = CroppedTable(doc_tiny[0], bbox, 0.9, 0)
+    dpi = _auto_dpi(table)
+    image = table.image_array(dpi=dpi, padding="auto")
+    height, width = image.shape[:2]
+    # the model's resize is (almost) a no-op
+    resized = _resized_size(height, width)
+    assert abs(resized[0] - height) <= 2 and abs(resized[1] - width) <= 2
+
+    image = table.image_array(dpi=_auto_dpi(table, max_pixels=100_000), padding="auto")
+    assert image.shape[0] * image.shape[1] <= 101_000
+
+
+def test_extract_auto_dpi(tiny_formatter, fake_predict, doc_tiny, monkeypatch):
+    formatter = tiny_formatter(
+        TATRFormatConfig(torch_device="cpu", preprocessing="native", dpi="auto")
+    )
+
+    def column_inside_padding(image):
+        # a column spanning the image, inside the padding
+        height, width = image.shape[:2]
+        left, top = table._img_padding[:2]
+        box = [left, top, width - left, height - top]
+        return {"scores": [0.9], "labels": [1], "boxes": [box]}
+
+    fake_predict(column_inside_padding)
+    monkeypatch.setattr("gmft.formatters.tatr.extract_to_df", lambda *args: None)
+    dpis = []
+    for bbox in [(100, 100, 160, 130), (50, 50, 560, 740)]:
+        table = CroppedTable(doc_tiny[0], bbox, 0.9, 0)
+        ft = formatter.extract(table, margin="auto")
+        dpis.append(ft._img_dpi)
+        # boxes are in pdf units, relative to the table, up to the rounding of the image size
+        box = ft.predictions.tatr["boxes"][0]
+        expected = (-30, -30, table.width + 30, table.height + 30)
+        assert box == pytest.approx(expected, abs=2 * 72 / ft._img_dpi)
+    assert dpis[0] > 144 > dpis[1]
@@ -0,0 +1,67 @@
+import json
+
+import numpy as np
+import pytest
+
+from gmft.algorithm.structure import _fill_using_partitions
+from gmft.formatters.tatr import TATRFormattedTable
+from gmft.impl.tatr.config import TATRFormatConfig
+from gmft.pdf_bindings.pdfium import PyPDFium2Document
+
+
+def _fill(engine, words, rows, columns):
+    outliers = {}
+    row_means = [[] for _ in rows]
+    table_array = _fill_using_partitions(
+        iter(words),
+        TATRFormatConfig(cell_assignment=engine),
+        rows,
+        columns,
+        outliers,
+        row_means,
+    )
+    return table_array.tolist(), outliers, row_means
+
+
+def _random_boxes(rng, n, axis):
+    # partitions along axis, spanning the table in the other direction, sorted by their max
+    boxes = np.zeros((n, 4))
+    boxes[:, axis] = rng.uniform(0, 300, n)
+    boxes[:, axis + 2] = boxes[:, axis] + rng.uniform(-5, 60, n)
+    boxes[:, 1 - axis] = rng.uniform(-10, 10, n)
+    boxes[:, 3 - axis] = 300 + rng.uniform(-10, 10, n)
+    boxes = boxes.round()  # ties
+    return [{"bbox": b} for b in boxes[np.argsort(boxes[:, axis + 2])].tolist()]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_numpy_engine_matches_python(seed):
+    rng = np.random.default_rng(seed)
+    # some tables without rows or without columns
+    rows = _random_boxes(rng, 0 if seed % 5 == 0 else rng.integers(0, 30), axis=1)
+    columns = _random_boxes(rng, 0 if seed % 5 == 1 else rng.integers(0, 8), axis=0)
+    words = []
+    for i in range(rng.integers(0, 300)):
+        x, y = rng.uniform(-20, 320, 2).round()
+        w, h = rng.uniform(-2, 30), rng.uniform(-2, 12)
+        words.append((x, y, x + w, y + h, f"w{i}"))
+    assert _fill("numpy", words, rows, columns) == _fill("python", words, rows, columns)
+
+
+def test_numpy_engine_on_references():
+    with open("data/test/references/tatr_tables.json", encoding="utf-8") as f:
+        references = json.load(f)
+    doc = PyPDFium2Document("data/pdfs/1.pdf")
+    for name, d in references.items():
+        if d["filename"] != "data/pdfs/1.pdf":
+            continue
+        for large_table in [None, True]:
+            results = []
+            for engine in ["python", "numpy"]:
+                ft = TATRFormattedTable.from_dict(d, doc[d["page_no"]])
+                config = TATRFormatConfig(
+                    cell_assignment=engine, force_large_table_assumption=large_table
+                )
+                results.append((ft.df(config_overrides=config).to_csv(), ft.outliers))
+            assert results[0] == results[1], name
+    doc.close()
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from gmft.detectors.base import CroppedTable
+
+
+@pytest.mark.parametrize("padding", ["auto", None])
+def test_extract_page_shared_region(
+    tiny_formatter, fake_predict, doc_tiny, monkeypatch, padding
+):
+    formatter = tiny_formatter()
+    images = fake_predict()
+    monkeypatch.setattr("gmft.formatters.tatr.extract_to_df", lambda *args: None)
+
+    page = doc_tiny[0]
+    # with their margins, the tables overlap, so the region spanning them is rendered once
+    tables = [
+        CroppedTable(page, (100, 100, 300, 200), 0.9, 0),
+        CroppedTable(page, (100, 210, 300, 300), 0.9, 0),
+        CroppedTable(page, (310, 100, 400, 300), 0.9, 0, angle=90),
+    ]
+    margin = (20, 20, 20, 20)
+
+    rendered = []
+    get_array = type(page).get_array
+
+    def spy_get_array(self, dpi=None, rect=None, mode="RGB"):
+        rendered.append(rect.bbox)
+        return get_array(self, dpi=dpi, rect=rect, mode=mode)
+
+    monkeypatch.setattr(type(page), "get_array", spy_get_array)
+    shared = formatter.extract_page(tables, padding=padding, margin=margin)
+    assert rendered == [(80, 80, 420, 320)]
+    shared_images = images[:]
+
+    images.clear()
+    expected = [
+        formatter.extract(table, padding=padding, margin=margin) for table in tables
+    ]
+    assert len(rendered) == 1 + len(tables)
+
+    for ft, ft_expected, image, image_expected in zip(
+        shared, expected, shared_images, images
+    ):
+        assert ft._img_dpi == ft_expected._img_dpi
+        assert ft._img_padding == ft_expected._img_padding
+        assert ft._img_margin == ft_expected._img_margin
+        assert image.shape == image_expected.shape
+        # up to a few antialiased pixels at the edges of the crop
+        diff = np.abs(
+            np.asarray(image, np.int16) - np.asarray(image_expected, np.int16)
+        )
+        assert (diff > 8).mean() < 0.001
@@ -8,6 +8,7 @@ from gmft.detectors.base import CroppedTable
 from gmft.detectors.tatr import TATRDetector
 from gmft.auto import AutoTableFormatter
 from gmft.pdf_bindings.base import ImageOnlyPage
+from test.conftest import assert_same_extraction
 
 
 def test_tiny_df(doc_tiny):
@@ -34,6 +35,45 @@ def test_tiny_df(doc_tiny):
     assert_frame_equal(expected, ft.df())
 
 
+def test_tiny_df_extract_page(doc_tiny, detector, formatter):
+    tables = detector.extract(doc_tiny[0])
+    assert len(tables) == 1
+
+    [ft] = formatter.extract_page(tables)
+    expected = pd.DataFrame(
+        {
+            "Name": ["Water Freezing Point", "Water Boiling Point", "Body Temperature"],
+            "Celsius": ["0", "100", "37"],
+            "Fahrenheit": ["32", "212", "98.6"],
+        }
+    )
+
+    assert_frame_equal(expected, ft.df())
+
+
+def test_detector_extract_batch(docs_bulk, detector):
+    pages = [page for doc in docs_bulk[:2] for page in doc]
+    batched = detector.extract_batch(pages, batch_size=3)
+    assert len(batched) == len(pages)
+    for page, tables in zip(pages, batched):
+        expected = detector.extract(page)
+        assert len(tables) == len(expected)
+        for table, ref in zip(tables, expected):
+            assert table.page is page
+            assert table.angle == ref.angle
+            assert table.bbox == pytest.approx(ref.bbox, abs=5.0)
+
+
+def test_formatter_extract_batch(docs_bulk, detector, formatter):
+    tables = [t for page in docs_bulk[0] for t in detector.extract(page)]
+    batched = formatter.extract_batch(tables, batch_size=4)
+    assert len(batched) == len(tables)
+    for table, ft in zip(tables, batched):
+        assert ft.bbox == table.bbox
+        # the model sees padded inputs, so boxes may move slightly
+        assert_same_extraction(ft, formatter.extract(table), atol=2.0)
+
+
 def test_tiny_df_image_only(doc_tiny):
     detector = TATRDetector()
 
@@ -0,0 +1,57 @@
+import json
+
+import numpy as np
+import pytest
+
+from gmft.core.ml.prediction import _threshold_raw_predictions
+from gmft.detectors.base import CroppedTable
+from gmft.formatters.tatr import TATRFormattedTable
+from gmft.impl.tatr.config import TATRFormatConfig
+
+
+def test_raw_predictions(tiny_formatter, doc_tiny, monkeypatch):
+    formatter = tiny_formatter(
+        TATRFormatConfig(
+            torch_device="cpu",
+            preprocessing="native",
+            keep_raw_predictions=True,
+            formatter_base_threshold=0.2,
+        )
+    )
+    table = CroppedTable(doc_tiny[0], (10, 10, 300, 300), 0.9, 0)
+    ft = formatter.extract(table)
+    raw = ft.predictions.raw
+    # 20 queries, 6 labels + no object, box
+    assert raw.dtype == np.float16 and raw.shape == (20, 11)
+    assert ft.predictions.threshold == 0.2
+
+    # the kept predictions are those of the raw array above the threshold
+    expected = _threshold_raw_predictions(raw, 0.2)
+    assert ft.predictions.tatr["labels"] == expected["labels"]
+    assert np.allclose(ft.predictions.tatr["boxes"], expected["boxes"], atol=0.5)
+
+    # round trip through json
+    d = json.loads(json.dumps(ft.to_dict()))
+    restored = TATRFormattedTable.from_dict(d, doc_tiny[0])
+    assert np.array_equal(restored.predictions.raw, raw)
+    assert restored.predictions.threshold == 0.2
+
+    # recompute with another threshold, without the model
+    seen = []
+    monkeypatch.setattr(
+        "gmft.formatters.tatr.extract_to_df",
+        lambda table, config: seen.append(table.predictions.tatr),
+    )
+    restored.recompute(TATRFormatConfig(formatter_base_threshold=0.0))
+    assert len(seen[-1]["labels"]) == 20
+    restored.recompute(TATRFormatConfig(formatter_base_threshold=1.0))
+    assert len(seen[-1]["labels"]) == 0
+    assert restored.predictions.threshold == 1.0
+
+
+def test_rethreshold_requires_raw(doc_tiny):
+    table = CroppedTable(doc_tiny[0], (10, 10, 300, 300), 0.9, 0)
+    ft = TATRFormattedTable(table, {"scores": [], "labels": [], "boxes": []})
+    assert "predictions.raw" not in ft.to_dict()
+    with pytest.raises(ValueError):
+        ft.predictions.rethreshold(0.5)
@@ -0,0 +1,136 @@
+import copy
+import gc
+import os
+import pickle
+import shutil
+import threading
+
+import pytest
+
+from gmft.detectors.base import CroppedTable
+from gmft.pdf_bindings import DocumentPool, PyPDFium2Document
+from gmft.pdf_bindings import doc_pool
+from gmft.pdf_bindings.pdfium import PyPDFium2Utils
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    pool = DocumentPool(max_open=2)
+    monkeypatch.setattr(doc_pool, "_pool", pool)
+    monkeypatch.setattr(doc_pool, "_pool_pid", os.getpid())
+    yield pool
+    gc.collect()
+    pool.clear()
+
+
+def test_unpickled_tables_share_one_document(pool, doc_tiny):
+    table = CroppedTable(doc_tiny[0], (10, 12, 300, 150), 0.9, 0)
+    data = pickle.dumps(table)
+    tables = [pickle.loads(data) for _ in range(50)]
+    assert pool.stats["opens"] == 1
+    assert pool.stats["hits"] == 49
+    assert len({id(t.page.parent) for t in tables}) == 1
+    assert all(t.text() == table.text() for t in tables)
+    assert tables[0].page.get_filename() == "data/pdfs/tiny.pdf"
+
+    doc = tables[0].page.parent
+    del tables
+    gc.collect()
+    assert pool.stats["borrowed"] == 0
+    # kept open for later borrowers
+    assert not doc._is_closed()
+    pickle.loads(data)
+    assert pool.stats["opens"] == 1
+
+
+def test_pool_lru_cap(pool):
+    pages = [
+        PyPDFium2Utils.load_page_from_dict({"filename": f, "page_no": 0})
+        for f in ["data/pdfs/tiny.pdf", "data/pdfs/1.pdf", "data/pdfs/2.pdf"]
+    ]
+    # borrowed documents stay open beyond the cap
+    assert len(pool) == 3
+    docs = [p.parent for p in pages]
+
+    pages[0].close_document()
+    assert pool.stats["borrowed"] == 2
+    # the least recently used idle document is closed
+    assert docs[0]._is_closed()
+    assert len(pool) == 2
+    assert pool.stats["evictions"] == 1
+    assert not docs[1]._is_closed()
+
+
+def test_pool_reload_and_modified_file(pool, doc_tiny, tmp_path):
+    path = str(tmp_path / "tiny.pdf")
+    shutil.copy("data/pdfs/tiny.pdf", path)
+    doc = PyPDFium2Document(path)
+    table = CroppedTable(doc[0], (10, 12, 300, 150), 0.9, 0)
+    doc.close()
+
+    # reload borrows from the pool, and closing the result ends the lease
+    tables = [copy.copy(table) for _ in range(3)]
+    leases = [PyPDFium2Utils.reload(t)[1] for t in tables]
+    assert pool.stats["opens"] == 1
+    assert pool.stats["borrowed"] == 1
+    assert len(leases[0]) == 1 and leases[0][0].page_number == 0
+    text = tables[0].text()
+    shared = tables[0].page.parent
+    for lease in leases:
+        lease.close()
+        lease.close()
+    del tables
+    gc.collect()
+    assert pool.stats["borrowed"] == 0
+    assert not shared._is_closed()
+
+    # unless a document is given
+    table, given = PyPDFium2Utils.reload(table, PyPDFium2Document(path))
+    assert table.page.parent is given
+    given.close()
+
+    page = PyPDFium2Utils.load_page_from_dict({"filename": path, "page_no": 0})
+    borrowed = page.parent
+    assert pool.stats["borrowed"] == 1
+
+    # a modified file is opened again
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    other = PyPDFium2Utils.load_page_from_dict({"filename": path, "page_no": 0})
+    assert other.parent is not borrowed
+    table.page = other
+    assert table.text() == text
+    assert pool.stats["opens"] == 2
+
+    # closing twice is harmless
+    page.close_document()
+    page.close_document()
+    assert pool.stats["borrowed"] == 1
+
+
+def test_pool_release_from_gc_during_acquire(pool, monkeypatch):
+    # a leased page in a reference cycle, only freed by the cyclic collector
+    page = PyPDFium2Utils.load_page_from_dict(
+        {"filename": "data/pdfs/tiny.pdf", "page_no": 0}
+    )
+    page._cycle = page
+    del page
+
+    from gmft.pdf_bindings import pdfium
+
+    class CollectingDocument(PyPDFium2Document):
+        def __init__(self, filename):
+            # the finalizer of the page runs while acquire holds the lock
+            gc.collect()
+            super().__init__(filename)
+
+    monkeypatch.setattr(pdfium, "PyPDFium2Document", CollectingDocument)
+    result = []
+    thread = threading.Thread(
+        target=lambda: result.append(pool.acquire("data/pdfs/1.pdf")), daemon=True
+    )
+    thread.start()
+    thread.join(timeout=30)
+    assert not thread.is_alive(), "deadlock"
+    assert pool.stats["borrowed"] == 1
+    pool.release(result[0])
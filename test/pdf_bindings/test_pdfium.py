@@ -1,6 +1,7 @@
 # test to_dict and from_dict
 
 
+import numpy as np
 import pytest
 import gmft
 from gmft.pdf_bindings import PyPDFium2Document
@@ -39,6 +40,19 @@ def test_pypdfium2_image(doc_tiny):
     assert img.height == 100
 
 
+def test_pypdfium2_array(doc_tiny):
+    page = doc_tiny.get_page(0)
+    for dpi, rect in [(72, None), (144, Rect((50.5, 50, 300, 150.3)))]:
+        arr = page.get_array(dpi=dpi, rect=rect)
+        assert arr.dtype == np.uint8
+        assert np.array_equal(arr, np.asarray(page.get_image(dpi=dpi, rect=rect)))
+
+    gray = page.get_array(dpi=100, mode="L")
+    assert gray.shape == (1100, 850)
+    with pytest.raises(ValueError):
+        page.get_array(mode="CMYK")
+
+
 def test_pypdfium2_positions(doc_tiny):
     page = doc_tiny.get_page(0)
 
@@ -63,3 +77,75 @@ def test_pypdfium2_positions(doc_tiny):
             assert abs(ref - pos) < EPS, (
                 f"Different positions: expected {ref}, got {pos}"
             )
+
+
+@pytest.mark.parametrize("filename", ["tiny.pdf", "1.pdf", "5.pdf", "8.pdf"])
+def test_pypdfium2_bulk_words_match_per_char(filename):
+    bulk = PyPDFium2Document(f"data/pdfs/{filename}")
+    per_char = PyPDFium2Document(f"data/pdfs/{filename}", word_extraction="per_char")
+    try:
+        for page_bulk, page_per_char in zip(bulk, per_char):
+            assert list(page_bulk._get_positions_and_text_and_breaks()) == list(
+                page_per_char._get_positions_and_text_and_breaks()
+            )
+    finally:
+        bulk.close()
+        per_char.close()
+
+
+@pytest.mark.parametrize("render_cache_bytes", [0, 64 * 2**20])
+@pytest.mark.parametrize("workers", [1, 3])
+def test_pypdfium2_iter_pages(workers, render_cache_bytes):
+    serial = PyPDFium2Document("data/pdfs/1.pdf")
+    expected = [
+        list(page.get_word_array().iter_positions_and_text()) for page in serial
+    ]
+    serial.close()
+
+    doc = PyPDFium2Document("data/pdfs/1.pdf", render_cache_bytes=render_cache_bytes)
+    actual = []
+    for i, page in enumerate(doc.iter_pages(prefetch=3, workers=workers)):
+        assert page.page_number == i
+        # rendered ahead, whether or not the document caches images
+        misses = doc.render_cache.misses
+        page.get_image(dpi=72)
+        assert doc.render_cache.misses == misses
+        actual.append(list(page.get_word_array().iter_positions_and_text()))
+    assert actual == expected
+
+    # stopping early
+    for page in doc.iter_pages(prefetch=2):
+        break
+    doc.close()
+
+
+def test_pypdfium2_open_from_memory():
+    with open("data/pdfs/tiny.pdf", "rb") as f:
+        data = f.read()
+    reference = PyPDFium2Document("data/pdfs/tiny.pdf")
+    expected = list(reference.get_page(0).get_positions_and_text())
+    reference.close()
+
+    docs = [
+        PyPDFium2Document.from_bytes(data),
+        PyPDFium2Document.from_bytes(memoryview(data)),
+        PyPDFium2Document.from_bytes(bytearray(data), filename="tiny.pdf"),
+        PyPDFium2Document.from_mmap("data/pdfs/tiny.pdf"),
+    ]
+    f = open("data/pdfs/tiny.pdf", "rb")
+    docs.append(PyPDFium2Document.from_file(f))
+
+    for doc in docs:
+        page = doc.get_page(0)
+        assert list(page.get_positions_and_text()) == expected
+        assert page.get_image().size == (612, 792)
+        doc.close()
+        assert doc._is_closed()
+
+    assert docs[0].get_filename() is None
+    assert docs[2].get_filename() == "tiny.pdf"
+    assert docs[3].get_filename() == "data/pdfs/tiny.pdf"
+    assert docs[4].get_filename() == "data/pdfs/tiny.pdf"
+    # the caller's file stays open
+    assert not f.closed
+    f.close()
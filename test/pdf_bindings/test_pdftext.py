@@ -0,0 +1,55 @@
+import pytest
+
+pytest.importorskip("pdftext")
+
+from gmft.pdf_bindings.pdftext import PDFTextDocument
+import gmft.pdf_bindings.pdftext as pdftext_bindings
+
+
+def _all_words(doc):
+    return [list(page._get_positions_and_text_and_breaks()) for page in doc]
+
+
+def test_pdftext_chunked_words(monkeypatch):
+    reference = PDFTextDocument("data/pdfs/1.pdf", chunk_size=1)
+    expected = _all_words(reference)
+    reference.close()
+
+    calls = []
+    dictionary_output = pdftext_bindings.dictionary_output
+
+    def counting(*args, **kwargs):
+        calls.append(kwargs["page_range"])
+        return dictionary_output(*args, **kwargs)
+
+    monkeypatch.setattr(pdftext_bindings, "dictionary_output", counting)
+
+    doc = PDFTextDocument("data/pdfs/1.pdf", chunk_size=8)
+    assert _all_words(doc) == expected
+    n = len(doc)
+    assert len(calls) == -(-n // 8)
+    assert sorted(i for chunk in calls for i in chunk) == list(range(n))
+
+    # out of order access only extracts missing pages
+    calls.clear()
+    doc._word_arrays.clear()
+    doc.get_page(n - 2).get_word_array()
+    doc.load_words()
+    assert calls[0] == [n - 2, n - 1]
+    assert sorted(i for chunk in calls for i in chunk) == list(range(n))
+    doc.close()
+
+
+def test_pdftext_ruling_lines():
+    from gmft.detectors.prefilter import RulingLinePrefilter
+    from gmft.pdf_bindings.pdfium import PyPDFium2Document
+
+    reference = PyPDFium2Document("data/pdfs/tatr.pdf")
+    doc = PDFTextDocument("data/pdfs/tatr.pdf")
+    for n in [2, 3]:
+        assert doc[n].get_path_sizes() == reference[n].get_path_sizes()
+    # the same pdfium page, so the same decisions
+    assert RulingLinePrefilter().check(doc[3])
+    assert not RulingLinePrefilter().check(doc[2])
+    doc.close()
+    reference.close()
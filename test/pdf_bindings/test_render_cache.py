@@ -0,0 +1,93 @@
+import numpy as np
+import pytest
+
+from gmft.base import Rect
+from gmft.pdf_bindings import PyPDFium2Document, RenderCache
+from gmft.pdf_bindings.pdfium import _render_pdfium
+
+
+@pytest.fixture
+def tiny_doc():
+    doc = PyPDFium2Document("data/pdfs/tiny.pdf", render_cache_bytes=64 * 2**20)
+    yield doc
+    doc.close()
+
+
+def _direct(page, dpi, rect=None):
+    bbox = None if rect is None else rect.bbox
+    return _render_pdfium(page.page, page.width, page.height, dpi, bbox)
+
+
+def test_render_cache_exact_hits(tiny_doc):
+    page = tiny_doc.get_page(0)
+    cache = tiny_doc.render_cache
+    rect = Rect((10, 20, 200, 120))
+
+    first = page.get_image(dpi=144, rect=rect)
+    second = page.get_image(dpi=144, rect=rect)
+    assert cache.stats["misses"] == 1
+    assert cache.stats["hits"] == 1
+    assert np.array_equal(np.asarray(first), np.asarray(second))
+    assert np.array_equal(np.asarray(second), np.asarray(_direct(page, 144, rect)))
+
+    # returned images share the cached pixels, and are copied when modified
+    second.paste((255, 0, 0), (0, 0, 10, 10))
+    third = page.get_image(dpi=144, rect=rect)
+    assert np.array_equal(np.asarray(third), np.asarray(first))
+    assert not np.array_equal(np.asarray(second), np.asarray(first))
+    with pytest.raises(ValueError):
+        third.load()[0, 0] = (255, 0, 0)
+
+
+def test_render_cache_budget_evicts(tiny_doc):
+    page = tiny_doc.get_page(0)
+    full = page.get_image(dpi=72)
+    # room for about one full page at 72 dpi
+    tiny_doc.render_cache = cache = RenderCache(
+        max_bytes=full.width * full.height * 3 + 10
+    )
+    page.get_image(dpi=72)
+    page.get_image(dpi=72, rect=Rect((0, 0, 50, 50)))
+    assert cache.stats["evictions"] == 1
+    assert cache.nbytes <= cache.max_bytes
+    page.get_image(dpi=144)  # too large to be cached
+    assert len(cache) == 1
+
+
+def test_render_cache_disabled():
+    doc = PyPDFium2Document("data/pdfs/tiny.pdf", render_cache_bytes=0)
+    page = doc.get_page(0)
+    page.get_image()
+    page.get_image()
+    assert doc.render_cache.stats["misses"] == 2
+    assert len(doc.render_cache) == 0
+    doc.close()
+
+
+def test_render_cache_derive(tiny_doc):
+    page = tiny_doc.get_page(0)
+    cache = tiny_doc.render_cache
+    cache.derive = True
+    page.get_image(dpi=144)
+    rect = Rect((10.3, 20.7, 200.2, 120.1))
+
+    # same dpi: cropped from the full page
+    cropped = page.get_image(dpi=144, rect=rect)
+    direct = _direct(page, 144, rect)
+    assert cropped.size == direct.size
+    # lower dpi: downscaled
+    small = page.get_image(dpi=72, rect=rect)
+    assert small.size == _direct(page, 72, rect).size
+    full = page.get_image(dpi=100)
+    assert full.size == _direct(page, 100).size
+
+    assert cache.stats["derived"] == 3
+    assert cache.stats["misses"] == 1
+
+    # antialiasing differs slightly from a direct render
+    diff = np.abs(np.asarray(cropped, dtype=int) - np.asarray(direct, dtype=int))
+    assert (diff > 0).mean() < 0.05
+
+    # regions beyond the cached image are rendered
+    page.get_image(dpi=144, rect=Rect((-10, -10, 100, 100)))
+    assert cache.stats["misses"] == 2
@@ -0,0 +1,83 @@
+import numpy as np
+
+from gmft.pdf_bindings import WordArray
+
+
+def test_word_array_roundtrip():
+    words = [
+        (1.0, 2.0, 3.0, 4.0, "Hello", 0, 0, 0),
+        (5.0, 2.0, 9.5, 4.0, "world", 0, 0, 1),
+        (1.0, 12.0, 3.25, 14.0, "", 0, 1, 0),
+        (1.0, 22.0, 3.0, 24.0, "bye", 1, 0, 0),
+    ]
+    arr = WordArray.from_tuples(words)
+    assert len(arr) == 4
+    assert arr.bboxes.dtype == np.float32
+    assert arr.words() == ["Hello", "world", "", "bye"]
+    assert arr.word(1) == "world"
+    assert list(arr.iter_positions_and_text_and_breaks()) == words
+    assert list(arr.iter_positions_and_text()) == [w[:5] for w in words]
+
+
+def test_word_array_take():
+    words = [
+        (1.0, 2.0, 3.0, 4.0, "a"),
+        (5.0, 2.0, 9.0, 4.0, "bb"),
+        (1.0, 12.0, 3.0, 14.0, "ccc"),
+    ]
+    arr = WordArray.from_tuples(words)
+    subset = arr.take(arr.x0 > 2)
+    assert list(subset.iter_positions_and_text()) == [words[1]]
+    subset = arr.take(np.array([2, 0]))
+    assert subset.words() == ["ccc", "a"]
+
+    assert len(WordArray.empty()) == 0
+    assert list(WordArray.from_tuples([]).iter_positions_and_text()) == []
+
+
+def test_page_word_array(doc_tiny):
+    page = doc_tiny[0]
+    arr = page.get_word_array()
+    assert arr is page.get_word_array()  # cached
+    assert list(arr.iter_positions_and_text()) == list(page.get_positions_and_text())
+    assert arr.words()[:2] == ["Simple", "document"]
+
+
+def test_word_index_matches_brute_force(doc_pubt):
+    import random
+
+    from gmft.base import Rect
+
+    random.seed(0)
+    for page in doc_pubt:
+        words = list(page.get_positions_and_text())
+        index = page.get_word_index()
+        assert index is page.get_word_index()  # cached
+        for _ in range(20):
+            x0 = random.uniform(-50, 600)
+            y0 = random.uniform(-50, 800)
+            bbox = (x0, y0, x0 + random.uniform(0, 300), y0 + random.uniform(0, 300))
+            for outside in (False, True):
+                expected = [
+                    i
+                    for i, w in enumerate(words)
+                    if Rect(w[:4]).is_intersecting(bbox) != outside
+                ]
+                assert index.query(bbox, outside=outside).tolist() == expected
+
+
+def test_word_index_tall_and_degenerate_words():
+    from gmft.pdf_bindings import WordIndex
+
+    words = WordArray.from_tuples(
+        [
+            (0, 0, 10, 10, "a"),
+            (0, 0, 10, 500, "tall"),
+            (20, 20, 20, 30, "flat"),
+            (float("nan"), 0, 10, 10, "nan"),
+        ]
+    )
+    index = WordIndex(words)
+    assert index.query((0, 400, 100, 410)).tolist() == [1]
+    assert index.query((0, 5, 100, 25)).tolist() == [0, 1]
+    assert index.query((0, 5, 100, 25), outside=True).tolist() == [2, 3]
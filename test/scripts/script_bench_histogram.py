@@ -0,0 +1,48 @@
+"""
+Compare building an IntervalHistogram by appending intervals one at a time,
+and in bulk with IntervalHistogram.from_intervals, from 100 to 100k intervals.
+
+The intervals mimic words on a page: random starts, with lengths of a few word widths.
+Appending is quadratic, so it is skipped above --max-append intervals.
+
+Usage: python -m test.scripts.script_bench_histogram [--max-append 10000]
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from gmft.algorithm.histogram import IntervalHistogram
+
+
+def bench_histogram(sizes=(100, 1_000, 10_000, 100_000), max_append=10_000):
+    rng = np.random.default_rng(0)
+    print(f"{'intervals':>10}{'key points':>12}{'append (s)':>12}{'bulk (s)':>10}")
+    for n in sizes:
+        starts = rng.uniform(0, 600, n).round(2)
+        ends = (starts + rng.uniform(5, 60, n)).round(2)
+
+        start = time.perf_counter()
+        bulk = IntervalHistogram.from_intervals(starts, ends)
+        bulk_time = time.perf_counter() - start
+
+        append_time = float("nan")
+        if n <= max_append:
+            start = time.perf_counter()
+            appended = IntervalHistogram()
+            for interval in zip(starts.tolist(), ends.tolist()):
+                appended.append(interval)
+            append_time = time.perf_counter() - start
+            if appended.sorted_points != bulk.sorted_points:
+                raise AssertionError(f"Mismatch with {n} intervals")
+        print(
+            f"{n:>10}{len(bulk.sorted_points):>12}{append_time:>12.4f}{bulk_time:>10.4f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-append", type=int, default=10_000)
+    args = parser.parse_args()
+    bench_histogram(max_append=args.max_append)
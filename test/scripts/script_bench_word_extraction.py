@@ -0,0 +1,52 @@
+"""
+Compare the bulk and per-char word extraction of PyPDFium2Page on data/pdfs/*.pdf.
+
+Usage: python -m test.scripts.script_bench_word_extraction
+"""
+
+import glob
+import time
+
+import pypdfium2 as pdfium
+
+from gmft.pdf_bindings.pdfium import _extract_words_bulk, _extract_words_per_char
+
+
+def bench_word_extraction(pattern="data/pdfs/*.pdf", repeat=3):
+    total_per_char = 0.0
+    total_bulk = 0.0
+    print(f"{'file':<24}{'pages':>6}{'words':>8}{'per_char (s)':>14}{'bulk (s)':>10}")
+    for filename in sorted(glob.glob(pattern)):
+        doc = pdfium.PdfDocument(filename)
+        n_words = 0
+        file_per_char = 0.0
+        file_bulk = 0.0
+        for page in doc:
+            text_page = page.get_textpage()
+            height = page.get_height()
+            for _ in range(repeat):
+                start = time.perf_counter()
+                expected = _extract_words_per_char(text_page, height)
+                file_per_char += time.perf_counter() - start
+
+                start = time.perf_counter()
+                actual = _extract_words_bulk(text_page, height)
+                file_bulk += time.perf_counter() - start
+            if actual != expected:
+                raise AssertionError(f"Mismatch on {filename} page {page}")
+            n_words += len(actual)
+        print(
+            f"{filename:<24}{len(doc):>6}{n_words:>8}"
+            f"{file_per_char / repeat:>14.3f}{file_bulk / repeat:>10.3f}"
+        )
+        total_per_char += file_per_char / repeat
+        total_bulk += file_bulk / repeat
+        doc.close()
+    print(
+        f"total: per_char {total_per_char:.3f}s, bulk {total_bulk:.3f}s "
+        f"({total_per_char / total_bulk:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    bench_word_extraction()
@@ -0,0 +1,123 @@
+"""
+Profiling report of the pipeline profiles (see gmft.profiles) on a set of pdfs.
+
+Each profile detects the tables of every pdf (with its prefilter, dpi, model input size, quantization
+and batch size) and formats them. The tables are compared against the "accurate" run:
+- pages/s: pages per second over the whole pipeline (models are loaded beforehand)
+- table recall: fraction of the accurate run's tables which the profile detects, with IoU >= 0.9
+- df agreement: fraction of those tables whose df() is identical to the accurate run's
+
+Usage: python -m test.scripts.script_profile_report [pdfs ...] [--profiles fast balanced] [--formatter tatr|ditr]
+"""
+
+import argparse
+import glob
+import time
+
+from test.scripts.script_quantization_regression import _csv
+
+
+def _iou(a, b) -> float:
+    x0, y0 = max(a[0], b[0]), max(a[1], b[1])
+    x1, y1 = min(a[2], b[2]), min(a[3], b[3])
+    inter = max(x1 - x0, 0) * max(y1 - y0, 0)
+    union = (a[2] - a[0]) * (a[3] - a[1]) + (b[2] - b[0]) * (b[3] - b[1]) - inter
+    return inter / union if union > 0 else 0
+
+
+def _match(reference: list, actual: list, iou_threshold: float = 0.9) -> list:
+    """
+    For each reference table, the actual table on the same page and with the same label
+    which overlaps it most with IoU >= iou_threshold, or None.
+    """
+    matches = []
+    for ref in reference:
+        candidates = [
+            (_iou(ref.bbox, act.bbox), i)
+            for i, act in enumerate(actual)
+            if act.page.page_number == ref.page.page_number and act.label == ref.label
+        ]
+        best = max(candidates, default=(0, None))
+        matches.append(best[1] if best[0] >= iou_threshold else None)
+    return matches
+
+
+def run_profile(profile, pdfs, formatter_name="tatr", device="cpu"):
+    """
+    :return: (seconds, pages, {pdf: [(CroppedTable, csv)]})
+    """
+    from gmft.impl.tatr.config import TATRDetectorConfig, TATRFormatConfig
+    from gmft.presets import ingest_pdf
+
+    if formatter_name == "ditr":
+        from gmft.impl.ditr.config import DITRFormatConfig as FormatConfig
+    else:
+        FormatConfig = TATRFormatConfig
+
+    detector = profile.make_detector(TATRDetectorConfig(torch_device=device))
+    formatter = profile.make_formatter(FormatConfig(torch_device=device))
+
+    results = {}
+    pages = 0
+    start = time.perf_counter()
+    for pdf in pdfs:
+        tables, doc = ingest_pdf(pdf, profile=profile, detector=detector)
+        formatted = formatter.extract_batch(tables, batch_size=profile.batch_size)
+        csvs = []
+        for ft in formatted:
+            try:
+                csvs.append(_csv(ft))
+            except Exception as e:
+                csvs.append(f"error: {e!r}")
+        results[pdf] = list(zip(tables, csvs))
+        pages += len(doc)
+        doc.close()
+    return time.perf_counter() - start, pages, results
+
+
+def report(pdfs, profiles=("fast", "balanced", "accurate"), formatter_name="tatr"):
+    from gmft.profiles import get_profile
+
+    names = ["accurate"] + [name for name in profiles if name != "accurate"]
+    runs = {
+        name: run_profile(get_profile(name), pdfs, formatter_name) for name in names
+    }
+    _, _, reference = runs["accurate"]
+
+    print(
+        f"{'profile':<12}{'pages/s':>9}{'tables':>8}{'table recall':>14}{'df agreement':>14}"
+    )
+    for name in profiles:
+        seconds, pages, results = runs[name]
+        n_reference = n_matched = n_same = 0
+        for pdf, ref in reference.items():
+            actual = results[pdf]
+            matches = _match([t for t, _ in ref], [t for t, _ in actual])
+            n_reference += len(ref)
+            for (_, ref_csv), i in zip(ref, matches):
+                if i is not None:
+                    n_matched += 1
+                    n_same += actual[i][1] == ref_csv
+        recall = n_matched / n_reference if n_reference else 1.0
+        agreement = n_same / n_matched if n_matched else 1.0
+        n_tables = sum(len(tables) for tables in results.values())
+        print(
+            f"{name:<12}{pages / seconds:>9.2f}{n_tables:>8}"
+            f"{recall:>14.3f}{agreement:>14.3f}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("pdfs", nargs="*")
+    parser.add_argument(
+        "--profiles", nargs="+", default=["fast", "balanced", "accurate"]
+    )
+    parser.add_argument("--formatter", choices=["tatr", "ditr"], default="tatr")
+    args = parser.parse_args()
+
+    report(
+        args.pdfs or sorted(glob.glob("data/pdfs/*.pdf")),
+        args.profiles,
+        args.formatter,
+    )
@@ -0,0 +1,167 @@
+"""
+Compare quantized and float models, on the reference tables in data/test/references.
+
+For each quantization mode, the tables in cropped_tables.json are formatted,
+and compared against the float ("none") run and the reference csvs:
+- box recall: fraction of the float run's boxes (predictions.tatr) which the quantized run
+  predicts with the same label and IoU >= 0.9
+- df == float / df == reference: fraction of tables whose df() is identical
+- time per table
+
+The detector is compared on the pages of data/pdfs/*.pdf in the same way.
+
+Usage: python -m test.scripts.script_quantization_regression [--formatter tatr|ditr] [--modes none dynamic-int8 bf16]
+"""
+
+import argparse
+import glob
+import json
+import os
+import time
+
+import numpy as np
+
+REFERENCES = "data/test/references"
+
+
+def _box_recall(reference: dict, actual: dict, iou_threshold: float = 0.9) -> float:
+    """
+    Fraction of reference boxes matched by an actual box of the same label, with IoU >= iou_threshold.
+    Both are dicts of "boxes" and "labels", like predictions.tatr.
+    """
+    ref_boxes = np.asarray(reference["boxes"], dtype=float).reshape(-1, 4)
+    act_boxes = np.asarray(actual["boxes"], dtype=float).reshape(-1, 4)
+    if len(ref_boxes) == 0:
+        return 1.0
+    if len(act_boxes) == 0:
+        return 0.0
+    ref_labels = np.asarray(reference["labels"])
+    act_labels = np.asarray(actual["labels"])
+
+    x0 = np.maximum(ref_boxes[:, None, 0], act_boxes[None, :, 0])
+    y0 = np.maximum(ref_boxes[:, None, 1], act_boxes[None, :, 1])
+    x1 = np.minimum(ref_boxes[:, None, 2], act_boxes[None, :, 2])
+    y1 = np.minimum(ref_boxes[:, None, 3], act_boxes[None, :, 3])
+    inter = np.clip(x1 - x0, 0, None) * np.clip(y1 - y0, 0, None)
+    area_ref = (ref_boxes[:, 2] - ref_boxes[:, 0]) * (ref_boxes[:, 3] - ref_boxes[:, 1])
+    area_act = (act_boxes[:, 2] - act_boxes[:, 0]) * (act_boxes[:, 3] - act_boxes[:, 1])
+    union = area_ref[:, None] + area_act[None, :] - inter
+    iou = np.where(union > 0, inter / np.where(union > 0, union, 1), 0)
+    iou[ref_labels[:, None] != act_labels[None, :]] = 0
+    return float((iou.max(axis=1) >= iou_threshold).mean())
+
+
+def _load_tables():
+    from gmft.detectors.base import CroppedTable
+    from gmft.pdf_bindings.pdfium import PyPDFium2Document
+
+    with open(f"{REFERENCES}/cropped_tables.json", encoding="utf-8") as f:
+        cropped = json.load(f)
+    docs = {}
+    tables = {}
+    for name, d in cropped.items():
+        if not os.path.exists(d["filename"]):
+            continue  # not bundled
+        if d["filename"] not in docs:
+            docs[d["filename"]] = PyPDFium2Document(d["filename"])
+        tables[name] = CroppedTable.from_dict(d, docs[d["filename"]][d["page_no"]])
+    return tables, docs
+
+
+def _csv(ft) -> str:
+    return ft.df().to_csv(index=False, lineterminator="\n")
+
+
+def compare_formatters(formatter_name="tatr", modes=("none", "dynamic-int8", "bf16")):
+    if formatter_name == "tatr":
+        from gmft.formatters.tatr import TATRFormatter as Formatter
+        from gmft.impl.tatr.config import TATRFormatConfig as Config
+    else:
+        from gmft.formatters.ditr import DITRFormatter as Formatter
+        from gmft.impl.ditr.config import DITRFormatConfig as Config
+
+    tables, docs = _load_tables()
+    with open(f"{REFERENCES}/{formatter_name}_csvs.json", encoding="utf-8") as f:
+        reference_csvs = json.load(f)
+
+    baseline = None
+    print(
+        f"{'mode':<14}{'s/table':>9}{'box recall':>12}{'df == float':>13}{'df == ref':>11}"
+    )
+    for mode in modes:
+        formatter = Formatter(Config(torch_device="cpu", quantization=mode))
+        results = {}
+        csvs = {}
+        start = time.perf_counter()
+        for name, table in tables.items():
+            results[name] = formatter.extract(table)
+        elapsed = time.perf_counter() - start
+        for name, ft in results.items():
+            try:
+                csvs[name] = _csv(ft)
+            except Exception as e:
+                csvs[name] = f"error: {e!r}"
+        if baseline is None:
+            baseline = (results, csvs)
+
+        recall = np.mean(
+            [
+                _box_recall(baseline[0][name].predictions.tatr, ft.predictions.tatr)
+                for name, ft in results.items()
+            ]
+        )
+        same_as_float = np.mean([csvs[name] == baseline[1][name] for name in csvs])
+        with_ref = [name for name in csvs if name in reference_csvs]
+        same_as_ref = np.mean([csvs[n] == reference_csvs[n] for n in with_ref])
+        print(
+            f"{mode:<14}{elapsed / len(tables):>9.3f}{recall:>12.3f}"
+            f"{same_as_float:>13.3f}{same_as_ref:>11.3f}"
+        )
+    for doc in docs.values():
+        doc.close()
+
+
+def compare_detectors(modes=("none", "dynamic-int8", "bf16")):
+    from gmft.detectors.tatr import TATRDetector
+    from gmft.impl.tatr.config import TATRDetectorConfig
+    from gmft.pdf_bindings.pdfium import PyPDFium2Document
+
+    docs = [PyPDFium2Document(f) for f in sorted(glob.glob("data/pdfs/*.pdf"))]
+    pages = [page for doc in docs for page in doc]
+
+    baseline = None
+    print(f"{'mode':<14}{'s/page':>9}{'tables':>8}{'box recall':>12}")
+    for mode in modes:
+        detector = TATRDetector(
+            TATRDetectorConfig(torch_device="cpu", quantization=mode)
+        )
+        start = time.perf_counter()
+        results = [detector.extract(page) for page in pages]
+        elapsed = time.perf_counter() - start
+        as_predictions = [
+            {"boxes": [t.bbox for t in tables], "labels": [t.label for t in tables]}
+            for tables in results
+        ]
+        if baseline is None:
+            baseline = as_predictions
+        recall = np.mean(
+            [_box_recall(ref, act) for ref, act in zip(baseline, as_predictions)]
+        )
+        print(
+            f"{mode:<14}{elapsed / len(pages):>9.3f}"
+            f"{sum(len(t) for t in results):>8}{recall:>12.3f}"
+        )
+    for doc in docs:
+        doc.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--formatter", choices=["tatr", "ditr"], default="tatr")
+    parser.add_argument("--modes", nargs="+", default=["none", "dynamic-int8", "bf16"])
+    parser.add_argument("--skip-detector", action="store_true")
+    args = parser.parse_args()
+
+    if not args.skip_detector:
+        compare_detectors(args.modes)
+    compare_formatters(args.formatter, args.modes)
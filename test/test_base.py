@@ -0,0 +1,47 @@
+import numpy as np
+import pytest
+
+from gmft.base import BoxArray, Rect
+from gmft.algorithm.structure import _iob
+
+
+def test_rect_is_immutable():
+    rect = Rect((0, 0, 10, 10))
+    intersection = rect.intersect((5, 5, 20, 20))
+    assert intersection.bbox == (5, 5, 10, 10)
+    assert rect.bbox == (0, 0, 10, 10)
+    assert rect.intersect(Rect((20, 20, 30, 30))) is Rect.EMPTY
+    with pytest.raises(AttributeError):
+        rect.extra = 1
+
+
+def test_box_array_matches_rect():
+    rng = np.random.default_rng(0)
+    xy = rng.uniform(0, 100, (50, 2)).round()
+    wh = rng.uniform(-5, 40, (50, 2)).round()
+    boxes = BoxArray(np.concatenate([xy, xy + wh], axis=1))
+    others = BoxArray(boxes.boxes[::-1][:30])
+    rects = list(boxes)
+    assert len(boxes) == 50 and isinstance(boxes[0], Rect)
+    assert boxes.area.tolist() == [rect.area for rect in rects]
+
+    other = others[3]
+    assert boxes.is_intersecting(other).tolist() == [
+        rect.is_intersecting(other) for rect in rects
+    ]
+    assert boxes.intersect(other).boxes.tolist() == [
+        list(rect.intersect(other).bbox) for rect in rects
+    ]
+    assert boxes.iob(other).tolist() == pytest.approx(
+        [_iob(rect.bbox, other.bbox) for rect in rects]
+    )
+    assert boxes.ioa(other).tolist() == pytest.approx(
+        [_iob(other.bbox, rect.bbox) for rect in rects]
+    )
+
+    # all pairs
+    assert boxes.is_intersecting(others).shape == (50, 30)
+    assert boxes.iob(others)[:, 3].tolist() == boxes.iob(other).tolist()
+    assert np.array_equal(boxes.ioa(others), others.iob(boxes).T)
+    # elementwise
+    assert boxes[:30].intersect(others)[3].bbox == boxes[3].intersect(other).bbox
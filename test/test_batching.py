@@ -0,0 +1,19 @@
+import pytest
+
+from gmft.core.ml.batching import _aspect_ratio_batches
+
+
+def test_aspect_ratio_batches():
+    sizes = [(400, 100), (100, 400), (410, 100), (100, 390), (200, 200), (390, 100)]
+    batches = _aspect_ratio_batches(sizes, batch_size=2)
+    assert sorted(i for batch in batches for i in batch) == list(range(len(sizes)))
+    assert all(1 <= len(batch) <= 2 for batch in batches)
+    # wide and tall tables are never batched together
+    for batch in batches:
+        wide = [sizes[i][0] > sizes[i][1] for i in batch]
+        assert all(wide) or not any(wide)
+    assert [4] in batches
+
+    assert _aspect_ratio_batches([], batch_size=4) == []
+    with pytest.raises(ValueError):
+        _aspect_ratio_batches(sizes, batch_size=0)
@@ -1,8 +1,14 @@
 # test to_dict and from_dict
 
 
+import gc
+import pickle
+import weakref
+
+import numpy as np
 import pytest
 import gmft
+from gmft.base import Rect
 from gmft.pdf_bindings import PyPDFium2Document
 from gmft.detectors.base import CroppedTable, RotatedCroppedTable
 
@@ -173,8 +179,97 @@ def test_CroppedTable_angle(doc_tiny):
         _ = CroppedTable(page, (1, 2, 3, 4), angle=42)
 
 
+def test_CroppedTable_word_cache(doc_tiny):
+    page = doc_tiny[0]
+    table = CroppedTable(page, (10, 12, 300, 150))
+    words, positions = table._get_table_words()
+    assert positions and table._get_table_words()[0] is words
+    assert list(table.text_positions(remove_table_offset=True)) == positions
+
+    def uncached():
+        table._word_cache = None
+        return list(table.text_positions(remove_table_offset=True))
+
+    # rebuilt when the rect or the angle change
+    table.rect = Rect((10, 12, 300, 100))
+    rebuilt = list(table.text_positions(remove_table_offset=True))
+    assert table._get_table_words()[0] is not words
+    assert rebuilt == uncached() and rebuilt != positions
+    table.angle = 90
+    rotated = list(table.text_positions(remove_table_offset=True))
+    assert rotated == uncached() and rotated != rebuilt
+
+    # the cache does not keep the words of the page alive, and is not pickled
+    page_words = weakref.ref(page.get_word_array())
+    words = table._get_table_words()[0]
+    page._word_array = page._word_index = None
+    gc.collect()
+    assert page_words() is None
+    assert table._get_table_words()[0] is not words
+    restored = pickle.loads(pickle.dumps(table))
+    assert restored._word_cache is None
+    assert list(restored.text_positions(remove_table_offset=True)) == rotated
+    restored.page.close_document()
+
+
 # TODO: ct.image() with margin='auto',
 # ct.image() with rotated image,
 # text_positions with angle==[180,270]
 # ct.visualize(),
 # ct.from_image_only()
+
+
+def test_CroppedTable_image_from_page_image(doc_tiny):
+    page = doc_tiny[0]
+    page_image = np.asarray(page.get_image(dpi=144))
+    for table in [
+        CroppedTable(page, (76.6, 162.8, 441.0, 248.7)),
+        RotatedCroppedTable(page, (76.6, 162.8, 441.0, 248.7), 0.9, 90),
+    ]:
+        for margin in [None, "auto"]:
+            direct = np.asarray(table.image(dpi=144, padding="auto", margin=margin))
+            cropped = np.asarray(
+                table.image(
+                    dpi=144, padding="auto", margin=margin, page_image=page_image
+                )
+            )
+            assert cropped.shape == direct.shape
+            # only antialiasing may differ
+            assert (cropped != direct).any(axis=2).mean() < 0.01
+
+    # cut from a rendering of just a region
+    table = CroppedTable(page, (76.6, 162.8, 441.0, 248.7))
+    region = (50, 150, 500, 300)
+    region_image = np.asarray(page.get_image(dpi=144, rect=Rect(region)))
+    direct = np.asarray(table.image(dpi=144, padding="auto", margin="auto"))
+    cropped = np.asarray(
+        table.image(
+            dpi=144,
+            padding="auto",
+            margin="auto",
+            page_image=region_image,
+            page_image_bbox=region,
+        )
+    )
+    assert cropped.shape == direct.shape
+    assert (cropped != direct).any(axis=2).mean() < 0.01
+
+
+def test_CroppedTable_image_array(doc_tiny):
+    page = doc_tiny[0]
+    for angle in [0, 90, 180, 270]:
+        table = RotatedCroppedTable(page, (76.6, 162.8, 441.0, 248.7), 0.9, angle)
+        for padding in [None, "auto", (5, 10, 15, 20)]:
+            for margin in [None, "auto"]:
+                expected = np.asarray(
+                    table.image(dpi=144, padding=padding, margin=margin)
+                )
+                actual = table.image_array(dpi=144, padding=padding, margin=margin)
+                assert actual.dtype == np.uint8
+                assert np.array_equal(actual, expected)
+                # model input must not have negative strides
+                assert all(stride > 0 for stride in actual.strides)
+
+    table = CroppedTable(page, (76.6, 162.8, 441.0, 248.7))
+    gray = table.image_array(dpi=144, padding="auto", mode="L")
+    assert gray.shape == table.image_array(dpi=144, padding="auto").shape[:2]
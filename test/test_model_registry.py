@@ -0,0 +1,103 @@
+import threading
+import time
+
+import pytest
+
+from gmft.core.ml import _huggingface, registry
+from gmft.core.ml.registry import ModelRegistry
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    """Replace model loading with a slow stand-in, and record its calls."""
+    calls = []
+
+    def fake_load(model_path, **kwargs):
+        calls.append((model_path, kwargs))
+        time.sleep(0.05)
+        return object()
+
+    monkeypatch.setattr(_huggingface, "_load_tatr_model", fake_load)
+    monkeypatch.setattr(registry, "_registry", ModelRegistry())
+    return calls
+
+
+def test_registry_shares_models(loads):
+    reg = registry.get_model_registry()
+    model = reg.get_model("a/model", revision="no_timm")
+    assert reg.get_model("a/model", revision="no_timm") is model
+    assert len(loads) == 1
+    assert reg.stats["hits"] == 1
+
+    # any different setting is a different model
+    assert reg.get_model("a/model", revision="no_timm", device="cuda") is not model
+    assert reg.get_model("a/model", quantization="bf16") is not model
+    assert len(loads) == 3
+
+
+def test_registry_loads_once_across_threads(loads):
+    reg = registry.get_model_registry()
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(reg.get_model("a/model")))
+        for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert len(loads) == 1
+    assert len({id(m) for m in results}) == 1
+
+
+def test_registry_preload_and_evict(loads):
+    reg = registry.get_model_registry()
+    reg.preload("a/model")
+    reg.preload("b/model", device="cuda")
+    assert len(reg) == 2
+    model = reg.get_model("a/model")
+    assert len(loads) == 2
+
+    assert reg.evict("a/model") == 1
+    assert reg.get_model("a/model") is not model
+    assert len(loads) == 3
+
+    reg.clear()
+    assert len(reg) == 0
+
+
+def test_registry_register(loads):
+    reg = registry.get_model_registry()
+    model, processor = object(), object()
+    reg.register("my/model", model, image_processor=processor, revision="no_timm")
+    assert reg.get_model("my/model", revision="no_timm") is model
+    assert reg.get_image_processor("my/model") is processor
+    assert len(loads) == 0
+    # other settings are still loaded
+    assert reg.get_model("my/model") is not model
+    assert len(loads) == 1
+    assert reg.evict("my/model") == 3
+
+
+def test_detectors_share_weights(loads, monkeypatch):
+    import transformers
+
+    from gmft.detectors.tatr import TATRDetector
+    from gmft.formatters.tatr import TATRFormatter
+    from gmft.impl.tatr.config import TATRDetectorConfig, TATRFormatConfig
+
+    monkeypatch.setattr(
+        transformers.AutoImageProcessor,
+        "from_pretrained",
+        staticmethod(lambda path, **kwargs: object()),
+    )
+    config = TATRDetectorConfig(torch_device="cpu")
+    first, second = TATRDetector(config), TATRDetector(config)
+    assert first.detector is second.detector
+    assert first.image_processor is second.image_processor
+
+    formatter = TATRFormatter(TATRFormatConfig(torch_device="cpu"))
+    # both load microsoft/table-transformer-detection's image processor
+    assert formatter.image_processor is first.image_processor
+    assert formatter.structor is not first.detector
+    assert len(loads) == 2
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from gmft.algorithm.nms import non_maxima_suppression
+from gmft.algorithm.structure import _iob, _non_maxima_suppression
+from gmft.formatters.ditr import _non_maxima_suppression_t
+
+
+def _pop_nms(sorted_rows: list[dict], overlap_threshold=0.1):
+    # the list.pop implementation from the TATR authors' inference.py
+    i = 1
+    while i < len(sorted_rows):
+        prev = sorted_rows[i - 1]
+        cur = sorted_rows[i]
+        if _iob(prev["bbox"], cur["bbox"]) > overlap_threshold:
+            if prev["confidence"] > cur["confidence"]:
+                sorted_rows.pop(i)
+            else:
+                sorted_rows.pop(i - 1)
+        else:
+            i += 1
+
+
+def _random_rows(rng, n):
+    y0 = np.sort(rng.uniform(0, 500, n))
+    heights = rng.uniform(-1, 30, n)
+    x0 = rng.uniform(0, 10, n)
+    boxes = np.stack([x0, y0, x0 + 300, y0 + heights], axis=1).round()
+    # ties in confidence
+    scores = rng.choice([0.3, 0.5, 0.7, 0.9], n)
+    return [
+        {"bbox": box, "confidence": score}
+        for box, score in zip(boxes.tolist(), scores.tolist())
+    ]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_adjacent_matches_pop(seed):
+    rng = np.random.default_rng(seed)
+    rows = _random_rows(rng, rng.integers(0, 200))
+    expected = list(rows)
+    _pop_nms(expected)
+
+    actual = list(rows)
+    num_removed = _non_maxima_suppression(actual)
+    assert actual == expected
+    assert num_removed == len(rows) - len(expected)
+
+    tuples = [(*row["bbox"], row["confidence"]) for row in rows]
+    _non_maxima_suppression_t(tuples)
+    assert tuples == [(*row["bbox"], row["confidence"]) for row in expected]
+
+
+def test_pairwise():
+    boxes = [(0, 0, 10, 10), (0, 5, 10, 15), (0, 9, 10, 19), (0, 0, 10, 20)]
+    scores = [0.9, 0.5, 0.8, 0.1]
+    # adjacent: the second row is suppressed by the first, but the third is only compared with the first
+    assert non_maxima_suppression(boxes, scores, 0.1).tolist() == [0, 2]
+    # pairwise: the third row is suppressed by the first too, at a lower threshold
+    pairwise = non_maxima_suppression(boxes, scores, 0.1, method="pairwise")
+    assert pairwise.tolist() == [0, 2]
+    pairwise = non_maxima_suppression(boxes, scores, 0.05, method="pairwise")
+    assert pairwise.tolist() == [0]
+    # the overlap is relative to the area of the lower-confidence box
+    pairwise = non_maxima_suppression(boxes, scores, 0.6, method="pairwise")
+    assert pairwise.tolist() == [0, 1, 2, 3]
+    pairwise = non_maxima_suppression(boxes, [0.9, 0.5, 0.8, 0.95], 0.4, "pairwise")
+    assert pairwise.tolist() == [3]
+
+    assert non_maxima_suppression([], [], method="pairwise").tolist() == []
+    with pytest.raises(ValueError):
+        non_maxima_suppression(boxes, scores[:2])
+    with pytest.raises(ValueError):
+        non_maxima_suppression(boxes, scores, method="greedy")
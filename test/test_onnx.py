@@ -0,0 +1,39 @@
+import pytest
+import torch
+
+from gmft.core.ml._huggingface import _load_tatr_model
+from gmft.core.ml._onnx import _default_onnx_path, export_tatr_to_onnx
+
+onnxruntime = pytest.importorskip("onnxruntime")
+pytest.importorskip("onnx")
+
+
+def test_onnxruntime_backend_matches_torch(tiny_tatr_model, tmp_path):
+    path = export_tatr_to_onnx(
+        "tiny", str(tmp_path / "tiny.onnx"), model=tiny_tatr_model
+    )
+    assert not tiny_tatr_model.training
+    model = _load_tatr_model("tiny", backend="onnxruntime", onnx_path=path)
+
+    # a batch of two images of different size, padded with a mask
+    pixel_values = torch.rand(2, 3, 240, 320)
+    pixel_mask = torch.ones(2, 240, 320, dtype=torch.long)
+    pixel_mask[1, 200:, :] = 0
+    pixel_mask[1, :, 300:] = 0
+
+    outputs = model(pixel_values=pixel_values, pixel_mask=pixel_mask)
+    with torch.no_grad():
+        expected = tiny_tatr_model(pixel_values=pixel_values, pixel_mask=pixel_mask)
+    assert torch.allclose(outputs.logits, expected.logits, atol=1e-4)
+    assert torch.allclose(outputs.pred_boxes, expected.pred_boxes, atol=1e-4)
+
+
+def test_onnxruntime_backend_errors(tmp_path, monkeypatch):
+    monkeypatch.setenv("GMFT_ONNX_CACHE", str(tmp_path))
+    assert _default_onnx_path("microsoft/x", "no_timm") == str(
+        tmp_path / "microsoft--x@no_timm.onnx"
+    )
+    with pytest.raises(FileNotFoundError):
+        _load_tatr_model("microsoft/x", backend="onnxruntime")
+    with pytest.raises(ValueError):
+        _load_tatr_model("microsoft/x", backend="tensorflow")
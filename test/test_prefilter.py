@@ -0,0 +1,79 @@
+import logging
+
+from PIL import Image
+
+from gmft.detectors.prefilter import (
+    KeywordPrefilter,
+    RulingLinePrefilter,
+    WordAlignmentPrefilter,
+    builtin_prefilter,
+)
+from gmft.pdf_bindings.base import ImageOnlyPage
+from gmft.pdf_bindings.pdfium import PyPDFium2Document
+
+
+def _page(words):
+    return ImageOnlyPage(Image.new("RGB", (612, 792), "white"), words=words)
+
+
+def _prose(top=100, lines=30):
+    # single-column text: words separated by single spaces
+    words = []
+    for i in range(lines):
+        x = 72
+        for j in range(10):
+            width = 20 + (i * 7 + j * 13) % 25
+            words.append((x, top + 12 * i, x + width, top + 12 * i + 9, "word"))
+            x += width + 3
+    return words
+
+
+def _table(top=500, rows=8):
+    words = []
+    for i in range(rows):
+        for x in (72, 200, 300, 400):
+            words.append((x, top + 12 * i, x + 40, top + 12 * i + 9, "12.3"))
+    return words
+
+
+def test_word_alignment_prefilter():
+    prefilter = WordAlignmentPrefilter()
+    assert not prefilter.check(_page(_prose()))
+    decision = prefilter.check(_page(_prose() + _table()))
+    assert decision.keep and "aligned columns" in decision.reason
+    # too few words to tell
+    assert prefilter.check(_page(_prose(lines=1)))
+    # hidden text far off the page does not change the layout
+    hidden = [(1e9, 100, 1e9 + 40, 109, "hidden"), (-1e9, 200, -1e9 + 40, 209, "x")]
+    assert not prefilter.check(_page(_prose() + hidden))
+    assert prefilter.check(_page(_prose() + _table() + hidden))
+
+
+def test_ruling_line_prefilter_keeps_pages_without_paths():
+    decision = RulingLinePrefilter().check(_page(_prose()))
+    assert decision.keep and decision.reason == "no path objects to check"
+
+
+def test_prefilters_on_pdf(caplog):
+    doc = PyPDFium2Document("data/pdfs/tatr.pdf")
+    # page 3 has Table 1, page 2 is prose
+    assert RulingLinePrefilter().check(doc[3])
+    assert not RulingLinePrefilter().check(doc[2])
+    assert (
+        KeywordPrefilter([r"\btable \d+"]).check(doc[3]).reason == "matched 'Table 1'"
+    )
+    assert not KeywordPrefilter([r"\btable \d+"]).check(doc[2])
+
+    prefilter = builtin_prefilter()
+    with caplog.at_level(logging.INFO, logger="gmft.detectors.prefilter"):
+        pages = [page.page_number for page in doc.iter_pages(prefilter=prefilter)]
+    assert {3, 5, 6, 7} <= set(pages)
+    assert 2 not in pages
+    assert prefilter.stats == {"kept": len(pages), "skipped": len(doc) - len(pages)}
+    assert len(caplog.records) == len(doc)
+    assert "Skipped page 2" in caplog.text
+
+    assert [
+        page.page_number for page in doc.iter_pages(prefetch=0, prefilter=prefilter)
+    ] == pages
+    doc.close()
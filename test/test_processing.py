@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+import torch
+from PIL import Image
+
+from gmft.core.ml.processing import (
+    _predict,
+    _resized_size,
+    post_process_object_detection,
+    preprocess_images,
+)
+
+
+@pytest.fixture(scope="module")
+def hf_processor():
+    from transformers import DetrImageProcessor
+
+    # the settings of microsoft/table-transformer-detection
+    return DetrImageProcessor(size={"shortest_edge": 800, "longest_edge": 1333})
+
+
+@pytest.fixture(scope="module")
+def images():
+    rng = np.random.default_rng(0)
+    sizes = [(120, 300), (800, 600), (50, 1200), (613, 613)]
+    arrays = [rng.integers(0, 256, (h, w, 3), dtype=np.uint8) for h, w in sizes]
+    # a page rendering, as the detector sees it
+    arrays.append(Image.fromarray(rng.integers(0, 256, (792, 612, 3), dtype=np.uint8)))
+    return arrays
+
+
+def test_resized_size():
+    from transformers.models.detr.image_processing_detr import (
+        get_size_with_aspect_ratio,
+    )
+
+    for size in [(120, 300), (300, 120), (800, 600), (50, 1200), (800, 800), (1, 5)]:
+        assert _resized_size(*size) == get_size_with_aspect_ratio(size, 800, 1333)
+
+
+def test_preprocessing_matches_huggingface(hf_processor, images):
+    for batch in [images[:1], images[2:3], images]:
+        expected = hf_processor(batch, return_tensors="pt")
+        actual = preprocess_images(batch)
+        assert actual["pixel_values"].shape == expected["pixel_values"].shape
+        assert torch.equal(actual["pixel_mask"], expected["pixel_mask"])
+        assert torch.allclose(
+            actual["pixel_values"], expected["pixel_values"], atol=1e-5
+        )
+
+
+def test_post_processing_matches_huggingface(hf_processor, images, tiny_tatr_model):
+    with torch.no_grad():
+        outputs = tiny_tatr_model(**preprocess_images(images))
+    target_sizes = [(120, 300), (800, 600), (50, 1200), (613, 613), (792, 612)]
+    threshold = 0.15
+    expected = hf_processor.post_process_object_detection(
+        outputs, threshold=threshold, target_sizes=target_sizes
+    )
+    actual = post_process_object_detection(outputs, threshold, target_sizes)
+    assert sum(len(result["scores"]) for result in actual) > 0
+    for a, e in zip(actual, expected):
+        assert a["labels"] == e["labels"].tolist()
+        assert np.allclose(a["scores"], e["scores"].tolist())
+        assert np.allclose(
+            np.reshape(a["boxes"], (-1, 4)), e["boxes"].numpy(), atol=1e-3
+        )
+
+
+def test_predict_native_and_huggingface(hf_processor, images, tiny_tatr_model):
+    native = _predict(tiny_tatr_model, images, 0.15, preprocessing="native")
+    hf = _predict(
+        tiny_tatr_model,
+        images,
+        0.15,
+        preprocessing="huggingface",
+        image_processor=hf_processor,
+    )
+    for a, e in zip(native, hf):
+        assert a["labels"] == e["labels"]
+        assert np.allclose(a["scores"], e["scores"], atol=1e-4)
+
+    with pytest.raises(ValueError):
+        _predict(tiny_tatr_model, images, 0.15, preprocessing="opencv")
@@ -0,0 +1,57 @@
+import pytest
+
+from gmft.impl.ditr.config import DITRFormatConfig
+from gmft.impl.tatr.config import TATRDetectorConfig, TATRFormatConfig
+from gmft.pdf_bindings.pdfium import PyPDFium2Document
+from gmft.presets import ingest_pdf
+from gmft.profiles import get_profile
+
+
+def test_profiles():
+    accurate = get_profile("accurate")
+    assert accurate.detector_config() == TATRDetectorConfig()
+    assert accurate.formatter_config() == TATRFormatConfig()
+    assert accurate.make_prefilter() is None
+
+    fast = get_profile("fast")
+    assert fast.make_prefilter() is not None
+    config = fast.formatter_config(DITRFormatConfig(torch_device="cpu"))
+    assert isinstance(config, DITRFormatConfig)
+    assert config.model_input_size == {"shortest_edge": 600, "longest_edge": 1000}
+    assert config.quantization == "dynamic-int8"
+    # int8 is cpu only
+    config = fast.detector_config(TATRDetectorConfig(torch_device="cuda"))
+    assert config.quantization == "none" and config.preprocessing == "native"
+
+    assert get_profile(fast) is fast
+    with pytest.raises(ValueError):
+        get_profile("fastest")
+
+
+def test_detector_dpi(tiny_detector, fake_predict):
+    detector = tiny_detector(
+        TATRDetectorConfig(torch_device="cpu", preprocessing="native", dpi=144)
+    )
+    images = fake_predict(
+        lambda image: {"scores": [0.95], "labels": [0], "boxes": [[0, 0, 1224, 1584]]}
+    )
+    doc = PyPDFium2Document("data/pdfs/tatr.pdf")
+    (table,) = detector.extract(doc[0])
+    # rendered at 144 dpi, boxes in pdf units
+    assert images[0].size == (1224, 1584)
+    assert tuple(table.bbox) == pytest.approx((0, 0, 612, 792))
+    doc.close()
+
+
+def test_ingest_pdf_with_profile(tiny_detector):
+    profile = get_profile("balanced")
+    detector = tiny_detector(
+        profile.detector_config(
+            TATRDetectorConfig(torch_device="cpu", detector_base_threshold=0.0)
+        )
+    )
+    tables, doc = ingest_pdf("data/pdfs/tatr.pdf", profile=profile, detector=detector)
+    # pages without evidence of a table are skipped
+    pages = {table.page.page_number for table in tables}
+    assert 3 in pages and 2 not in pages
+    doc.close()
@@ -0,0 +1,30 @@
+import copy
+
+import pytest
+import torch
+
+from gmft.core.ml._quantization import _quantize_model
+
+
+@pytest.mark.parametrize("quantization", ["dynamic-int8", "bf16"])
+def test_quantized_model_outputs(tiny_tatr_model, quantization):
+    pixel_values = torch.rand(1, 3, 160, 240)
+    pixel_mask = torch.ones(1, 160, 240, dtype=torch.long)
+    model = _quantize_model(copy.deepcopy(tiny_tatr_model), quantization)
+    with torch.no_grad():
+        expected = tiny_tatr_model(pixel_values=pixel_values, pixel_mask=pixel_mask)
+        outputs = model(pixel_values=pixel_values, pixel_mask=pixel_mask)
+
+    assert outputs.logits.dtype == torch.float32
+    assert outputs.logits.shape == expected.logits.shape
+    assert torch.allclose(outputs.pred_boxes, expected.pred_boxes, atol=0.05)
+    if quantization == "dynamic-int8":
+        assert not any(type(m) is torch.nn.Linear for m in model.modules())
+
+
+def test_quantization_errors(tiny_tatr_model):
+    assert _quantize_model(tiny_tatr_model, "none") is tiny_tatr_model
+    with pytest.raises(ValueError):
+        _quantize_model(tiny_tatr_model, "int4")
+    with pytest.raises(ValueError):
+        _quantize_model(tiny_tatr_model, "dynamic-int8", device="cuda")